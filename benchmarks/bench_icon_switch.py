@@ -0,0 +1,118 @@
+"""Icon switching benchmark of tray_manager.
+
+Switch between 4 loaded icons on pystray's headless dummy backend, with and without the cache of the encoded icons, and write the result as JSON.
+The dummy backend doesn't draw anything, so the benchmark icon encodes the icons into temporary PNG files like pystray's gtk and appindicator backends do.
+
+Usage : python benchmarks/bench_icon_switch.py [--switches 2000] [--size 64] [--output icon_switch.json]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from pathlib import Path
+import tempfile
+import json
+import sys
+import os
+
+from headless import HeadlessIcon
+import pystray._dummy
+from PIL import Image
+
+from tray_manager.tray_manager import _cached_icon_class
+from tray_manager import TrayManager
+
+
+class EncodingIcon(HeadlessIcon):
+    """A headless pystray Icon encoding the icons into temporary files like pystray's gtk backend."""
+    def __init__(self, *args, **kwargs) -> None:
+        self._icon_path = None
+        super().__init__(*args, **kwargs)
+        return
+
+    def _update_icon(self) -> None:
+        self._remove_fs_icon()
+        self._update_fs_icon()
+        return
+
+    def _remove_fs_icon(self) -> None:
+        if self._icon_path:
+            os.unlink(self._icon_path)
+            self._icon_path = None
+        self._icon_valid = False
+        return
+
+    def _update_fs_icon(self) -> None:
+        self._icon_path = tempfile.mktemp()
+        with open(self._icon_path, "wb") as f:
+            self.icon.save(f, "PNG")
+        self._icon_valid = True
+        return
+
+
+def create_icons(size: int) -> list[Image.Image]:
+    """Create the 4 icons of a status indicator."""
+    return [Image.new("RGBA", (size, size), color) for color in ((46, 204, 113, 255), (241, 196, 15, 255), (231, 76, 60, 255), (149, 165, 166, 255))]
+
+
+def measure_icon(icon_class: type, icons: list[Image.Image], switches: int) -> float:
+    """Switch the icon of a visible pystray Icon and return the mean time of a switch in microseconds."""
+    icon = icon_class("benchmark", icons[0])
+    icon.visible = True
+
+    start = perf_counter()
+    for i in range(switches):
+        icon.icon = icons[i % len(icons)]
+    elapsed = perf_counter() - start
+
+    icon.visible = False
+    if hasattr(icon, "_icon_payloads"):
+        icon._icon_payloads.clear()
+    else:
+        icon._remove_fs_icon()
+    return elapsed / switches * 1e6
+
+
+def measure_set_icon(icons: list[Image.Image], switches: int) -> float:
+    """Switch the icon with TrayManager.set_icon and return the mean time of a switch in microseconds."""
+    pystray._dummy.Icon = EncodingIcon
+    tray = TrayManager("benchmark", run_in_separate_thread=True)
+    for i, icon in enumerate(icons):
+        tray.load_icon(icon, str(i))
+
+    start = perf_counter()
+    for i in range(switches):
+        tray.set_icon(str(i % len(icons)), show=False)
+    elapsed = perf_counter() - start
+
+    tray.kill()
+    return elapsed / switches * 1e6
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the time needed to switch the icon of a TrayManager.")
+    parser.add_argument("--switches", type=int, default=2000, help="The number of icon switches to measure.")
+    parser.add_argument("--size", type=int, default=64, help="The size of the icons in pixels.")
+    parser.add_argument("--output", type=Path, default=None, help="The file to write the JSON result to, if not specified, print it.")
+    args = parser.parse_args()
+
+    icons = create_icons(args.size)
+    uncached_us = measure_icon(EncodingIcon, icons, args.switches)
+    cached_us = measure_icon(_cached_icon_class(EncodingIcon), icons, args.switches)
+    result = {"benchmark": "icon_switch",
+              "python": sys.version.split()[0],
+              "switches": args.switches,
+              "icon_size": args.size,
+              "uncached_us": round(uncached_us, 2),
+              "cached_us": round(cached_us, 2),
+              "speedup": round(uncached_us / cached_us, 1),
+              "set_icon_us": round(measure_set_icon(icons, args.switches), 2)}
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
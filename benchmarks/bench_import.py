@@ -0,0 +1,73 @@
+"""Import time benchmark of tray_manager.
+
+Import tray_manager in new interpreters with `python -X importtime` and write the result as JSON.
+Exit with a non-zero code if pystray or PIL are imported by `import tray_manager`, or if the import takes longer than --max-us microseconds.
+
+Usage : python benchmarks/bench_import.py [--runs 5] [--max-us 50000] [--output import.json]
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+import subprocess
+import json
+import sys
+
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("pystray", "PIL") # The modules that mustn't be imported by "import tray_manager"
+
+
+def measure_import() -> dict:
+    """Import tray_manager in a new interpreter and return the import time of tray_manager and the heavy modules that were imported."""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import tray_manager"], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    cumulative_us = 0
+    heavy_modules = []
+    for line in process.stderr.splitlines(): # Lines look like "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, module = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue # The header line
+        
+        module = module.strip()
+        if module == "tray_manager":
+            cumulative_us = int(cumulative)
+        if module.split(".")[0] in HEAVY_MODULES:
+            heavy_modules.append(module)
+
+    return {"cumulative_us": cumulative_us, "heavy_modules": heavy_modules}
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the import time of tray_manager.")
+    parser.add_argument("--runs", type=int, default=5, help="The number of imports to measure, the fastest one is kept.")
+    parser.add_argument("--max-us", type=int, default=None, help="Fail if the import takes longer than this (in microseconds).")
+    parser.add_argument("--output", type=Path, default=None, help="The file to write the JSON result to, if not specified, print it.")
+    args = parser.parse_args()
+
+    runs = [measure_import() for _ in range(args.runs)]
+    result = {"benchmark": "import",
+              "python": sys.version.split()[0],
+              "runs_us": [run["cumulative_us"] for run in runs],
+              "best_us": min(run["cumulative_us"] for run in runs),
+              "heavy_modules": sorted({module for run in runs for module in run["heavy_modules"]})}
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if result["heavy_modules"]:
+        print(f"Importing tray_manager imported {', '.join(result['heavy_modules'])}", file=sys.stderr)
+        return 1
+    
+    if args.max_us is not None and result["best_us"] > args.max_us:
+        print(f"Importing tray_manager took {result['best_us']} us (Maximum : {args.max_us} us)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Memory benchmark of the items of tray_manager.
+
+Create many items of each type on a headless pystray backend and write the memory used per item as JSON (Measured with tracemalloc, including the pystray items they create).
+* detached : the items are only created.
+* in_menu : the items are added to the menu and the menu is built.
+
+Usage : python benchmarks/bench_memory.py [--items 10000] [--output memory.json]
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+import tracemalloc
+import json
+import sys
+import gc
+
+from headless import HeadlessIcon
+
+from tray_manager import TrayManager, Label, Button, CheckBox, Separator, Submenu
+
+
+ITEM_TYPES = {"label": lambda i: Label(f"Label {i}"),
+              "button": lambda i: Button(f"Button {i}", print),
+              "checkbox": lambda i: CheckBox(f"CheckBox {i}"),
+              "separator": lambda i: Separator(),
+              "submenu": lambda i: Submenu(f"Submenu {i}")}
+
+
+def measure(function) -> tuple[int, object]:
+    """Return the memory in bytes allocated by the function (and kept once it returns) and its result."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = function()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename")), result
+
+
+def bytes_per_item(count: int) -> dict[str, dict[str, int]]:
+    """Return the memory used by each item of each type, detached and in the menu."""
+    results = {}
+    for name, create in ITEM_TYPES.items():
+        allocated, items = measure(lambda: [create(i) for i in range(count)])
+        del items
+
+        tray = TrayManager("benchmark", run_in_separate_thread=True)
+        def fill() -> list:
+            items = [create(i) for i in range(count)]
+            with tray.batch():
+                tray.menu.extend(items)
+            tray.menu._create_menu()
+            return items
+        in_menu, items = measure(fill)
+        tray.kill()
+        del items
+
+        results[name] = {"detached_bytes": round(allocated / count), "in_menu_bytes": round(in_menu / count)}
+    return results
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the memory used by each type of item of tray_manager.")
+    parser.add_argument("--items", type=int, default=10000, help="The number of items of each type to create.")
+    parser.add_argument("--output", type=Path, default=None, help="The file to write the JSON result to, if not specified, print it.")
+    args = parser.parse_args()
+
+    result = {"benchmark": "memory",
+              "python": sys.version.split()[0],
+              "backend": HeadlessIcon.__name__,
+              "items": args.items,
+              "types": bytes_per_item(args.items)}
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
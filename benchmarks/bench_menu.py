@@ -0,0 +1,193 @@
+"""Menu benchmark suite of tray_manager.
+
+Run on a headless pystray backend (No display needed) and write the results as JSON so that they can be compared across versions :
+* build : the time of Menu._create_menu against the size and the depth of the menu, when every submenu is rebuilt (cold) and when nothing changed (warm).
+* edits : the number of Label.edit and CheckBox.set_status per second, each edit updating the menu.
+* add : the time of Menu.add against the size of the menu, with and without a batch.
+* clicks : the number of clicks per second dispatched through the pystray items to the callbacks of Buttons and CheckBoxes.
+* memory : the memory used by each type of item (See bench_memory.py).
+* import : the import time of tray_manager (See bench_import.py).
+
+Usage : python benchmarks/bench_menu.py [--quick] [--output menu.json]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from pathlib import Path
+import json
+import sys
+
+from headless import HeadlessIcon
+from bench_import import measure_import
+from bench_memory import bytes_per_item
+
+from tray_manager import TrayManager, Label, Button, CheckBox, Submenu
+
+
+def create_tray() -> TrayManager:
+    """Create a TrayManager running on the headless backend."""
+    return TrayManager("benchmark", run_in_separate_thread=True)
+
+
+def fill_menu(tray: TrayManager, size: int, depth: int) -> list[Label]:
+    """Add size labels to the menu, spread over depth nested levels of submenus, and return the labels."""
+    labels = []
+    per_level = max(1, size // depth)
+    container = tray.menu
+    with tray.batch():
+        for level in range(depth):
+            for i in range(per_level):
+                label = Label(f"Label {level}.{i}")
+                container.add(label)
+                labels.append(label)
+
+            if level < depth - 1:
+                submenu = Submenu(f"Submenu {level}")
+                container.add(submenu)
+                container = submenu
+    return labels
+
+
+def invalidate(container) -> None:
+    """Mark the menu and all of its submenus as changed so that they're all rebuilt."""
+    container._dirty = True
+    for item in container.get_items():
+        if isinstance(item, Submenu):
+            invalidate(item)
+    return
+
+
+def best_of(function, repeat: int) -> float:
+    """Run the function repeat times and return the best time in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def bench_build(sizes: list[int], depths: list[int], repeat: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        for depth in depths:
+            tray = create_tray()
+            fill_menu(tray, size, depth)
+
+            def cold() -> None:
+                invalidate(tray.menu)
+                tray.menu._create_menu()
+
+            results.append({"size": size,
+                            "depth": depth,
+                            "cold_us": round(best_of(cold, repeat) * 1e6, 2),
+                            "warm_us": round(best_of(tray.menu._create_menu, repeat) * 1e6, 2)})
+            tray.kill()
+    return results
+
+
+def bench_edits(size: int, edits: int) -> dict:
+    tray = create_tray()
+    labels = fill_menu(tray, size, 1)
+    checkbox = CheckBox("CheckBox")
+    tray.menu.add(checkbox)
+
+    start = perf_counter()
+    for i in range(edits):
+        labels[i % len(labels)].edit(text=f"Edit {i}")
+    label_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    for i in range(edits):
+        checkbox.set_status(i % 2 == 0)
+    checkbox_elapsed = perf_counter() - start
+
+    result = {"menu_size": size,
+              "edits": edits,
+              "label_edits_per_s": round(edits / label_elapsed),
+              "checkbox_set_status_per_s": round(edits / checkbox_elapsed),
+              "menu_updates": tray.tray.menu_updates}
+    tray.kill()
+    return result
+
+
+def bench_add(sizes: list[int]) -> list[dict]:
+    results = []
+    for size in sizes:
+        labels = [Label(f"Label {i}") for i in range(size)]
+        tray = create_tray()
+        start = perf_counter()
+        for label in labels:
+            tray.menu.add(label)
+        elapsed = perf_counter() - start
+        tray.kill()
+
+        labels = [Label(f"Label {i}") for i in range(size)]
+        tray = create_tray()
+        start = perf_counter()
+        with tray.batch():
+            for label in labels:
+                tray.menu.add(label)
+        batch_elapsed = perf_counter() - start
+        tray.kill()
+
+        results.append({"size": size,
+                        "add_us": round(elapsed / size * 1e6, 2),
+                        "batch_add_us": round(batch_elapsed / size * 1e6, 2)})
+    return results
+
+
+def bench_clicks(clicks: int) -> dict:
+    tray = create_tray()
+    counter = [0]
+    def callback() -> None:
+        counter[0] += 1
+
+    tray.menu.add(Button("Button", callback))
+    tray.menu.add(CheckBox("CheckBox", checked_callback=callback, unchecked_callback=callback))
+    button_item, checkbox_item = tray.menu._create_menu()
+
+    start = perf_counter()
+    for _ in range(clicks):
+        button_item(tray.tray) # Like the backend does when the item is clicked
+    button_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(clicks):
+        checkbox_item(tray.tray)
+    checkbox_elapsed = perf_counter() - start
+
+    result = {"clicks": clicks,
+              "button_clicks_per_s": round(clicks / button_elapsed),
+              "checkbox_clicks_per_s": round(clicks / checkbox_elapsed),
+              "callbacks_run": counter[0]}
+    tray.kill()
+    return result
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the performance of the menus of tray_manager on a headless backend.")
+    parser.add_argument("--quick", action="store_true", help="Use smaller menus and fewer repetitions.")
+    parser.add_argument("--output", type=Path, default=None, help="The file to write the JSON result to, if not specified, print it.")
+    args = parser.parse_args()
+
+    scale = 10 if args.quick else 1
+    result = {"benchmark": "menu",
+              "python": sys.version.split()[0],
+              "backend": HeadlessIcon.__name__,
+              "build": bench_build([10, 100] if args.quick else [10, 100, 1000], [1, 4, 16], 5 if args.quick else 20),
+              "edits": bench_edits(100, 5000 // scale),
+              "add": bench_add([100, 500] if args.quick else [100, 1000, 5000]),
+              "clicks": bench_clicks(10000 // scale),
+              "memory": bytes_per_item(2000 // scale),
+              "import_us": measure_import()["cumulative_us"]}
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""VirtualSubmenu benchmark of tray_manager.
+
+Add a VirtualSubmenu of --entries entries to the menu of a TrayManager running on the headless backend (Which walks every submenu on each menu update, like the win32, gtk and darwin backends), then show its next pages, and write the result as JSON.
+Exit with a non-zero code if more items than the pages shown were created from the entries, or if the backend reads more pystray items than one page.
+
+Usage : python benchmarks/bench_virtual.py [--entries 1000] [--page-size 10] [--pages 3] [--output virtual.json]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from pathlib import Path
+import json
+import sys
+
+from headless import HeadlessIcon, walk_menu
+
+from tray_manager import TrayManager, VirtualSubmenu
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the items created by a VirtualSubmenu against the pages shown.")
+    parser.add_argument("--entries", type=int, default=1000, help="The number of entries of the provider.")
+    parser.add_argument("--page-size", type=int, default=10, help="The number of entries per page.")
+    parser.add_argument("--pages", type=int, default=3, help="The number of pages shown (The first one and the next ones, shown by clicking on \"More…\").")
+    parser.add_argument("--output", type=Path, default=None, help="The file to write the JSON result to, if not specified, print it.")
+    args = parser.parse_args()
+
+    read = []
+    def provider():
+        for i in range(args.entries):
+            read.append(i)
+            yield f"Entry {i}"
+
+    tray = TrayManager("benchmark", run_in_separate_thread=True)
+    virtual = VirtualSubmenu("Entries", provider, page_size=args.page_size, ttl=None)
+
+    start = perf_counter()
+    tray.menu.add(virtual) # The menu update walks the menu and displays the first page
+    add_ms = (perf_counter() - start) * 1000
+
+    pages = [{"page": 0, "items": len(virtual.get_loaded_items()), "entries_read": len(read), "walked": walk_menu(tray.tray.menu)}]
+    next_ms = []
+    for page in range(1, args.pages):
+        more = virtual.item.submenu.items[-1] # The "More…" item
+        start = perf_counter()
+        more(tray.tray) # Click on it, the menu update displays the next page
+        next_ms.append((perf_counter() - start) * 1000)
+        pages.append({"page": page, "items": len(virtual.get_loaded_items()), "entries_read": len(read), "walked": walk_menu(tray.tray.menu)})
+    tray.kill()
+
+    result = {"benchmark": "virtual_submenu",
+              "python": sys.version.split()[0],
+              "entries": args.entries,
+              "page_size": args.page_size,
+              "add_ms": round(add_ms, 3),
+              "next_page_ms": [round(ms, 3) for ms in next_ms],
+              "pages": pages}
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    for page in pages:
+        shown = page["page"] + 1
+        if page["items"] > shown * args.page_size:
+            print(f"{page['items']} items were created after showing {shown} page(s) of {args.page_size} entries", file=sys.stderr)
+            return 1
+        if page["walked"] > args.page_size + 3: # The page, the "Previous…" and "More…" items and the VirtualSubmenu itself
+            print(f"The backend read {page['walked']} items to display a page of {args.page_size} entries", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Headless backend of the benchmarks.
+
+Replace pystray's dummy backend with an Icon that runs without a display, so the benchmarks run on plain Linux (e.g. in a CI).
+The menu is walked on every menu update, like the real backends do when they build the native menu.
+Import this module before tray_manager creates its first TrayManager.
+"""
+from threading import Event
+from pathlib import Path
+import sys
+import os
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ["PYSTRAY_BACKEND"] = "dummy"
+
+from pystray._base import Icon as BaseIcon
+import pystray._dummy
+
+
+class HeadlessIcon(BaseIcon):
+    """A pystray Icon that draws nothing and counts the menu updates."""
+    def __init__(self, *args, **kwargs) -> None:
+        self._stop_event: Event | None = None
+        self.menu_updates = 0
+        super().__init__(*args, **kwargs)
+        return
+
+    def _show(self) -> None:
+        return
+
+    def _hide(self) -> None:
+        return
+
+    def _update_icon(self) -> None:
+        self._icon_valid = True
+        return
+
+    def _update_title(self) -> None:
+        return
+
+    def _update_menu(self) -> None:
+        self.menu_updates += 1
+        if self.menu is not None:
+            walk_menu(self.menu)
+        return
+
+    def _run(self) -> None:
+        self._stop_event = Event()
+        self._mark_ready()
+        self._stop_event.wait()
+        return
+
+    def _stop(self) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
+        return
+
+    def _notify(self, message: str, title: str | None = None) -> None:
+        return
+
+    def _remove_notification(self) -> None:
+        return
+
+
+def walk_menu(menu) -> int:
+    """Read the properties of every item of a pystray Menu (Like a backend building the native menu) and return the number of items."""
+    count = 0
+    for item in menu.items:
+        item.text, item.enabled, item.checked, item.radio, item.default
+        count += 1
+        if item.submenu:
+            count += walk_menu(item.submenu)
+    return count
+
+
+pystray._dummy.Icon = HeadlessIcon
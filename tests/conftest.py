@@ -0,0 +1,38 @@
+"""Fixtures of the tests of tray_manager.
+
+The tests run on the headless backend of the benchmarks (pystray's dummy backend replaced with an Icon that needs no display), so they run on plain Linux (e.g. in a CI).
+"""
+from time import monotonic, sleep
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import headless # Must be imported before tray_manager creates its first TrayManager
+
+import pytest
+from PIL import Image
+
+from tray_manager import TrayManager
+
+
+@pytest.fixture
+def tray():
+    """A TrayManager running on the headless backend, killed after the test."""
+    tray = TrayManager("tests", run_in_separate_thread=True)
+    yield tray
+    tray.kill()
+
+
+def wait_until(predicate, timeout: float = 2) -> bool:
+    """Wait until the predicate returns True, return False if the timeout expired."""
+    deadline = monotonic() + timeout
+    while not predicate():
+        if monotonic() > deadline:
+            return False
+        sleep(0.005)
+    return True
+
+
+def make_frames(count: int) -> list[Image.Image]:
+    """Return count frames of different colors."""
+    return [Image.new("RGBA", (16, 16), (i * 10 % 256, 0, 0, 255)) for i in range(count)]
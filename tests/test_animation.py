@@ -0,0 +1,80 @@
+"""Tests of the animations : play, stop and the frames that can't be decoded."""
+from time import sleep
+
+from conftest import wait_until, make_frames
+
+
+def test_play_animation_shows_the_frames(tray):
+    frames = make_frames(4)
+    tray.load_animation(frames, "spinner")
+    tray.play_animation("spinner", fps=100)
+
+    assert wait_until(lambda: tray.get_animation_stats()["shown"] >= 8) # Looped at least once
+    stats = tray.get_animation_stats()
+    assert stats["playing"] is True
+    assert stats["failed"] == 0
+
+
+def test_stop_animation_keeps_the_current_frame(tray):
+    tray.load_animation(make_frames(4), "spinner")
+    tray.play_animation("spinner", fps=100)
+    assert wait_until(lambda: tray.get_animation_stats()["shown"] >= 2)
+
+    tray.stop_animation()
+    stats = tray.get_animation_stats()
+    icon = tray.tray.icon
+    sleep(0.05)
+    assert stats["playing"] is False
+    assert tray.get_animation_stats()["shown"] == stats["shown"]
+    assert tray.tray.icon is icon
+
+
+def test_animation_without_loop_stays_on_the_last_frame(tray):
+    frames = make_frames(3)
+    tray.load_animation(frames, "once")
+    tray.play_animation("once", fps=100, loop=False)
+
+    assert wait_until(lambda: not tray.get_animation_stats()["playing"])
+    assert tray.tray.icon.getpixel((0, 0)) == frames[-1].getpixel((0, 0))
+
+
+def test_set_icon_stops_the_animation(tray):
+    tray.load_animation(make_frames(4), "spinner")
+    tray.load_icon(make_frames(1)[0], "still")
+    tray.play_animation("spinner", fps=100)
+    assert wait_until(lambda: tray.get_animation_stats()["shown"] >= 1)
+
+    tray.set_icon("still")
+    assert tray.get_animation_stats()["playing"] is False
+
+
+def test_frame_that_fails_is_skipped(tray, tmp_path, capsys):
+    frames = make_frames(3)
+    path = tmp_path / "frame.png"
+    frames[1].save(path)
+    tray.load_animation([frames[0], str(path), frames[2]], "broken")
+    path.unlink() # The frame is only decoded when it's shown
+
+    tray.play_animation("broken", fps=100)
+    assert wait_until(lambda: tray.get_animation_stats()["failed"] >= 2)
+
+    stats = tray.get_animation_stats()
+    assert stats["playing"] is True # The animation goes on with the other frames
+    assert stats["shown"] >= 2
+    assert capsys.readouterr().err.count("FileNotFoundError") == 1 # Printed once per animation played
+
+
+def test_play_animation_after_a_failing_frame(tray, tmp_path):
+    frames = make_frames(2)
+    path = tmp_path / "frame.png"
+    frames[0].save(path)
+    tray.load_animation([str(path)], "broken")
+    tray.load_animation(frames, "working")
+    path.unlink()
+
+    tray.play_animation("broken", fps=100)
+    assert wait_until(lambda: tray.get_animation_stats()["failed"] >= 1)
+
+    shown = tray.get_animation_stats()["shown"]
+    tray.play_animation("working", fps=100)
+    assert wait_until(lambda: tray.get_animation_stats()["shown"] >= shown + 2)
@@ -0,0 +1,115 @@
+"""Tests of the AsyncTrayManager : its creation and its awaitable functions."""
+import asyncio
+import threading
+
+import pytest
+
+from tray_manager import AsyncTrayManager, Label, Button, Submenu
+
+from conftest import make_frames, wait_until
+
+
+def run(test):
+    """Run a coroutine function with a new AsyncTrayManager, killed after the test."""
+    async def main():
+        tray = await AsyncTrayManager.create("tests")
+        try:
+            await test(tray)
+        finally:
+            tray.kill()
+    asyncio.run(main())
+
+
+def test_create_does_not_block_the_loop():
+    async def main():
+        ticks = 0
+        async def count():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        counter = asyncio.create_task(count())
+        await asyncio.sleep(0)
+        tray = await AsyncTrayManager.create("tests")
+        counter.cancel()
+        try:
+            assert tray.ready.done()
+            assert tray.wait_ready(0)
+            assert ticks > 1 # The loop kept running while the icon was created
+        finally:
+            tray.kill()
+    asyncio.run(main())
+
+
+def test_kill_before_ready_stops_the_loop():
+    async def main():
+        threads = set(threading.enumerate())
+        tray = AsyncTrayManager("tests") # Doesn't wait for the icon
+        tray.kill()
+        assert wait_until(lambda: not any(thread.is_alive() for thread in set(threading.enumerate()) - threads))
+    asyncio.run(main())
+
+
+def test_changes_of_an_iteration_update_the_menu_once():
+    async def test(tray):
+        before = tray.get_update_stats()["performed"]
+        submenu = Submenu("Submenu")
+        await asyncio.gather(tray.add(Label("A")),
+                             tray.add(Label("B")),
+                             tray.add(submenu),
+                             tray.add(Label("C"), container=submenu))
+        assert tray.get_update_stats()["performed"] == before + 1
+        assert [item.text for item in tray.tray.menu.items] == ["A", "B", "Submenu"]
+
+        await tray.edit(submenu, text="Edited")
+        assert tray.get_update_stats()["performed"] == before + 2
+        assert tray.tray.menu.items[2].text == "Edited"
+    run(test)
+
+
+def test_only_the_last_icon_of_an_iteration_is_set():
+    async def test(tray):
+        frames = make_frames(3)
+        for i, frame in enumerate(frames):
+            tray.load_icon(frame, f"icon {i}")
+
+        metrics = tray.enable_metrics()
+        await asyncio.gather(*(tray.set_icon(f"icon {i}") for i in range(3)))
+        assert metrics.stats()["icons"]["count"] == 1
+        assert tray.tray.icon.getpixel((0, 0)) == frames[2].getpixel((0, 0))
+    run(test)
+
+
+def test_set_progress_is_awaitable():
+    async def test(tray):
+        tray.load_progress_icon("progress", steps=5)
+        await tray.set_progress("progress", 100)
+        assert tray.tray.icon is tray._icons.get("progress:4")
+    run(test)
+
+
+def test_set_icon_raises_in_the_caller(tmp_path):
+    async def test(tray):
+        path = tmp_path / "icon.png"
+        make_frames(1)[0].save(path)
+        tray.load_icon(str(path), "removed")
+        path.unlink() # The icon is only decoded when it's set
+
+        with pytest.raises(FileNotFoundError):
+            await tray.set_icon("removed")
+    run(test)
+
+
+def test_coroutine_callbacks_run_on_the_loop():
+    async def test(tray):
+        loop = asyncio.get_running_loop()
+        clicked = loop.create_future()
+        async def callback():
+            clicked.set_result(asyncio.get_running_loop())
+
+        button = Button("Button", callback)
+        await tray.add(button)
+        button.click()
+        assert await asyncio.wait_for(clicked, 2) is loop
+    run(test)
@@ -0,0 +1,103 @@
+"""Tests of the Scheduler : the runs, the misfire policies and the errors of the callbacks."""
+from collections.abc import Callable
+from time import sleep
+
+import pytest
+
+from tray_manager import Label, MisfirePolicies
+
+from conftest import wait_until
+
+
+def slow_first_run(delay: float) -> tuple[Callable[[], None], list[int]]:
+    """Return a callback whose first run lasts delay seconds, and the list of its runs."""
+    runs = []
+    def callback():
+        runs.append(len(runs))
+        if len(runs) == 1:
+            sleep(delay) # Miss the next runs
+    return callback, runs
+
+
+def test_after_runs_once(tray):
+    runs = []
+    task = tray.scheduler.after(0.01, runs.append, (1,))
+    assert wait_until(task.is_cancelled)
+    sleep(0.05)
+    assert runs == [1]
+    assert task.runs == 1
+
+
+def test_every_runs_until_cancelled(tray):
+    runs = []
+    task = tray.scheduler.every(0.01, lambda: runs.append(1))
+    assert wait_until(lambda: len(runs) >= 3)
+    task.cancel()
+    count = len(runs)
+    sleep(0.05)
+    assert len(runs) <= count + 1 # At most the run in progress when it was cancelled
+
+
+def test_tasks_of_a_tick_update_the_menu_once(tray):
+    labels = [Label(f"Label {i}") for i in range(5)]
+    with tray.batch():
+        for label in labels:
+            tray.menu.add(label)
+    before = tray.get_update_stats()["performed"]
+
+    for i, label in enumerate(labels):
+        tray.scheduler.after(0.02, label.edit, (f"Edited {i}",))
+    assert wait_until(lambda: tray.scheduler.get_stats()["runs"] == 5)
+    assert tray.get_update_stats()["performed"] == before + 1
+
+
+def test_misfire_skip(tray):
+    callback, runs = slow_first_run(0.2)
+    task = tray.scheduler.every(0.05, callback, misfire=MisfirePolicies.SKIP, start_after=0)
+    assert wait_until(lambda: task.runs >= 1)
+
+    assert task.missed >= 3 # The runs due during the slow run are skipped
+    assert task.get_next_run() is not None
+    sleep(0.02)
+    assert len(runs) == 1 # The next run is back on the interval, not right away
+
+
+def test_misfire_run_once(tray):
+    callback, runs = slow_first_run(0.2)
+    task = tray.scheduler.every(0.05, callback, misfire=MisfirePolicies.RUN_ONCE, start_after=0)
+    assert wait_until(lambda: len(runs) >= 2, timeout=0.4) # Run once right after the slow run
+
+    assert task.missed >= 2 # The other runs due during the slow run are skipped
+    sleep(0.02)
+    assert len(runs) == 2
+
+
+def test_misfire_run_all(tray):
+    callback, runs = slow_first_run(0.2)
+    task = tray.scheduler.every(0.05, callback, misfire=MisfirePolicies.RUN_ALL, start_after=0)
+    assert wait_until(lambda: len(runs) >= 5, timeout=0.4) # Every run due during the slow run is run right after it
+
+    assert task.missed == 0
+
+
+def test_callback_error_is_counted(tray, capsys):
+    def fail():
+        raise RuntimeError("Scheduled failure")
+
+    runs = []
+    tray.scheduler.after(0.01, fail)
+    tray.scheduler.after(0.01, runs.append, (1,))
+    assert wait_until(lambda: tray.scheduler.get_stats()["runs"] == 2)
+
+    assert tray.scheduler.get_stats()["errors"] == 1
+    assert runs == [1] # The other tasks of the tick still run
+    assert "Scheduled failure" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("schedule", [lambda scheduler: scheduler.every(1, None),
+                                      lambda scheduler: scheduler.after(1, "callback"),
+                                      lambda scheduler: scheduler.every(0, print)])
+def test_invalid_tasks_are_rejected(tray, schedule):
+    with pytest.raises(ValueError):
+        schedule(tray.scheduler)
+    assert tray.scheduler.get_stats()["tasks"] == 0
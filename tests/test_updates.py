@@ -0,0 +1,112 @@
+"""Tests of the menu updates : the batches, the update interval and the rebuild of the submenus that changed only."""
+from headless import walk_menu
+
+from tray_manager import Label, Button, Submenu
+
+from conftest import wait_until
+
+
+def test_batch_updates_the_menu_once(tray):
+    before = tray.get_update_stats()
+    updates = tray.tray.menu_updates
+
+    with tray.batch():
+        for i in range(50):
+            tray.menu.add(Label(f"Item {i}"))
+        assert tray.tray.menu_updates == updates # Nothing is flushed while the batch is opened
+
+    stats = tray.get_update_stats()
+    assert stats["requested"] - before["requested"] == 50
+    assert stats["performed"] - before["performed"] == 1
+    assert tray.tray.menu_updates == updates + 1
+    assert walk_menu(tray.tray.menu) == 50
+
+
+def test_nested_batches_flush_when_the_outermost_closes(tray):
+    before = tray.get_update_stats()["performed"]
+    with tray.batch():
+        tray.menu.add(Label("A"))
+        with tray.batch():
+            tray.menu.add(Label("B"))
+        assert tray.get_update_stats()["performed"] == before
+        tray.menu.add(Label("C"))
+    assert tray.get_update_stats()["performed"] == before + 1
+
+
+def test_update_interval_coalesces_the_updates(tray):
+    tray.set_update_interval(0.05)
+    label = Label("Label")
+    tray.menu.add(label) # Performed right away, starts the interval
+    before = tray.get_update_stats()
+
+    for i in range(20):
+        label.edit(text=f"Label {i}")
+
+    assert wait_until(lambda: tray.get_update_stats()["performed"] > before["performed"])
+    stats = tray.get_update_stats()
+    assert stats["requested"] - before["requested"] == 20
+    assert stats["performed"] - before["performed"] == 1
+    assert tray.tray.menu.items[0].text == "Label 19"
+
+
+def test_only_the_submenus_that_changed_are_rebuilt(tray):
+    metrics = tray.enable_metrics()
+    changed = Submenu("Changed")
+    unchanged = Submenu("Unchanged")
+    label = Label("Label")
+    changed.add(label)
+    unchanged.add(Label("A"))
+    unchanged.add(Label("B"))
+    unchanged.add(Label("C"))
+    with tray.batch():
+        tray.menu.add(changed)
+        tray.menu.add(unchanged)
+
+    builds = []
+    metrics.add_listener(lambda event, data: builds.append((data["kind"], data["nodes"])) if event == "build" else None)
+    label.edit(text="Edited")
+
+    assert builds == [("Submenu", 1), ("Menu", 2)] # The unchanged submenu (3 items) is reused
+    assert tray.tray.menu.items[0].submenu.items[0].text == "Edited"
+    assert [item.text for item in tray.tray.menu.items[1].submenu.items] == ["A", "B", "C"]
+
+
+def test_a_change_in_a_nested_submenu_rebuilds_its_parents_only(tray):
+    metrics = tray.enable_metrics()
+    outer = Submenu("Outer")
+    inner = Submenu("Inner")
+    sibling = Submenu("Sibling")
+    button = Button("Button", None)
+    inner.add(button)
+    outer.add(inner)
+    sibling.add(Label("A"))
+    sibling.add(Label("B"))
+    with tray.batch():
+        tray.menu.add(outer)
+        tray.menu.add(sibling)
+
+    builds = []
+    metrics.add_listener(lambda event, data: builds.append((data["kind"], data["nodes"])) if event == "build" else None)
+    button.edit(text="Edited")
+
+    assert builds == [("Submenu", 1), ("Submenu", 1), ("Menu", 2)] # inner, outer then the menu, not the sibling
+    assert tray.tray.menu.items[0].submenu.items[0].submenu.items[0].text == "Edited"
+
+
+def test_disabling_an_item_rebuilds_nothing(tray):
+    metrics = tray.enable_metrics()
+    submenu = Submenu("Submenu")
+    button = Button("Button", None)
+    submenu.add(button)
+    tray.menu.add(submenu)
+
+    builds = []
+    metrics.add_listener(lambda event, data: builds.append(data["kind"]) if event == "build" else None)
+    updates = tray.tray.menu_updates
+    button.disable()
+
+    assert builds == [] # The state is read by the backend when it walks the menu
+    assert tray.tray.menu_updates == updates + 1
+    assert tray.tray.menu.items[0].submenu.items[0].enabled is False
+    button.enable()
+    assert tray.tray.menu.items[0].submenu.items[0].enabled is True
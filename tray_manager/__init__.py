@@ -1,17 +1,36 @@
+from tray_manager.tray_manager import ItemAlreadyAddedException
 from tray_manager.tray_manager import NotificationNotSupported
 from tray_manager.tray_manager import CircularAddException
 from tray_manager.tray_manager import DefaultNotSupported
 from tray_manager.tray_manager import TooManyDefaultItems
 from tray_manager.tray_manager import UncompatibleBackend
+from tray_manager.tray_manager import CallbackDispatcher
 from tray_manager.tray_manager import UnsuportedFeature
 from tray_manager.tray_manager import RadioNotSupported
 from tray_manager.tray_manager import MenuNotSupported
+from tray_manager.tray_manager import AsyncTrayManager
+from tray_manager.tray_manager import MisfirePolicies
 from tray_manager.tray_manager import UnknownBackend
+from tray_manager.tray_manager import VirtualSubmenu
+from tray_manager.tray_manager import StreamPolicies
+from tray_manager.tray_manager import QueuePolicies
+from tray_manager.tray_manager import RecordingSink
+from tray_manager.tray_manager import ScheduledTask
 from tray_manager.tray_manager import Notification
 from tray_manager.tray_manager import TrayManager
+from tray_manager.tray_manager import EventStream
+from tray_manager.tray_manager import Observable
+from tray_manager.tray_manager import RadioGroup
 from tray_manager.tray_manager import Separator
+from tray_manager.tray_manager import Executors
+from tray_manager.tray_manager import IconStore
+from tray_manager.tray_manager import TrayEvent
+from tray_manager.tray_manager import Scheduler
 from tray_manager.tray_manager import CheckBox
 from tray_manager.tray_manager import Backends
+from tray_manager.tray_manager import Profiler
+from tray_manager.tray_manager import Corners
+from tray_manager.tray_manager import Metrics
 from tray_manager.tray_manager import Submenu
 from tray_manager.tray_manager import Button
 from tray_manager.tray_manager import Values
@@ -1,13 +1,34 @@
-from pystray import Icon as pystray_Icon, Menu as pystray_Menu, MenuItem as pystray_MenuItem
-from typing import Optional, Union
+from __future__ import annotations # The annotations aren't evaluated, so pystray and PIL are only imported when they are needed
+from typing import Optional, Union, Any, BinaryIO, TYPE_CHECKING
 from types import FunctionType, MethodType, LambdaType
-from pystray._base import Icon as pystray_Icon_Class
-from threading import Thread
-from PIL import Image
+from concurrent.futures import Future, Executor, ThreadPoolExecutor
+from collections.abc import Callable
+from functools import partial
+from inspect import iscoroutinefunction, iscoroutine
+from traceback import print_exception
+from threading import Thread, Timer, Lock, Event, Condition, get_ident, current_thread
+from contextlib import contextmanager
+from collections.abc import Iterator, Iterable
+from itertools import islice
+from heapq import heappush, heappop
+from random import uniform
+from math import ceil
+from collections import OrderedDict, deque
+from weakref import WeakSet, WeakKeyDictionary
+from hashlib import sha1
+from io import BytesIO
+from importlib import import_module
 from enum import Enum
 from platform import system as p_system
-from os import environ as os_environ
-from time import sleep as sleep
+from os import environ as os_environ, getpid
+from sys import modules as sys_modules
+from time import sleep as sleep, monotonic, perf_counter
+
+if TYPE_CHECKING:
+    from pystray import Menu as pystray_Menu, MenuItem as pystray_MenuItem
+    from pystray._base import Icon as pystray_Icon_Class
+    import asyncio
+    from PIL import Image
 
 
 class TrayManagerCreationException(Exception):
@@ -35,6 +56,19 @@ class CircularAddException(Exception):
     def __str__(self) -> str:
         return f"""The submenu "{self.submenu._text}" ({self.submenu}) is contained in the submenu "{self.added_submenu._text}" ({self.added_submenu}) that you're trying to add. That is prohibited as it causes a circular add"""
 
+class ItemAlreadyAddedException(Exception):
+    def __init__(self, item: Union['Label', 'Button', 'CheckBox', 'Submenu'], container: Union['Menu', 'Submenu']) -> None:
+        """Exception raised when an item is added to a menu/submenu while it is already contained in a menu/submenu."""
+        self.item = item
+        self.container = container
+
+    def __str__(self) -> str:
+        if isinstance(self.container, Menu):
+            text = "the menu"
+        else:
+            text = f'the submenu "{self.container._text}" ({self.container})'
+        return f"""The item "{self.item._text}" ({self.item}) is already contained in {text}. Remove it before adding it to another menu/submenu."""
+
 class TooManyDefaultItems(Exception):
     def __init__(self, menu: Union['Menu', 'Submenu'], items: list[Union['Label', 'Button', 'CheckBox', 'Submenu']]) -> None:
         """Exception raised when more than one items has the default option in the same menu/submenu."""
@@ -141,6 +175,36 @@ class Values(Enum):
     DEFAULT = "DefaultValue"
     DISABLED = "DisabledValue"
 
+class Executors(Enum):
+    """The class containing the executors that can run the callbacks of the items."""
+    INLINE = "inline" # Run the callbacks in pystray's loop thread (The menu is frozen until the callback returns)
+    THREAD_POOL = "thread-pool" # Run the callbacks in a pool of threads
+    PROCESS_POOL = "process-pool" # Run the callbacks in a pool of processes (The callbacks and their arguments must be picklable)
+
+class QueuePolicies(Enum):
+    """The class containing the policies applied to the callbacks when the maximum number of pending callbacks is reached."""
+    DROP = "drop" # Drop the new callbacks
+    COALESCE = "coalesce" # Drop the new callbacks, and merge the callbacks of an item that is clicked again before its previous callback started
+
+class StreamPolicies(Enum):
+    """The class containing the policies applied to the new events when the queue of an EventStream is full."""
+    BLOCK = "block" # Wait until the consumer takes an event (The thread clicking, usually pystray's loop thread, is blocked)
+    DROP_OLDEST = "drop-oldest" # Drop the oldest event of the queue
+    DROP_NEWEST = "drop-newest" # Drop the new event
+
+class MisfirePolicies(Enum):
+    """The class containing the policies applied to the recurring tasks of the Scheduler when their runs were missed (e.g. a task running for longer than its interval or the computer sleeping)."""
+    SKIP = "skip" # Skip the missed runs, the task runs at its next time in the future
+    RUN_ONCE = "run-once" # Run the task once now for all the missed runs, then at its next time
+    RUN_ALL = "run-all" # Run the task once for each missed run, as fast as possible
+
+class Corners(Enum):
+    """The class containing the corners of the icon where a badge can be drawn."""
+    TOP_LEFT = "top-left"
+    TOP_RIGHT = "top-right"
+    BOTTOM_LEFT = "bottom-left"
+    BOTTOM_RIGHT = "bottom-right"
+
 class Backends(Enum):
     """The class containing the backends avaible in TrayManager."""
     WIN32 = "win32"
@@ -151,313 +215,1793 @@ class Backends(Enum):
     DARWIN = "darwin"
 
 
-class __OsSupport:
-    def __init__(self) -> None:
-        """A class used to get the supported features of the current OS."""
-        try:
-            self.__icon = pystray_Icon("")
-        except OSError as e:
-            raise TrayManagerCreationException(e)
+# The names of the pystray backends (Used in the PYSTRAY_BACKEND environment variable) corresponding to each backend
+_PYSTRAY_BACKENDS = {Backends.WIN32: "win32",
+                     Backends.GTX: "gtk",
+                     Backends.APP_INDICATOR: "appindicator",
+                     Backends.AYATANA_APP_INDICATOR: "appindicator", # pystray's appindicator backend falls back to ayatana-appindicator by itself
+                     Backends.XORG: "xorg",
+                     Backends.DARWIN: "darwin"}
+
 
-        self.SUPPORT_MENU = self.__support_menu()
-        self.SUPPORT_NOTIFICATION = self.__support_notification()
-        self.SUPPORT_RADIO = self.__support_radio()
-        self.SUPPORT_DEFAULT = self.__support_default()
+def _pystray_icon_class() -> type[pystray_Icon_Class]:
+    """Private function. Import and return the pystray Icon class of the backend selected by the PYSTRAY_BACKEND environment variable (Or of pystray's default backend)."""
+    backend = os_environ.get("PYSTRAY_BACKEND")
+    if backend: # Import the backend module directly as pystray only reads the environment variable the first time it is imported
+        return import_module(f"pystray._{backend}").Icon
     
-    def __support_menu(self) -> bool:
-        """Check if the OS support the pystray menu."""
-        return self.__icon.HAS_MENU
+    from pystray import Icon as pystray_Icon
+    return pystray_Icon
+
+
+class _IconPayloads:
+    def __init__(self, release: Callable[[Any], None] | None = None, max_entries: int = 16) -> None:
+        """Private class. A LRU cache of the backend representation (Temporary file, icon handle, ...) of the icons, keyed by the image object and a size (The payload is dropped with the image, so reloading an icon never reuses the previous payload).\n
+        Parameters
+        ----------
+        * release: Callable[[Any], None] | None (Facultative)\n
+            The function used to release a payload when it is evicted.
+        * max_entries: int (Facultative)\n
+            The maximum number of payloads kept."""
+        self._release = release
+        self._max_entries = max_entries
+        self._payloads: OrderedDict[tuple[int, Any], tuple[Image.Image, Any]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        return
     
-    def __support_notification(self) -> bool:
-        """Check if the OS support the pystray notifications."""
-        return self.__icon.HAS_NOTIFICATION
+    def get(self, image: Image.Image, size: Any = None) -> Any:
+        """Return the payload of the image, None if it isn't cached."""
+        with self._lock:
+            entry = self._payloads.get((id(image), size))
+            if entry is None or entry[0] is not image:
+                self.misses += 1
+                return
+            
+            self.hits += 1
+            self._payloads.move_to_end((id(image), size))
+            return entry[1]
     
-    def __support_radio(self) -> bool:
-        """Check if the OS support the pystray radio (Dot look) of CheckBox."""
-        return self.__icon.HAS_MENU_RADIO
+    def put(self, image: Image.Image, payload: Any, size: Any = None) -> None:
+        """Cache the payload of the image, the least recently used payloads are released if there are too many of them."""
+        with self._lock:
+            old = self._payloads.pop((id(image), size), None)
+            self._payloads[(id(image), size)] = (image, payload)
+            evicted = [old[1]] if old is not None and old[1] is not payload else []
+            while len(self._payloads) > self._max_entries:
+                evicted.append(self._payloads.popitem(last=False)[1][1])
+
+        for payload in evicted:
+            self.__release(payload)
+        return
     
-    def __support_default(self) -> bool:
-        """Check if the OS support the pystray default option (Bold look and default item)."""
-        return self.__icon.HAS_DEFAULT_ACTION
+    def set_max_entries(self, max_entries: int) -> None:
+        """Set the maximum number of payloads kept, the least recently used payloads are released if there are too many of them."""
+        with self._lock:
+            self._max_entries = max_entries
+            evicted = []
+            while len(self._payloads) > self._max_entries:
+                evicted.append(self._payloads.popitem(last=False)[1][1])
+
+        for payload in evicted:
+            self.__release(payload)
+        return
+    
+    def __contains__(self, payload: Any) -> bool:
+        with self._lock:
+            return any(entry[1] is payload for entry in self._payloads.values())
+    
+    def clear(self) -> None:
+        """Release all the payloads."""
+        with self._lock:
+            payloads = [entry[1] for entry in self._payloads.values()]
+            self._payloads.clear()
+        
+        for payload in payloads:
+            self.__release(payload)
+        return
+    
+    def __release(self, payload: Any) -> None:
+        if self._release is not None:
+            try:
+                self._release(payload)
+            except Exception:
+                pass
+        return
 
 
+def _remove_file(path: str) -> None:
+    """Private function. Remove a temporary icon file."""
+    from os import unlink
+    unlink(path)
+    return
 
-class Notification:
-    def __init__(self, tray: 'TrayManager') -> None:
-        """A class for managing the notification using pystray's interface.\nThis doesn't seems to work for now, this class is placed under NotImplemented label until the notifications works again"""
-        self.tray = tray
+
+def _destroy_icon_handle(handle: Any) -> None:
+    """Private function. Destroy a win32 icon handle."""
+    import_module("pystray._util.win32").DestroyIcon(handle)
+    return
+
+
+class _CachedIcon:
+    """Private class. The base of the pystray Icon subclasses caching the representation the backend encodes for each icon."""
+    _release_payload: Callable[[Any], None] | None = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._icon_payloads = _IconPayloads(self._release_payload, _MIN_ICON_PAYLOADS) # Created first as some backends encode the icon when they're created
+        super().__init__(*args, **kwargs)
+        return
+
+
+class _CachedFileIcon(_CachedIcon):
+    """Private class. Reuse the temporary PNG files written for each icon (gtk, appindicator)."""
+    _release_payload = staticmethod(_remove_file)
+
+    def _update_fs_icon(self) -> None:
+        path = self._icon_payloads.get(self.icon)
+        if path is None:
+            super()._update_fs_icon()
+            self._icon_payloads.put(self.icon, self._icon_path)
+        else:
+            self._icon_path = path
+            self._icon_valid = True
         return
     
-    def notify(self, title: str, message: str, remove_after_s: float = -1) -> None:
-        """Display a notification. This doesn't seems to work for now, this class is placed under NotImplemented label until the notifications works again.\n
-        Parameters
-        ----------
-        * title: str\n
-        The title of the notification.
-        * message: str\n
-        The content of the notification.
-        * remove_after_s: float\n
-        The delay in seconds to wait before removing the notification, if set to a negative value, doesn't remove the notification."""
+    def _remove_fs_icon(self) -> None:
+        if self._icon_path is not None and self._icon_path in self._icon_payloads: # Keep the cached file
+            self._icon_path = None
+            self._icon_valid = False
+        else:
+            super()._remove_fs_icon()
+        return
 
-        raise NotImplementedError
-        if not OsSupport.SUPPORT_NOTIFICATION:
-            raise NotificationNotSupported
-        
-        self.tray.tray.notify(message, title)
+
+class _CachedHandleIcon(_CachedIcon):
+    """Private class. Reuse the native icon handle loaded for each icon (win32)."""
+    _release_payload = staticmethod(_destroy_icon_handle)
+
+    def _assert_icon_handle(self) -> None:
+        if self._icon_handle:
+            return
         
-        if remove_after_s > 0:
-            thread = Thread(target=self._delay, args=(remove_after_s,))
-            thread.start()
+        handle = self._icon_payloads.get(self.icon)
+        if handle is None:
+            super()._assert_icon_handle()
+            self._icon_payloads.put(self.icon, self._icon_handle)
+        else:
+            self._icon_handle = handle
         return
-
-    def remove_notification(self) -> None:
-        """Remove a notification. This doesn't seems to work for now, this class is placed under NotImplemented label until the notifications works again."""
-        raise NotImplementedError
-        self.tray.tray.remove_notification()
+    
+    def _release_icon(self) -> None:
+        if self._icon_handle and self._icon_handle in self._icon_payloads: # Keep the cached handle
+            self._icon_handle = None
+        else:
+            super()._release_icon()
         return
 
-    def _delay(self, delay: float) -> None:
-        """Private function. Wait a certain amount of time before removing the notification."""
-        sleep(delay)
-        self.remove_notification()
-        return
 
+class _CachedDataIcon(_CachedIcon):
+    """Private class. Reuse the resized pixel data drawn for each icon and size (xorg)."""
+    def _assert_icon_data(self, width: int, height: int) -> None:
+        if self._icon_data and self._icon_data.size == (width, height):
+            return
+        
+        data = self._icon_payloads.get(self._icon, (width, height))
+        if data is None:
+            super()._assert_icon_data(width, height)
+            self._icon_payloads.put(self._icon, self._icon_data, (width, height))
+        else:
+            self._icon_data = data
+        return
 
 
-class Item:
-    """The default class for the menu's items."""
-    def _update(self: Union['Label', 'Button', 'CheckBox', 'Separator']) -> None:
-        """Update the menu if the item that triggered the update is in the menu."""
-        if self.tray != None: # Check if tray is defined (tray may not be defined if the item has not been added to the menu or to a submenu that has been added to the menu)
-            self.tray: TrayManager
-            self.tray.tray.update_menu() # Update the menu
+class _CachedImageIcon(_CachedIcon):
+    """Private class. Reuse the native image created for each icon and size (darwin)."""
+    def _assert_image(self) -> None:
+        size = int(self._status_bar.thickness())
+        if self._icon_image is None:
+            image = self._icon_payloads.get(self._icon, size)
+            if image is not None: # pystray's _assert_image returns early when the image exists, without giving it to the status item
+                self._icon_image = image
+                self._status_item.button().setImage_(image)
+                return
+        
+        super()._assert_image()
+        self._icon_payloads.put(self._icon, self._icon_image, size)
         return
 
-class Label(Item):
-    def __init__(self, text: str, default: bool = False) -> None:
-        """Create a Label item.\n
-        Parameter
-        ----------
-        * text: str\n
-            The text of the label.
-        * default: bool (Facultative)\n
-            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator)."""
 
-        self.tray: Optional[TrayManager] = None
+# The method encoding the icon in each backend and the cache overriding it
+_MIN_ICON_PAYLOADS = 16 # The minimum number of backend representations of the icons kept, raised to fit the frames of the largest animation loaded
 
-        self._text = text
-        self._default = default
-        self._item_state = True
-        self.item = self.__create_item() # Create our item
-        return
+_ICON_CACHES = (("_update_fs_icon", _CachedFileIcon),
+                ("_assert_icon_handle", _CachedHandleIcon),
+                ("_assert_icon_data", _CachedDataIcon),
+                ("_assert_image", _CachedImageIcon))
+_cached_icon_classes: dict[type, type] = {}
 
-    def edit(self, text: str = Values.DEFAULT, default: bool = Values.DEFAULT) -> None:
-        """Edit the Label item.\n
-        Parameter
-        ----------
-        * text: str (Facultative)\n
-            The text of the label, if not specified, don't change.
-        * default: bool (Facultative)\n
-            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change."""
 
-        if text is not Values.DEFAULT:
-            self._text = text
-        
-        if default is not Values.DEFAULT:
-            self._default = default
+def _cached_icon_class(icon_class: type[pystray_Icon_Class]) -> type[pystray_Icon_Class]:
+    """Private function. Return a subclass of the pystray Icon class caching the representation the backend encodes for each icon (The class itself if the backend doesn't encode the icons)."""
+    cached = _cached_icon_classes.get(icon_class)
+    if cached is None:
+        cached = icon_class
+        for hook, cache in _ICON_CACHES:
+            if hasattr(icon_class, hook):
+                cached = type(icon_class.__name__, (cache, icon_class), {"__module__": icon_class.__module__})
+                break
+        _cached_icon_classes[icon_class] = cached
+    return cached
 
-        self.item = self.__create_item() # Create the new item
-        self._update() # Trigger a menu update
+
+
+class _OsSupport:
+    def __init__(self) -> None:
+        """A class used to get the supported features of the current OS.\n
+        The backend is only probed the first time a feature is checked, and the result is cached for each backend (The backend can be changed by TrayManager's backend argument)."""
+        self.__features: dict[str | None, dict[str, bool]] = {}
         return
     
-    def enable(self) -> None:
-        """Enable the Label item"""
-        self._item_state = True
-        self.item = self.__create_item()
-        self._update()
+    @property
+    def SUPPORT_MENU(self) -> bool:
+        """Check if the OS support the pystray menu."""
+        return self.__probe()["menu"]
+    
+    @property
+    def SUPPORT_NOTIFICATION(self) -> bool:
+        """Check if the OS support the pystray notifications."""
+        return self.__probe()["notification"]
+    
+    @property
+    def SUPPORT_RADIO(self) -> bool:
+        """Check if the OS support the pystray radio (Dot look) of CheckBox."""
+        return self.__probe()["radio"]
+    
+    @property
+    def SUPPORT_DEFAULT(self) -> bool:
+        """Check if the OS support the pystray default option (Bold look and default item)."""
+        return self.__probe()["default"]
+    
+    def __probe(self) -> dict[str, bool]:
+        """Return the features supported by the current backend, the backend is imported the first time."""
+        backend = os_environ.get("PYSTRAY_BACKEND")
+        features = self.__features.get(backend)
+        if features is None:
+            try:
+                icon_class = _pystray_icon_class() # The features are class attributes, so no pystray_Icon needs to be created
+            except OSError as e:
+                raise TrayManagerCreationException(e)
+            
+            features = {"menu": icon_class.HAS_MENU,
+                        "notification": icon_class.HAS_NOTIFICATION,
+                        "radio": icon_class.HAS_MENU_RADIO,
+                        "default": icon_class.HAS_DEFAULT_ACTION}
+            self.__features[backend] = features
+        return features
+
+
+
+class ScheduledTask:
+    """A task of the Scheduler (Returned by Scheduler.every() and Scheduler.after())."""
+    __slots__ = ("callback", "interval", "jitter", "misfire", "runs", "missed", "_base", "_deadline", "_cancelled")
+
+    def __init__(self, callback: Callable[[], Any], interval: float | None, jitter: float, misfire: MisfirePolicies, base: float) -> None:
+        self.callback = callback
+        self.interval = interval # None for a one-shot task
+        self.jitter = jitter
+        self.misfire = misfire
+        self.runs = 0 # The number of times the task ran
+        self.missed = 0 # The number of runs skipped by MisfirePolicies.SKIP and RUN_ONCE
+        self._base = base # The time of the next run without jitter (The jitter doesn't shift the following runs)
+        self._deadline = base + uniform(0, jitter) if jitter > 0 else base
+        self._cancelled = False
         return
-
-    def disable(self) -> None:
-        """Disable the Label item"""
-        self._item_state = False
-        self.item = self.__create_item()
-        self._update()
+    
+    def cancel(self) -> None:
+        """Cancel the task, it won't run anymore."""
+        self._cancelled = True
         return
     
-    def __create_item(self) -> pystray_MenuItem:
-        """Create the pystray_MenuItem Label object."""
-        if self._default:
-            if not OsSupport.SUPPORT_DEFAULT:
-                raise DefaultNotSupported(self)
-            
-        return pystray_MenuItem(self._text, None, default=self._default, enabled=self._item_state)
-
+    def is_cancelled(self) -> bool:
+        """Return True if the task was cancelled (A one-shot task is cancelled once it ran)."""
+        return self._cancelled
+    
+    def get_next_run(self) -> float | None:
+        """Return the time.monotonic() time of the next run of the task, None if it was cancelled."""
+        return None if self._cancelled else self._deadline
 
 
-class Button(Item):
-    def __init__(self, text: str, callback: FunctionType | MethodType | LambdaType | None, args: tuple | None = None, default: bool = False) -> None:
-        """Create a Button item.\n
+class Scheduler:
+    def __init__(self, tray: 'TrayManager', resolution: float = 0.01) -> None:
+        """A class running the recurring and one-shot tasks of a TrayManager on a single thread (A scheduler is automatically created when you create a TrayManager object).\n
+        The tasks due at the same time (within resolution seconds) run together in a batch, so the menu is updated once for all of them.\n
+        Parameters
+        ----------
+        * tray: TrayManager\n
+            The TrayManager whose menu the tasks update.
+        * resolution: float (Facultative)\n
+            The delay in seconds within which the tasks due are run in the same tick."""
+        self.tray = tray
+        self._resolution = resolution
+        self._condition = Condition()
+        self._heap: list[tuple[float, int, ScheduledTask]] = [] # The tasks by time of their next run
+        self._seq = 0
+        self._thread: Optional[Thread] = None
+        self._closed = False
+
+        self._ticks = 0
+        self._runs = 0
+        self._errors = 0
+        return
+    
+    def every(self, interval: float, callback: Callable, args: tuple | None = None, jitter: float = 0, misfire: MisfirePolicies = MisfirePolicies.SKIP, start_after: float | None = None) -> ScheduledTask:
+        """Run a callback every interval seconds and return its task.\n
         Parameters
         ----------
-        * text: str\n
-            The text of the button.
-        * callback: FunctionType, MethodType or LambdaType (Facultative)\n
-            The function to callback when button is clicked.
+        * interval: float\n
+            The delay in seconds between two runs.
+        * callback: Callable\n
+            The function (or any callable) to run, it runs in the scheduler thread so it must be short (Start a thread or use the dispatcher for long work).
         * args: tuple (Facultative)\n
             The arguments to pass to the callback, MUST be a tuple.
-        * default: bool (Facultative)\n
-            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator)."""
-
-        self.tray: Optional[TrayManager] = None
-        self._text = text
-        self._callback = callback
-        self._callback_args = args
-        self._default = default
-        self._item_state = True
-        self.item = self.__create_item() # Create our item
-        return
+        * jitter: float (Facultative)\n
+            The maximum random delay in seconds added to each run (So that tasks with the same interval don't all run at once), it doesn't shift the following runs.
+        * misfire: MisfirePolicies (Facultative)\n
+            The policy applied when runs were missed.
+        * start_after: float | None (Facultative)\n
+            The delay in seconds before the first run, if None, wait one interval."""
+        if interval <= 0:
+            raise ValueError("The interval must be greater than 0.")
+        if not callable(callback):
+            raise ValueError("The callback must be callable.")
+        
+        first = interval if start_after is None else start_after
+        return self.__schedule(ScheduledTask(_bind_callback(callback, args), interval, jitter, misfire, monotonic() + first))
     
-    def edit(self, text: str = Values.DEFAULT, callback: FunctionType | MethodType | LambdaType | None = Values.DEFAULT, args: tuple | None = Values.DEFAULT, default: bool = Values.DEFAULT) -> None:
-        """Edit the Button item.\n
+    def after(self, delay: float, callback: Callable, args: tuple | None = None) -> ScheduledTask:
+        """Run a callback once after delay seconds and return its task.\n
         Parameters
         ----------
-        * text: str (Facultative)\n
-            The text of the button, if not specified, don't change.
-        * callback: FunctionType, MethodType or LambdaType (Facultative)\n
-            The function to callback when button is clicked, if None, don't callback, if not specified, don't change.
+        * delay: float\n
+            The delay in seconds before the run.
+        * callback: Callable\n
+            The function (or any callable) to run, it runs in the scheduler thread so it must be short.
         * args: tuple (Facultative)\n
-            The arguments to pass to the callback, MUST be a tuple, if not specified, don't change.
-        * default: bool (Facultative)\n
-            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change."""
+            The arguments to pass to the callback, MUST be a tuple."""
+        if not callable(callback):
+            raise ValueError("The callback must be callable.")
+        
+        return self.__schedule(ScheduledTask(_bind_callback(callback, args), None, 0, MisfirePolicies.RUN_ONCE, monotonic() + delay))
+    
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of tasks scheduled, of ticks (Each tick updates the menu at most once), of runs, of runs missed and of callbacks that raised an exception."""
+        with self._condition:
+            tasks = [task for _, _, task in self._heap if not task._cancelled]
+            return {"tasks": len(tasks), "ticks": self._ticks, "runs": self._runs, "missed": sum(task.missed for task in tasks), "errors": self._errors}
+
+    def shutdown(self) -> None:
+        """Stop the scheduler thread, the tasks won't run anymore."""
+        with self._condition:
+            self._closed = True
+            for _, _, task in self._heap:
+                task._cancelled = True
+            self._heap.clear()
+            self._condition.notify()
+        return
 
-        # Set new values, if the value is Balues.DEFAUT, don't change
-        if text is not Values.DEFAULT:
-            self._text = text
+    def __schedule(self, task: ScheduledTask) -> ScheduledTask:
+        """Add a task to the heap and wake the scheduler thread if it runs before the others."""
+        with self._condition:
+            if self._closed:
+                task._cancelled = True
+                return task
+            
+            self._seq += 1
+            heappush(self._heap, (task._deadline, self._seq, task))
+            if self._thread is None:
+                self._thread = Thread(target=self.__run, name="tray_manager-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return task
     
-        if callback is not Values.DEFAULT:
-            self._callback = callback
+    def __run(self) -> None:
+        """Run the tasks when they are due, run in the scheduler thread."""
+        while True:
+            with self._condition:
+                due = self.__wait_due()
+                if due is None:
+                    return
+                self._ticks += 1
+            
+            profiler = self.tray.profiler
+            if profiler is not None:
+                start = perf_counter()
+
+            with self.tray.batch(): # The tasks of the tick update the menu once
+                for task in due:
+                    try:
+                        task.callback()
+                    except Exception as e:
+                        print_exception(e)
+                        with self._condition:
+                            self._errors += 1
+
+            if profiler is not None:
+                profiler._span("scheduler tick", "scheduler", start, perf_counter(), tasks=len(due))
+            
+            with self._condition:
+                self._runs += len(due)
+                for task in due:
+                    task.runs += 1
+                    self.__reschedule(task)
+
+    def __wait_due(self) -> list[ScheduledTask] | None:
+        """Wait for the next tasks due and remove them from the heap, return None once closed. Called with the condition held."""
+        while not self._closed:
+            while self._heap and self._heap[0][2]._cancelled:
+                heappop(self._heap)
+            
+            now = monotonic()
+            if self._heap and self._heap[0][0] <= now:
+                due = []
+                while self._heap and self._heap[0][0] <= now + self._resolution: # The tasks due in the same tick
+                    task = heappop(self._heap)[2]
+                    if not task._cancelled:
+                        due.append(task)
+                return due
+            
+            self._condition.wait(self._heap[0][0] - now if self._heap else None)
+        return None
+    
+    def __reschedule(self, task: ScheduledTask) -> None:
+        """Schedule the next run of a task after it ran, applying its misfire policy. Called with the condition held."""
+        if task.interval is None or task._cancelled or self._closed:
+            task._cancelled = True # A one-shot task is done
+            return
+        
+        now = monotonic()
+        base = task._base + task.interval
+        if base <= now: # Runs were missed
+            if task.misfire is MisfirePolicies.SKIP:
+                missed = ceil((now - base) / task.interval)
+                task.missed += missed
+                base += missed * task.interval
+            elif task.misfire is MisfirePolicies.RUN_ONCE:
+                missed = ceil((now - base) / task.interval)
+                task.missed += missed - 1
+                base += (missed - 1) * task.interval # Run once now, then the runs are back on time
+        
+        task._base = base
+        task._deadline = base + uniform(0, task.jitter) if task.jitter > 0 else base
+        self._seq += 1
+        heappush(self._heap, (task._deadline, self._seq, task))
+        return
 
-        if args is not Values.DEFAULT:
-            self._callback_args = args
 
-        if default is not Values.DEFAULT:
-            self._default = default
 
-        self.item = self.__create_item() # Create the new item
-        self._update() # Trigger a menu update
+class RecordingSink:
+    def __init__(self) -> None:
+        """A notification sink recording the notifications instead of displaying them, used when the backend doesn't support the notifications (Useful in tests)."""
+        self.notifications: list[tuple[str, str]] = [] # The (title, message) of the notifications displayed
+        self.current: Optional[tuple[str, str]] = None # The notification currently displayed
+        self.removed = 0 # The number of notifications removed
+        return
+    
+    def notify(self, title: str, message: str) -> None:
+        """Record a notification."""
+        self.notifications.append((title, message))
+        self.current = (title, message)
+        return
+    
+    def remove(self) -> None:
+        """Record the removal of the notification displayed."""
+        if self.current is not None:
+            self.current = None
+            self.removed += 1
         return
 
-    def enable(self) -> None:
-        """Enable the Button item"""
-        self._item_state = True
-        self.item = self.__create_item()
-        self._update()
+
+class _PystraySink:
+    def __init__(self, tray: 'TrayManager') -> None:
+        """Private class. The notification sink displaying the notifications with pystray."""
+        self.tray = tray
+        return
+    
+    def notify(self, title: str, message: str) -> None:
+        self.tray.tray.notify(message, title)
+        return
+    
+    def remove(self) -> None:
+        self.tray.tray.remove_notification()
         return
 
-    def disable(self) -> None:
-        """Disable the Button item"""
-        self._item_state = False
-        self.item = self.__create_item()
-        self._update()
+
+class _PendingNotification:
+    """Private class. A notification waiting to be displayed."""
+    __slots__ = ("title", "message", "remove_after_s", "priority", "count", "seq")
+
+    def __init__(self, title: str, message: str, remove_after_s: float, priority: int, seq: int) -> None:
+        self.title = title
+        self.message = message
+        self.remove_after_s = remove_after_s
+        self.priority = priority
+        self.count = 1 # The number of notifications merged into this one
+        self.seq = seq # Keep the order of the notifications with the same priority
+        return
+
+
+class Notification:
+    def __init__(self, tray: 'TrayManager', min_interval: float = 1, max_pending: int = 100, sink: Any = None) -> None:
+        """A class for managing the notifications (A Notification object is automatically created when you create a TrayManager object).\n
+        The notifications are queued by priority and displayed by a single thread, at most one every min_interval seconds. The notifications with the same title that are waiting are merged into one ("N new events"), and a single timer heap removes them.\n
+        Parameters
+        ----------
+        * tray: TrayManager\n
+            The TrayManager displaying the notifications.
+        * min_interval: float (Facultative)\n
+            The minimum delay in seconds between two notifications displayed.
+        * max_pending: int (Facultative)\n
+            The maximum number of notifications waiting to be displayed, the notifications with the lowest priority are dropped.
+        * sink: Any (Facultative)\n
+            The object displaying the notifications (With notify(title, message) and remove() functions), if None, use pystray, or a RecordingSink if the backend doesn't support the notifications (See OsSupport.SUPPORT_NOTIFICATION)."""
+        self.tray = tray
+        self.sink = sink
+        self._min_interval = min_interval
+        self._max_pending = max_pending
+
+        self._condition = Condition()
+        self._queue: list[tuple[int, int, _PendingNotification]] = [] # Heap of the notifications waiting, by priority then order
+        self._pending: dict[str, _PendingNotification] = {} # The notification waiting for each title
+        self._timers: list[tuple[float, int]] = [] # Heap of the removal deadlines and the displayed notification they remove
+        self._displayed = 0 # Incremented each time a notification is displayed or removed, so that the older timers are ignored
+        self._seq = 0
+        self._last_shown = float("-inf")
+        self._thread: Optional[Thread] = None
+        self._closed = False
+
+        self._shown = 0
+        self._merged = 0
+        self._dropped = 0
+        self._removed = 0
         return
     
-    def __callback(self, tray: pystray_Icon_Class, item: pystray_MenuItem) -> None:
-        """Manage the callback of the button."""
-        if isinstance(self._callback, FunctionType | MethodType | LambdaType): # Check if the callback is a function
-            if isinstance(self._callback_args, tuple): # Check if the args is a tuple
-                self._callback(*self._callback_args) # Call the callback with the given arguments
+    def notify(self, title: str, message: str, remove_after_s: float = -1, priority: int = 0) -> None:
+        """Queue a notification, it is displayed as soon as the rate limit allows it. A notification with the same title that is still waiting is merged with it ("N new events").\n
+        Parameters
+        ----------
+        * title: str\n
+        The title of the notification.
+        * message: str\n
+        The content of the notification.
+        * remove_after_s: float\n
+        The delay in seconds to wait before removing the notification, if set to a negative value, doesn't remove the notification.
+        * priority: int (Facultative)\n
+        The notifications with the highest priority are displayed first."""
 
+        with self._condition:
+            if self._closed:
+                return
+            
+            pending = self._pending.get(title)
+            if pending is not None: # Merge with the notification waiting
+                pending.count += 1
+                pending.message = f"{pending.count} new events"
+                pending.remove_after_s = remove_after_s
+                if priority > pending.priority:
+                    pending.priority = priority
+                    heappush(self._queue, (-priority, pending.seq, pending)) # The previous entry is skipped when popped
+                self._merged += 1
             else:
-                self._callback() # Call the callback without arguments
+                if len(self._pending) >= self._max_pending:
+                    lowest = min(self._pending.values(), key=lambda p: (p.priority, -p.seq)) # The lowest priority, newest notification
+                    if lowest.priority >= priority:
+                        self._dropped += 1
+                        return
+                    del self._pending[lowest.title]
+                    self._dropped += 1
+
+                self._seq += 1
+                pending = _PendingNotification(title, message, remove_after_s, priority, self._seq)
+                self._pending[title] = pending
+                heappush(self._queue, (-priority, pending.seq, pending))
+
+            if self._thread is None:
+                self._thread = Thread(target=self.__run, name="tray_manager-notifications", daemon=True)
+                self._thread.start()
+            self._condition.notify()
         return
 
-    def __create_item(self)  -> pystray_MenuItem:
-        """Create the pystray_MenuItem Button object."""
-        if self._default:
-            if not OsSupport.SUPPORT_DEFAULT:
-                raise DefaultNotSupported(self)
+    def remove_notification(self) -> None:
+        """Remove the notification displayed."""
+        with self._condition:
+            self._displayed += 1 # Cancel the removal timer of the notification
+            self._removed += 1
+        self.__get_sink().remove()
+        return
+    
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of notifications waiting, displayed, merged, dropped and removed."""
+        with self._condition:
+            return {"pending": len(self._pending), "shown": self._shown, "merged": self._merged, "dropped": self._dropped, "removed": self._removed}
+    
+    def close(self) -> None:
+        """Stop displaying the notifications, the notifications waiting are dropped."""
+        with self._condition:
+            self._closed = True
+            self._dropped += len(self._pending)
+            self._pending.clear()
+            self._queue.clear()
+            self._condition.notify()
+        return
+    
+    def __get_sink(self) -> Any:
+        """Return the sink displaying the notifications, it is chosen the first time."""
+        if self.sink is None:
+            self.sink = _PystraySink(self.tray) if OsSupport.SUPPORT_NOTIFICATION else RecordingSink()
+        return self.sink
+
+    def __run(self) -> None:
+        """Display and remove the notifications, run in the notifications thread."""
+        while True:
+            with self._condition:
+                action = self.__next_action()
+                if action is None:
+                    return
+            
+            try:
+                if action == "remove":
+                    self.__get_sink().remove()
+                else:
+                    self.__get_sink().notify(action.title, action.message)
+            except Exception as e:
+                print_exception(e)
+
+    def __next_action(self) -> Union[_PendingNotification, str, None]:
+        """Wait for the next notification to display or to remove and return it ("remove" for a removal), return None once closed. Called with the condition held."""
+        while not self._closed:
+            now = monotonic()
+            while self._timers and self._timers[0][1] != self._displayed: # Skip the timers of the notifications replaced or removed
+                heappop(self._timers)
+
+            if self._timers and self._timers[0][0] <= now:
+                heappop(self._timers)
+                self._displayed += 1
+                self._removed += 1
+                return "remove"
+            
+            while self._queue:
+                priority, _, head = self._queue[0]
+                if self._pending.get(head.title) is head and -priority == head.priority:
+                    break
+                heappop(self._queue) # Skip the entries of the notifications dropped or whose priority was raised
+            
+            show_at = self._last_shown + self._min_interval
+            if self._queue and show_at <= now:
+                pending = heappop(self._queue)[2]
+                del self._pending[pending.title]
+                self._last_shown = now
+                self._displayed += 1
+                self._shown += 1
+                if pending.remove_after_s > 0:
+                    heappush(self._timers, (now + pending.remove_after_s, self._displayed))
+                return pending
             
-        return pystray_MenuItem(self._text, self.__callback, default=self._default, enabled=self._item_state)
+            deadlines = [deadline for deadline, _ in self._timers[:1]]
+            if self._queue:
+                deadlines.append(show_at)
+            self._condition.wait(min(deadlines) - now if deadlines else None)
+        return None
+
+
+
+def _bind_callback(callback: Callable | None, args: tuple | None) -> Optional[Callable[[], Any]]:
+    """Private function. Bind the callback to its arguments, return None if the callback isn't callable.\n
+    Parameters
+    ----------
+    * callback: Callable | None\n
+        Any callable (function, method, lambda, functools.partial or callable object).
+    * args: tuple | None\n
+        The arguments to pass to the callback, ignored if it isn't a tuple."""
+    if not callable(callback):
+        return None
+    
+    if isinstance(args, tuple) and args:
+        return partial(callback, *args)
+    return callback
 
 
+def _run_coroutine(callback: Callable[[], Any]) -> Any:
+    """Private function. Run a coroutine function in a new event loop and return its result."""
+    import asyncio # Imported here as asyncio is slow to import and is only needed by the coroutine callbacks
+    return asyncio.run(callback())
 
-class CheckBox(Item):
-    def __init__(self, text: str, check_default: bool | None = False, checked_callback: FunctionType | MethodType | LambdaType | None = None, checked_callback_args: tuple | None = None, unchecked_callback: FunctionType | MethodType | LambdaType | None = None, unchecked_callback_args: tuple | None = None, use_radio_look: bool = False, default: bool = False) -> None:
-        """Create a CheckBox item.\n
-        Parameters
-        ----------
-        * text: str\n
-            The text of the checkbox.
-        * check_default: bool | None (Facultative)\n
-            The status of the checkbox at start (checked (True) / not checked (False)) if None, the checkmark will not display.
-        * checked_callback: FunctionType, MethodType or LambdaType (Facultative)\n
-            The function to callback when the checkbox is clicked and switch from unchecked to checked.
-        * checked_callback_args: tuple (Facultative)\n
-            The arguments to pass to the checked_callback, MUST be a tuple.
-        * unchecked_callback: FunctionType, MethodType or LambdaType (Facultative)\n
-            The functiion to callback when the checkbox is clicked and switch from checked to unchecked.
-        * unchecked_callback_args: tuple (Facultative)\n
-            The arguments to pass to the unchecked_callback, MUST be a tuple.
-        * use_radio_look: bool (Facultative)\n
-            Define if the status of the checkbox should be displayed as a checkmark or a radio (A dot), this is currently not supported on macOS (darwin).
-        * default: bool (Facultative)\n
-            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator)."""
 
+def _is_process_pool(executor: Any) -> bool:
+    """Private function. Return True if the executor is a concurrent.futures.ProcessPoolExecutor (Without importing multiprocessing if it wasn't imported yet)."""
+    process = sys_modules.get("concurrent.futures.process")
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
 
-        self.tray: Optional[TrayManager] = None
 
-        self._text = text
+def _timed_call(callback: Callable[[], Any], started: list[float]) -> Any:
+    """Private function. Record when the callback starts and run it."""
+    started.append(perf_counter())
+    return callback()
 
-        self._checked_callback = checked_callback
-        self._checked_callback_args = checked_callback_args
-        self._unchecked_callback = unchecked_callback
-        self._unchecked_callback_args = unchecked_callback_args
-        self._use_radio_look = use_radio_look
-        self._default = default
-        self._item_state = True
 
-        if check_default == None:
-            check_default = False
-            disabled = True
-        else:
-            disabled = False
+async def _timed_coroutine(callback: Callable[[], Any], started: list[float]) -> Any:
+    """Private function. Record when the coroutine function starts and await it."""
+    started.append(perf_counter())
+    return await callback()
 
-        self._status =  {"current": None, "requested": check_default, "disabled": disabled} # The dict we'll use to change the checkbox status (The checkmark state of our checkbox)
-        self.item = self.__create_item()
-        return
 
-    def edit(self, text: str = Values.DEFAULT, check_default: bool | None = Values.DEFAULT, checked_callback: FunctionType | MethodType | LambdaType | None = Values.DEFAULT, checked_callback_args: tuple | None = Values.DEFAULT, unchecked_callback: FunctionType | MethodType | LambdaType | None = Values.DEFAULT, unchecked_callback_args: tuple | None = Values.DEFAULT, use_radio_look: bool = Values.DEFAULT, default: bool = Values.DEFAULT) -> None:
-        """Edit the CheckBox item.\n
-        Parameters
-        ----------
-        * text: str (Facultative)\n
-            The text of the checkbox, if not specified, don't change.
-        * check_default: bool | None (Facultative)\n
-            The status of the checkbox at start (checked (True) / not checked (False)) if None, the checkmark will not display, if not specified, don't change.
-        * checked_callback: FunctionType, MethodType or LambdaType (Facultative)\n
-            The function to callback when the checkbox is clicked and switch from unchecked to checked, if not specified, don't change.
+def _update_source(requester: Any, source: str) -> str:
+    """Private function. Return the name of the method of the item or menu that requested the menu update (e.g. "Menu.add")."""
+    if source:
+        return f"{type(requester).__name__}.{source}"
+    return type(requester).__name__
+
+
+def _dispatch(item: Union['Button', 'CheckBox'], name: str, callback: Callable[[], Any], executor: Executors | Executor | None) -> Future:
+    """Private function. Run the callback of the item on the dispatcher of its TrayManager (Or in the current thread if the item isn't in a menu)."""
+    if item.tray is None:
+        return _DEFAULT_DISPATCHER.submit((id(item), name), callback, executor)
+    return item.tray.dispatcher.submit((id(item), name), callback, executor)
+
+
+
+class Metrics:
+    def __init__(self) -> None:
+        """A class used to record what the TrayManager does and how long it takes (Created by TrayManager.enable_metrics(), nothing is recorded when the metrics are disabled).\n
+        The events recorded are :
+        * "update" : a menu update was requested, with the "source" (The type and method of the item or menu that requested it).
+        * "menu_update" : the menu was updated, with the "duration" of pystray's update_menu() in seconds.
+        * "build" : a menu or a submenu was rebuilt, with its "kind" ("Menu" or "Submenu"), the "duration" in seconds and the number of "nodes" (items) built.
+        * "callback" : a callback finished, with its "key", the "wait" (None for the process pools) and "run" times in seconds, and if it raised an "error".
+        * "icon" : the icon was set, with the "duration" in seconds."""
+        self._lock = Lock()
+        self._listeners: list[Callable[[str, dict[str, Any]], Any]] = []
+        self.reset()
+        return
+    
+    def add_listener(self, listener: Callable[[str, dict[str, Any]], Any]) -> None:
+        """Call the listener with the name and the data of each event recorded, the listener is called in the thread where the event happened and must return quickly.\n
+        Parameter
+        ---------
+        * listener: Callable[[str, dict[str, Any]], Any]\n
+            The function called with the name of the event and its data."""
+        with self._lock:
+            self._listeners = self._listeners + [listener] # Copy on write so that the events are recorded without holding the lock while calling the listeners
+        return
+    
+    def remove_listener(self, listener: Callable[[str, dict[str, Any]], Any]) -> None:
+        """Stop calling the listener.\n
+        Parameter
+        ---------
+        * listener: Callable[[str, dict[str, Any]], Any]\n
+            The listener to remove."""
+        with self._lock:
+            self._listeners = [l for l in self._listeners if l is not listener]
+        return
+    
+    def reset(self) -> None:
+        """Reset the counters and the timings."""
+        with self._lock:
+            self._updates: dict[str, int] = {} # The number of updates requested by each source
+            self._timings: dict[str, dict[str, float]] = {} # The count, total and max duration of each timed event
+            self._nodes = {"Menu": 0, "Submenu": 0}
+            self._callback_errors = 0
+        return
+    
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the counters and timings (in seconds) recorded since the metrics were enabled or reset."""
+        with self._lock:
+            timings = {name: dict(timing) for name, timing in self._timings.items()}
+            empty = {"count": 0, "total": 0.0, "max": 0.0}
+            return {"updates": {"requested": sum(self._updates.values()),
+                                "by_source": dict(self._updates),
+                                "performed": timings.get("menu_update", empty)},
+                    "builds": {kind: dict(timings.get(f"build:{kind}", empty), nodes=self._nodes[kind]) for kind in ("Menu", "Submenu")},
+                    "callbacks": {"wait": timings.get("callback:wait", empty),
+                                  "run": timings.get("callback:run", empty),
+                                  "errors": self._callback_errors},
+                    "icons": timings.get("icon", empty)}
+    
+    def _record(self, event: str, **data: Any) -> None:
+        """Private function. Record an event and call the listeners."""
+        with self._lock:
+            if event == "update":
+                self._updates[data["source"]] = self._updates.get(data["source"], 0) + 1
+            elif event == "build":
+                self._nodes[data["kind"]] += data["nodes"]
+                self.__time(f"build:{data['kind']}", data["duration"])
+            elif event == "callback":
+                if data["wait"] is not None:
+                    self.__time("callback:wait", data["wait"])
+                self.__time("callback:run", data["run"])
+                self._callback_errors += data["error"]
+            else:
+                self.__time(event, data["duration"])
+            listeners = self._listeners
+
+        for listener in listeners:
+            try:
+                listener(event, data)
+            except Exception as e:
+                print_exception(e)
+        return
+    
+    def __time(self, name: str, duration: float) -> None:
+        """Add a duration to the timing."""
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = self._timings[name] = {"count": 0, "total": 0.0, "max": 0.0}
+        timing["count"] += 1
+        timing["total"] += duration
+        timing["max"] = max(timing["max"], duration)
+        return
+
+
+
+class Profiler:
+    def __init__(self, max_events: int = 1_000_000) -> None:
+        """A class recording what the TrayManager does as Chrome trace events (Created by TrayManager's profile argument or the TRAY_MANAGER_PROFILE environment variable), open the file written by write() in a trace viewer (chrome://tracing, Perfetto).\n
+        The mutations of the items and the update requests are recorded as instant events, the menu updates (pystray's update_menu), the builds of the menu and of each submenu, the callbacks, the icon changes and the scheduler ticks as spans, with the thread they ran in.\n
+        Parameter
+        ---------
+        * max_events: int (Facultative)\n
+            The maximum number of events kept, the oldest events are dropped."""
+        self._events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._threads: dict[int, str] = {} # The name of each thread that recorded an event
+        self._origin = perf_counter()
+        self._pid = getpid()
+        return
+    
+    def get_events(self) -> list[dict[str, Any]]:
+        """Return a copy of the trace events recorded."""
+        return list(self._events)
+    
+    def clear(self) -> None:
+        """Remove the events recorded."""
+        self._events.clear()
+        return
+    
+    def write(self, path: str) -> str:
+        """Write the events recorded to a Chrome trace file (JSON) and return its path."""
+        from json import dump
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}} for tid, name in list(self._threads.items())]
+        with open(path, "w") as f:
+            dump({"traceEvents": metadata + list(self._events), "displayTimeUnit": "ms"}, f, separators=(",", ":"))
+        return path
+
+    def _span(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        """Private function. Record a span (A complete event) that started and ended at the perf_counter() times."""
+        tid = self.__thread()
+        self._events.append({"name": name, "cat": category, "ph": "X", "ts": (start - self._origin) * 1e6, "dur": (end - start) * 1e6, "pid": self._pid, "tid": tid, "args": args})
+        return
+    
+    def _instant(self, name: str, category: str, **args: Any) -> None:
+        """Private function. Record an instant event."""
+        tid = self.__thread()
+        self._events.append({"name": name, "cat": category, "ph": "i", "s": "t", "ts": (perf_counter() - self._origin) * 1e6, "pid": self._pid, "tid": tid, "args": args})
+        return
+    
+    def __thread(self) -> int:
+        """Return the id of the current thread and remember its name."""
+        tid = get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = current_thread().name
+        return tid
+
+
+def _profiled_call(callback: Callable[[], Any], profiler: Profiler, key: str) -> Any:
+    """Private function. Record the run of the callback as a span."""
+    start = perf_counter()
+    try:
+        return callback()
+    finally:
+        profiler._span("callback", "callback", start, perf_counter(), key=key)
+
+
+async def _profiled_coroutine(callback: Callable[[], Any], profiler: Profiler, key: str) -> Any:
+    """Private function. Record the run of the coroutine function as a span."""
+    start = perf_counter()
+    try:
+        return await callback()
+    finally:
+        profiler._span("callback", "callback", start, perf_counter(), key=key)
+
+
+
+class CallbackDispatcher:
+    def __init__(self, executor: Executors | Executor = Executors.INLINE, max_workers: int | None = None, max_pending: int = 0, policy: QueuePolicies = QueuePolicies.DROP) -> None:
+        """A class used to run the callbacks of the items on an executor (A dispatcher is automatically created when you create a TrayManager object).\n
+        Parameters
+        ----------
+        * executor: Executors | concurrent.futures.Executor (Facultative)\n
+            The executor used to run the callbacks, one of the Executors values or any concurrent.futures.Executor, by default, the callbacks are run in pystray's loop thread.
+        * max_workers: int | None (Facultative)\n
+            The number of workers of the pools created for Executors.THREAD_POOL and Executors.PROCESS_POOL, if None, use the default of concurrent.futures.
+        * max_pending: int (Facultative)\n
+            The maximum number of callbacks that can wait or run at the same time, if 0, there is no limit.
+        * policy: QueuePolicies (Facultative)\n
+            The policy applied to the new callbacks when max_pending is reached."""
+        
+        self._executor = executor
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._policy = policy
+
+        self._lock = Lock()
+        self._pools: dict[Executors, Executor] = {} # The pools created by the dispatcher, they're created the first time they're used
+        self._pending: dict[Future, Any] = {} # The futures of the callbacks that are waiting or running and their keys
+        self._dropped = 0
+        self._coalesced = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None # The event loop running the coroutine callbacks
+        self.metrics: Optional[Metrics] = None # The metrics recording the wait and run times of the callbacks
+        self.profiler: Optional[Profiler] = None # The profiler recording the dispatch and the run of the callbacks
+        return
+    
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run the coroutine functions (async def) used as callbacks on the event loop.\n
+        Parameter
+        ---------
+        * loop: asyncio.AbstractEventLoop\n
+            The event loop running the coroutine callbacks."""
+        self._loop = loop
+        return
+    
+    def submit(self, key: Any, callback: Callable[[], Any], executor: Executors | Executor | None = None) -> Future:
+        """Run a callback on the executor and return its Future, the Future is cancelled if the callback is dropped.\n
+        Parameters
+        ----------
+        * key: Any\n
+            The key identifying the origin of the callback (Used to merge the callbacks of the same item with QueuePolicies.COALESCE).
+        * callback: Callable\n
+            The callback to run, it must not take any argument.
+        * executor: Executors | concurrent.futures.Executor | None (Facultative)\n
+            The executor used to run this callback, if None, use the executor of the dispatcher."""
+        
+        if executor is None:
+            executor = self._executor
+
+        is_coroutine = iscoroutinefunction(callback)
+        if is_coroutine and self._loop is None: # Without event loop, run the coroutine in a new event loop on the executor
+            callback = partial(_run_coroutine, callback)
+            is_coroutine = False
+
+        metrics = self.metrics
+        if metrics is not None:
+            submitted = perf_counter()
+            started: list[float] = [] # Filled when the callback starts (Except in a process pool)
+            callback = partial(_timed_coroutine if is_coroutine else _timed_call, callback, started)
+
+        profiler = self.profiler
+        if profiler is not None:
+            profiler._instant("dispatch", "callback", key=repr(key))
+            if executor is not Executors.PROCESS_POOL and not _is_process_pool(executor): # The profiler can't record in another process
+                callback = partial(_profiled_coroutine if is_coroutine else _profiled_call, callback, profiler, repr(key))
+
+        if executor is Executors.INLINE and not is_coroutine:
+            if metrics is None:
+                return self.__run_inline(callback)
+            
+            try:
+                future = self.__run_inline(callback)
+            except BaseException:
+                self.__record(metrics, key, submitted, started, None)
+                raise
+            future.add_done_callback(partial(self.__record, metrics, key, submitted, started))
+            return future
+        
+        with self._lock:
+            if self._policy is QueuePolicies.COALESCE:
+                for future, pending_key in self._pending.items():
+                    if pending_key == key and not future.running() and not future.done(): # The previous callback of the item didn't start yet
+                        self._coalesced += 1
+                        return future
+                    
+            if self._max_pending > 0 and len(self._pending) >= self._max_pending:
+                self._dropped += 1
+                future = Future()
+                future.cancel()
+                return future
+            
+            if is_coroutine:
+                from asyncio import run_coroutine_threadsafe
+                future = run_coroutine_threadsafe(callback(), self._loop) # Schedule the coroutine on the event loop
+            else:
+                future = self.__get_executor(executor).submit(callback)
+            self._pending[future] = key
+        
+        future.add_done_callback(self.__done)
+        if metrics is not None:
+            future.add_done_callback(partial(self.__record, metrics, key, submitted, started))
+        return future
+    
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of callbacks that are waiting or running, that were dropped and that were coalesced."""
+        with self._lock:
+            return {"pending": len(self._pending), "dropped": self._dropped, "coalesced": self._coalesced}
+    
+    def shutdown(self, wait: bool = False) -> None:
+        """Shutdown the pools created by the dispatcher (The executors given by the user aren't shutdown)."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+
+        for pool in pools:
+            pool.shutdown(wait=wait)
+        return
+
+    def __get_executor(self, executor: Executors | Executor) -> Executor:
+        """Return the concurrent.futures.Executor corresponding to the executor, the pools are created the first time."""
+        if isinstance(executor, Executor):
+            return executor
+        
+        pool = self._pools.get(executor)
+        if pool is None:
+            if executor is Executors.THREAD_POOL:
+                pool = ThreadPoolExecutor(self._max_workers, thread_name_prefix="tray_manager")
+            else:
+                from concurrent.futures import ProcessPoolExecutor # Imported here as it imports multiprocessing
+                pool = ProcessPoolExecutor(self._max_workers)
+            self._pools[executor] = pool
+        return pool
+
+    def __run_inline(self, callback: Callable[[], Any]) -> Future:
+        """Run the callback in the current thread and return its Future, the exceptions are raised like if the callback was called directly."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            result = callback()
+            if iscoroutine(result): # A callable object returning a coroutine
+                import asyncio
+                if self._loop is not None:
+                    return asyncio.run_coroutine_threadsafe(result, self._loop)
+                result = asyncio.run(result)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        return future
+
+    def __done(self, future: Future) -> None:
+        """Remove the Future from the pending callbacks and print the exception raised by the callback (Like a thread would do)."""
+        with self._lock:
+            self._pending.pop(future, None)
+        
+        if not future.cancelled() and future.exception() is not None:
+            print_exception(future.exception())
+        return
+    
+    def __record(self, metrics: Metrics, key: Any, submitted: float, started: list[float], future: Future | None) -> None:
+        """Record the wait and run times of a callback that finished (The future is None if the callback raised an exception inline)."""
+        end = perf_counter()
+        error = future is None or (not future.cancelled() and future.exception() is not None)
+        if started:
+            metrics._record("callback", key=key, wait=started[0] - submitted, run=end - started[0], error=error)
+        else: # The callback ran in another process
+            metrics._record("callback", key=key, wait=None, run=end - submitted, error=error)
+        return
+
+
+
+_DEFAULT_DISPATCHER = CallbackDispatcher() # The dispatcher used by the items that aren't in a menu
+
+
+_DEFAULT_PROFILE_PATH = "tray_manager_trace.json" # The file the trace is written to when TRAY_MANAGER_PROFILE is set to a flag instead of a path
+
+def _profile_from_environ() -> bool | str:
+    """Private function. Return the profile argument set by the TRAY_MANAGER_PROFILE environment variable : False if it is unset or set to 0/false/no/off, the default path if it is set to 1/true/yes/on, else the path it is set to."""
+    value = os_environ.get("TRAY_MANAGER_PROFILE", "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return False
+    if value.lower() in ("1", "true", "yes", "on"):
+        return _DEFAULT_PROFILE_PATH
+    return value
+
+
+
+class Observable:
+    def __init__(self, value: Any = None, max_rate: float = 0) -> None:
+        """Create an Observable, a value that can be bound to the text of the items (and to the status of the checkboxes), the items read it each time the menu is displayed, so changing the value doesn't recreate them.\n
+        Parameters
+        ----------
+        * value: Any (Facultative)\n
+            The value at start.
+        * max_rate: float (Facultative)\n
+            The maximum number of menu updates per second triggered by the changes of the value, the changes made in between are coalesced into one update showing the last value, if 0, every change updates the menu."""
+        self._value = value
+        self._max_rate = max_rate
+        self._items: WeakSet[Label | Button | CheckBox | Submenu | VirtualSubmenu] = WeakSet() # The items bound to the value
+        self._lock = Lock()
+        self._last_notify = 0.0
+        self._timer: Optional[Timer] = None
+        return
+    
+    def get(self) -> Any:
+        """Return the value."""
+        return self._value
+    
+    def set(self, value: Any) -> None:
+        """Set the value and update the menus containing the items bound to it (At most max_rate times per second)."""
+        if value is self._value or value == self._value:
+            return
+        
+        self._value = value
+        with self._lock:
+            if self._timer is not None: # An update is already scheduled, it will show the new value
+                return
+
+            if self._max_rate > 0:
+                delay = self._last_notify + 1 / self._max_rate - monotonic()
+                if delay > 0:
+                    self._timer = Timer(delay, self.__notify)
+                    self._timer.daemon = True
+                    self._timer.start()
+                    return
+        self.__notify()
+        return
+    
+    def set_max_rate(self, max_rate: float) -> None:
+        """Set the maximum number of menu updates per second triggered by the changes of the value, if 0, every change updates the menu."""
+        self._max_rate = max_rate
+        return
+    
+    def _bind(self, item: Union['Label', 'Button', 'CheckBox', 'Submenu', 'VirtualSubmenu']) -> None:
+        """Private function. Update the menu containing the item when the value changes."""
+        with self._lock:
+            self._items.add(item)
+        return
+    
+    def _unbind(self, item: Union['Label', 'Button', 'CheckBox', 'Submenu', 'VirtualSubmenu']) -> None:
+        """Private function. Stop updating the menu containing the item when the value changes."""
+        with self._lock:
+            self._items.discard(item)
+        return
+
+    def _read(self, item: pystray_MenuItem) -> Any:
+        """Private function. Return the value (Called by pystray when it displays a bound item)."""
+        return self._value
+    
+    def _read_text(self, item: pystray_MenuItem) -> str:
+        """Private function. Return the value as a text (Called by pystray when it displays a bound item)."""
+        return str(self._value)
+    
+    def __notify(self) -> None:
+        """Request one menu update for each TrayManager displaying an item bound to the value."""
+        with self._lock:
+            self._timer = None
+            self._last_notify = monotonic()
+            items = list(self._items)
+        
+        trays = dict.fromkeys(item.tray for item in items if item.tray is not None) # The items of a TrayManager are displayed by the same menu update
+        for tray in trays:
+            tray._request_update(self, "set")
+        return
+
+
+class TrayEvent:
+    """An activation of an item (A click on a Button or a CheckBox) delivered by an EventStream."""
+    __slots__ = ("item", "status", "time", "count", "_ready_at")
+
+    def __init__(self, item: Union['Button', 'CheckBox'], status: bool | None, time: float, ready_at: float) -> None:
+        self.item = item # The item activated
+        self.status = status # The status of the checkbox after the activation (None for a button)
+        self.time = time # The time.monotonic() time of the last activation
+        self.count = 1 # The number of activations coalesced into the event
+        self._ready_at = ready_at # The time from which the event can be delivered (Once the debounce window of the item is elapsed)
+        return
+    
+    def __repr__(self) -> str:
+        return f"TrayEvent(item={self.item!r}, status={self.status!r}, count={self.count})"
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    """Private function. Wake an async consumer of an EventStream (Called in its event loop)."""
+    if not waiter.done():
+        waiter.set_result(None)
+    return
+
+
+class EventStream:
+    def __init__(self, max_size: int = 256, policy: StreamPolicies = StreamPolicies.DROP_OLDEST, debounce: float = 0) -> None:
+        """Create an EventStream, a bounded queue of the activations of the items of a TrayManager (See TrayManager.open_event_stream()), read it with a for loop, an async for loop or get().\n
+        Parameters
+        ----------
+        * max_size: int (Facultative)\n
+            The maximum number of events waiting in the queue.
+        * policy: StreamPolicies (Facultative)\n
+            The policy applied to the new events when the queue is full.
+        * debounce: float (Facultative)\n
+            The debounce window in seconds of the items (See set_debounce()), if 0, every activation is delivered as an event."""
+        if max_size < 1:
+            raise ValueError("The maximum size of the queue must be at least 1.")
+        
+        self._max_size = max_size
+        self._policy = policy
+        self._debounce = debounce
+        self._windows: WeakKeyDictionary[Button | CheckBox, float] = WeakKeyDictionary() # The debounce windows set for specific items
+
+        self._lock = Lock()
+        self._ready = Condition(self._lock) # Notified when an event is queued or taken and when the stream is closed
+        self._queue: deque[TrayEvent] = deque()
+        self._debounced: dict[int, TrayEvent] = {} # The queued event of each item with a debounce window, activations of the item within the window are coalesced into it
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = [] # The async consumers waiting for an event
+        self._closed = False
+        self._tray: Optional[TrayManager] = None
+
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        return
+    
+    def set_debounce(self, item: Union['Button', 'CheckBox'], window: float | None) -> None:
+        """Set the debounce window of an item : the activations of the item less than window seconds apart are coalesced into one event (TrayEvent.count), delivered once the window is elapsed since the last activation.\n
+        Parameters
+        ----------
+        * item: Button | CheckBox\n
+            The item.
+        * window: float | None\n
+            The window in seconds, if 0, every activation is delivered as an event, if None, use the window of the stream."""
+        with self._lock:
+            if window is None:
+                self._windows.pop(item, None)
+            else:
+                self._windows[item] = window
+        return
+    
+    def get(self, timeout: float | None = None) -> TrayEvent | None:
+        """Wait for the next event and return it, return None if the timeout expired or if the stream is closed and empty.\n
+        Parameter
+        ---------
+        * timeout: float | None (Facultative)\n
+            The maximum time to wait in seconds, if None, wait until an event is delivered."""
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._lock:
+            while True:
+                event, delay = self.__take()
+                if event is not None:
+                    return event
+                if self._closed and not self._queue:
+                    return None
+                
+                if deadline is not None:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        return None
+                    delay = remaining if delay is None else min(delay, remaining)
+                self._ready.wait(delay)
+
+    def close(self) -> None:
+        """Close the stream, the events already queued are still delivered, then the iterations stop."""
+        with self._lock:
+            self._closed = True
+            self.__notify()
+            tray = self._tray
+            self._tray = None
+        
+        if tray is not None:
+            tray._remove_stream(self)
+        return
+    
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of events queued, published, delivered, dropped and coalesced (Activations merged into a queued event)."""
+        with self._lock:
+            return {"queued": len(self._queue), "published": self._published, "delivered": self._delivered, "dropped": self._dropped, "coalesced": self._coalesced}
+
+    def __iter__(self) -> 'EventStream':
+        return self
+    
+    def __next__(self) -> TrayEvent:
+        event = self.get()
+        if event is None:
+            raise StopIteration
+        return event
+    
+    def __aiter__(self) -> 'EventStream':
+        return self
+    
+    async def __anext__(self) -> TrayEvent:
+        import asyncio
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                event, delay = self.__take()
+                if event is not None:
+                    return event
+                if self._closed and not self._queue:
+                    raise StopAsyncIteration
+                
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, delay) # Wait for a new event or for the debounce window of a queued event to elapse
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+    def _publish(self, item: Union['Button', 'CheckBox'], status: bool | None) -> None:
+        """Private function. Queue the activation of an item, apply the debounce window of the item and the policy of the stream."""
+        with self._lock:
+            if self._closed:
+                return
+            
+            now = monotonic()
+            window = self._windows.get(item, self._debounce)
+            if window > 0:
+                queued = self._debounced.get(id(item))
+                if queued is not None and now - queued.time <= window: # Coalesce the activation into the queued event of the item
+                    queued.status = status
+                    queued.time = now
+                    queued.count += 1
+                    queued._ready_at = now + window
+                    self._coalesced += 1
+                    return
+
+            while len(self._queue) >= self._max_size:
+                if self._policy is StreamPolicies.DROP_NEWEST:
+                    self._dropped += 1
+                    return
+                
+                if self._policy is StreamPolicies.DROP_OLDEST:
+                    dropped = self._queue.popleft()
+                    if self._debounced.get(id(dropped.item)) is dropped:
+                        del self._debounced[id(dropped.item)]
+                    self._dropped += 1
+                else:
+                    self._ready.wait() # StreamPolicies.BLOCK, wait for the consumer to take an event
+                    if self._closed:
+                        return
+
+            event = TrayEvent(item, status, now, now + window)
+            self._queue.append(event)
+            if window > 0:
+                self._debounced[id(item)] = event
+            self._published += 1
+            self.__notify()
+        return
+    
+    def _set_tray(self, tray: TrayManager) -> None:
+        """Private function. Set the TrayManager publishing its events in the stream."""
+        self._tray = tray
+        return
+
+    def __take(self) -> tuple[TrayEvent | None, float | None]:
+        """Remove and return the first event whose debounce window is elapsed, and the delay until the next event is ready (None if the queue is empty). Called with the lock held."""
+        if not self._queue:
+            return None, None
+        
+        now = monotonic()
+        next_ready = None
+        for index, event in enumerate(self._queue):
+            if event._ready_at <= now:
+                del self._queue[index]
+                if self._debounced.get(id(event.item)) is event:
+                    del self._debounced[id(event.item)]
+                self._delivered += 1
+                self._ready.notify_all() # Wake the producers blocked by a full queue
+                return event, None
+            
+            if next_ready is None or event._ready_at < next_ready:
+                next_ready = event._ready_at
+        return None, next_ready - now
+
+    def __notify(self) -> None:
+        """Wake the consumers waiting for an event. Called with the lock held."""
+        self._ready.notify_all()
+        for loop, waiter in self._waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+        self._waiters.clear()
+        return
+
+
+def _publish(item: Union['Button', 'CheckBox'], status: bool | None = None) -> None:
+    """Private function. Publish the activation of an item in the event streams of its TrayManager."""
+    if item.tray is not None:
+        for stream in item.tray._streams:
+            stream._publish(item, status)
+    return
+
+
+def _text_binding(text: str | Callable[[], str] | Observable) -> Any:
+    """Private function. Return the text given to pystray, a callable or an Observable is read by pystray each time it displays the item."""
+    if isinstance(text, Observable):
+        return text._read_text
+    
+    if callable(text):
+        return lambda item: str(text())
+    return text
+
+
+
+# Shared callables given to pystray instead of values, pystray would otherwise create a lambda for each value of each pystray_MenuItem
+def _true(item: pystray_MenuItem) -> bool:
+    return True
+
+def _false(item: pystray_MenuItem) -> bool:
+    return False
+
+def _unchecked(item: pystray_MenuItem) -> None:
+    return None
+
+def _no_action(icon: pystray_Icon_Class, item: pystray_MenuItem) -> None:
+    return None
+
+def _flag(value: bool) -> Callable[[pystray_MenuItem], bool]:
+    """Private function. Return the shared callable returning the value."""
+    return _true if value else _false
+
+
+_placeholder: Optional['Label'] = None
+
+def _placeholder_item() -> pystray_MenuItem:
+    """Private function. Return the empty pystray_MenuItem shown in the menus and submenus that don't contain any displayable item (It is shared by all of them)."""
+    global _placeholder
+    if _placeholder is None:
+        _placeholder = Label("")
+    return _placeholder.item
+
+
+
+class Item:
+    """The default class for the menu's items."""
+    __slots__ = ()
+
+    def _update(self: Union['Label', 'Button', 'CheckBox', 'Separator', 'Submenu'], rebuild: bool = True, source: str = "") -> None:
+        """Update the menu if the item that triggered the update is in the menu.\n
+        Parameters
+        ----------
+        * rebuild: bool (Facultative)\n
+            Define if the menus/submenus containing the item must be rebuilt (Set it to False when the pystray_MenuItem of the item hasn't changed, e.g. when the status of a checkbox changes).
+        * source: str (Facultative)\n
+            The name of the method that changed the item (Recorded by the metrics and the profiler)."""
+        if rebuild:
+            self._invalidate() # Mark the path from the item to the menu as dirty
+
+        if self.tray != None: # Check if tray is defined (tray may not be defined if the item has not been added to the menu or to a submenu that has been added to the menu)
+            self.tray: TrayManager
+            self.tray._request_update(self, source) # Update the menu (Or defer the update if a batch is opened)
+        return
+
+    def _invalidate(self: Union['Label', 'Button', 'CheckBox', 'Separator', 'Submenu']) -> None:
+        """Private function. Mark the menus/submenus containing the item as dirty so that only them are rebuilt on the next menu update."""
+        container = self._parent
+        while container is not None and not container._dirty: # If a container is already dirty, all of its parents are already dirty too
+            container._dirty = True
+            container = container._parent
+        return
+    
+    def _is_enabled(self: Union['Label', 'Button', 'CheckBox', 'Submenu', 'VirtualSubmenu'], item: pystray_MenuItem) -> bool:
+        """Private function. Return the enabled state of the item (Called by pystray when it reads the enabled state of the item, so enable() and disable() don't recreate the pystray_MenuItem)."""
+        return self._item_state
+    
+    def _set_tray(self: Union['Label', 'Button', 'CheckBox', 'Separator', 'Submenu'], tray: Optional['TrayManager']) -> None:
+        """Private function. Set the TrayManager that the item updates when it is edited."""
+        self.tray = tray
+        return
+    
+    def _rebind(self: Union['Label', 'Button', 'CheckBox', 'Submenu', 'VirtualSubmenu'], old: Any, new: Any) -> None:
+        """Private function. Unbind the item from the old value and bind it to the new value if they are Observables."""
+        if isinstance(old, Observable):
+            old._unbind(self)
+        
+        if isinstance(new, Observable):
+            new._bind(self)
+        return
+    
+    def _set_default(self: Union['Label', 'Button', 'CheckBox', 'Submenu'], default: bool) -> None:
+        """Private function. Set the default option of the item, raise DefaultNotSupported if the OS doesn't support default items or TooManyDefaultItems if the menu/submenu containing the item already has a default item (The item isn't changed if an exception is raised)."""
+        if default and not OsSupport.SUPPORT_DEFAULT:
+            raise DefaultNotSupported(self)
+        
+        parent = self._parent
+        if parent is not None:
+            if default:
+                if parent._default_child is not None and parent._default_child is not self:
+                    raise TooManyDefaultItems(parent, [parent._default_child, self])
+                parent._default_child = self
+            
+            elif parent._default_child is self:
+                parent._default_child = None
+
+        self._default = default
+        return
+
+class Label(Item):
+    __slots__ = ("tray", "_parent", "_text", "_default", "_item_state", "item", "__weakref__")
+
+    def __init__(self, text: str | Callable[[], str] | Observable, default: bool = False) -> None:
+        """Create a Label item.\n
+        Parameter
+        ----------
+        * text: str | Callable[[], str] | Observable\n
+            The text of the label, a callable or an Observable is read each time the menu is displayed.
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator)."""
+
+        self.tray: Optional[TrayManager] = None
+        self._parent: Optional[Menu | Submenu] = None
+
+        self._text = text
+        self._rebind(None, text)
+        self._default = default
+        self._item_state = True
+        self.item = self.__create_item() # Create our item
+        return
+
+    def edit(self, text: str | Callable[[], str] | Observable = Values.DEFAULT, default: bool = Values.DEFAULT) -> None:
+        """Edit the Label item.\n
+        Parameter
+        ----------
+        * text: str | Callable[[], str] | Observable (Facultative)\n
+            The text of the label, a callable or an Observable is read each time the menu is displayed, if not specified, don't change.
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change."""
+
+        if default is not Values.DEFAULT: # Checked first so that nothing changes if default items aren't supported or if the menu already has a default item
+            self._set_default(default)
+
+        if text is not Values.DEFAULT:
+            self._rebind(self._text, text)
+            self._text = text
+
+        self.item = self.__create_item() # Create the new item
+        self._update(source="edit") # Trigger a menu update
+        return
+    
+    def enable(self) -> None:
+        """Enable the Label item"""
+        self._item_state = True
+        self._update(rebuild=False, source="enable")
+        return
+
+    def disable(self) -> None:
+        """Disable the Label item"""
+        self._item_state = False
+        self._update(rebuild=False, source="disable")
+        return
+    
+    def __create_item(self) -> pystray_MenuItem:
+        """Create the pystray_MenuItem Label object."""
+        if self._default:
+            if not OsSupport.SUPPORT_DEFAULT:
+                raise DefaultNotSupported(self)
+            
+        from pystray import MenuItem as pystray_MenuItem
+        return pystray_MenuItem(_text_binding(self._text), _no_action, _unchecked, radio=_false, default=_flag(self._default), visible=_true, enabled=self._is_enabled)
+
+
+
+class Button(Item):
+    __slots__ = ("tray", "_parent", "_text", "_callback", "_callback_args", "_bound_callback", "_executor", "_default", "_item_state", "item", "__weakref__")
+
+    def __init__(self, text: str | Callable[[], str] | Observable, callback: Callable | None, args: tuple | None = None, default: bool = False, executor: Executors | Executor | None = None) -> None:
+        """Create a Button item.\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable\n
+            The text of the button, a callable or an Observable is read each time the menu is displayed.
+        * callback: Callable (Facultative)\n
+            The function (or any callable) to callback when button is clicked.
+        * args: tuple (Facultative)\n
+            The arguments to pass to the callback, MUST be a tuple.
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator).
+        * executor: Executors | concurrent.futures.Executor | None (Facultative)\n
+            The executor used to run the callback, if None, use the executor of the TrayManager."""
+
+        self.tray: Optional[TrayManager] = None
+        self._parent: Optional[Menu | Submenu] = None
+        self._text = text
+        self._rebind(None, text)
+        self._callback = callback
+        self._callback_args = args
+        self._bound_callback = _bind_callback(callback, args) # Bind the callback once instead of on every click
+        self._executor = executor
+        self._default = default
+        self._item_state = True
+        self.item = self.__create_item() # Create our item
+        return
+    
+    def edit(self, text: str | Callable[[], str] | Observable = Values.DEFAULT, callback: Callable | None = Values.DEFAULT, args: tuple | None = Values.DEFAULT, default: bool = Values.DEFAULT, executor: Executors | Executor | None = Values.DEFAULT) -> None:
+        """Edit the Button item.\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable (Facultative)\n
+            The text of the button, a callable or an Observable is read each time the menu is displayed, if not specified, don't change.
+        * callback: Callable (Facultative)\n
+            The function (or any callable) to callback when button is clicked, if None, don't callback, if not specified, don't change.
+        * args: tuple (Facultative)\n
+            The arguments to pass to the callback, MUST be a tuple, if not specified, don't change.
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change.
+        * executor: Executors | concurrent.futures.Executor | None (Facultative)\n
+            The executor used to run the callback, if None, use the executor of the TrayManager, if not specified, don't change."""
+
+        # Set new values, if the value is Balues.DEFAUT, don't change
+        if default is not Values.DEFAULT: # Checked first so that nothing changes if default items aren't supported or if the menu already has a default item
+            self._set_default(default)
+
+        if text is not Values.DEFAULT:
+            self._rebind(self._text, text)
+            self._text = text
+    
+        if callback is not Values.DEFAULT:
+            self._callback = callback
+
+        if args is not Values.DEFAULT:
+            self._callback_args = args
+
+        if executor is not Values.DEFAULT:
+            self._executor = executor
+
+        self._bound_callback = _bind_callback(self._callback, self._callback_args)
+        self.item = self.__create_item() # Create the new item
+        self._update(source="edit") # Trigger a menu update
+        return
+
+    def enable(self) -> None:
+        """Enable the Button item"""
+        self._item_state = True
+        self._update(rebuild=False, source="enable")
+        return
+
+    def disable(self) -> None:
+        """Disable the Button item"""
+        self._item_state = False
+        self._update(rebuild=False, source="disable")
+        return
+    
+    def click(self) -> Future | None:
+        """Click on the button, return the Future of the callback (None if the button is disabled or doesn't have a callback). The click is published in the event streams of the TrayManager."""
+        if not self._item_state:
+            return
+        
+        _publish(self)
+        if self._bound_callback is None:
+            return
+        return _dispatch(self, "callback", self._bound_callback, self._executor)
+    
+    def __callback(self, tray: pystray_Icon_Class, item: pystray_MenuItem) -> None:
+        """Manage the callback of the button."""
+        self.click()
+        return
+
+    def __create_item(self)  -> pystray_MenuItem:
+        """Create the pystray_MenuItem Button object."""
+        if self._default:
+            if not OsSupport.SUPPORT_DEFAULT:
+                raise DefaultNotSupported(self)
+            
+        from pystray import MenuItem as pystray_MenuItem
+        return pystray_MenuItem(_text_binding(self._text), self.__callback, _unchecked, radio=_false, default=_flag(self._default), visible=_true, enabled=self._is_enabled)
+
+
+
+class CheckBox(Item):
+    __slots__ = ("tray", "_parent", "_text", "_checked_callback", "_checked_callback_args", "_unchecked_callback", "_unchecked_callback_args", "_bound_checked_callback", "_bound_unchecked_callback", "_executor", "_use_radio_look", "_default", "_item_state",
+                 "_current_status", "_requested_status", "_status_disabled", "_status_binding", "_group", "item", "__weakref__")
+
+    def __init__(self, text: str | Callable[[], str] | Observable, check_default: bool | None | Observable = False, checked_callback: Callable | None = None, checked_callback_args: tuple | None = None, unchecked_callback: Callable | None = None, unchecked_callback_args: tuple | None = None, use_radio_look: bool = False, default: bool = False, executor: Executors | Executor | None = None) -> None:
+        """Create a CheckBox item.\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable\n
+            The text of the checkbox, a callable or an Observable is read each time the menu is displayed.
+        * check_default: bool | None | Observable (Facultative)\n
+            The status of the checkbox at start (checked (True) / not checked (False)) if None, the checkmark will not display. If an Observable, the status is bound to its value (Clicking on the checkbox sets the value).
+        * checked_callback: Callable (Facultative)\n
+            The function (or any callable) to callback when the checkbox is clicked and switch from unchecked to checked.
+        * checked_callback_args: tuple (Facultative)\n
+            The arguments to pass to the checked_callback, MUST be a tuple.
+        * unchecked_callback: Callable (Facultative)\n
+            The functiion to callback when the checkbox is clicked and switch from checked to unchecked.
+        * unchecked_callback_args: tuple (Facultative)\n
+            The arguments to pass to the unchecked_callback, MUST be a tuple.
+        * use_radio_look: bool (Facultative)\n
+            Define if the status of the checkbox should be displayed as a checkmark or a radio (A dot), this is currently not supported on macOS (darwin).
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator).
+        * executor: Executors | concurrent.futures.Executor | None (Facultative)\n
+            The executor used to run the callbacks, if None, use the executor of the TrayManager."""
+
+
+        self.tray: Optional[TrayManager] = None
+        self._parent: Optional[Menu | Submenu] = None
+
+        self._text = text
+        self._rebind(None, text)
+
+        self._checked_callback = checked_callback
+        self._checked_callback_args = checked_callback_args
+        self._unchecked_callback = unchecked_callback
+        self._unchecked_callback_args = unchecked_callback_args
+        self._bound_checked_callback = _bind_callback(checked_callback, checked_callback_args) # Bind the callbacks once instead of on every click
+        self._bound_unchecked_callback = _bind_callback(unchecked_callback, unchecked_callback_args)
+        self._executor = executor
+        self._use_radio_look = use_radio_look
+        self._default = default
+        self._item_state = True
+
+        self._status_binding: Optional[Observable] = None # The Observable the status is bound to
+        self._group: Optional[RadioGroup] = None # The RadioGroup the checkbox is an option of
+        if isinstance(check_default, Observable):
+            self._status_binding = check_default
+            self._rebind(None, check_default)
+            check_default = None
+            disabled = False
+        elif check_default == None:
+            check_default = False
+            disabled = True
+        else:
+            disabled = False
+
+        # The status of the checkbox (The checkmark state of our checkbox)
+        self._current_status: bool | None = None
+        self._requested_status: bool | None = check_default # Applied the next time the menu reads the status
+        self._status_disabled = disabled
+        self.item = self.__create_item()
+        return
+
+    def edit(self, text: str | Callable[[], str] | Observable = Values.DEFAULT, check_default: bool | None | Observable = Values.DEFAULT, checked_callback: Callable | None = Values.DEFAULT, checked_callback_args: tuple | None = Values.DEFAULT, unchecked_callback: Callable | None = Values.DEFAULT, unchecked_callback_args: tuple | None = Values.DEFAULT, use_radio_look: bool = Values.DEFAULT, default: bool = Values.DEFAULT, executor: Executors | Executor | None = Values.DEFAULT) -> None:
+        """Edit the CheckBox item.\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable (Facultative)\n
+            The text of the checkbox, a callable or an Observable is read each time the menu is displayed, if not specified, don't change.
+        * check_default: bool | None | Observable (Facultative)\n
+            The status of the checkbox at start (checked (True) / not checked (False)) if None, the checkmark will not display. If an Observable, the status is bound to its value (Clicking on the checkbox sets the value). If not specified, don't change.
+        * checked_callback: Callable (Facultative)\n
+            The function (or any callable) to callback when the checkbox is clicked and switch from unchecked to checked, if not specified, don't change.
         * checked_callback_args: tuple (Facultative)\n
             The arguments to pass to the checked_callback, MUST be a tuple, if not specified, don't change.
-        * unchecked_callback: FunctionType, MethodType or LambdaType (Facultative)\n
+        * unchecked_callback: Callable (Facultative)\n
             The functiion to callback when the checkbox is clicked and switch from checked to unchecked, if not specified, don't change.
         * unchecked_callback_args: tuple (Facultative)\n
             The arguments to pass to the unchecked_callback, MUST be a tuple, if not specified, don't change.
         * use_radio_look: bool (Facultative)\n
             Define if the status of the checkbox should be displayed as a checkmark or a radio (A dot), this is currently not supported on macOS (darwin).
         * default: bool (Facultative)\n
-            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change."""
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change.
+        * executor: Executors | concurrent.futures.Executor | None (Facultative)\n
+            The executor used to run the callbacks, if None, use the executor of the TrayManager, if not specified, don't change."""
         
         # Set new values, if the value is Balues.DEFAUT, don't change
+        if use_radio_look is not Values.DEFAULT and use_radio_look and not OsSupport.SUPPORT_RADIO: # Checked before anything changes (The default item of the parent included)
+            raise RadioNotSupported(self)
+
+        if default is not Values.DEFAULT: # Checked first so that nothing changes if default items aren't supported or if the menu already has a default item
+            self._set_default(default)
 
         if text is not Values.DEFAULT:
+            self._rebind(self._text, text)
             self._text = text
 
+        if self._status_binding is not None:
+            self._status_binding._bind(self) # The text may have been bound to the same Observable
+
         if check_default is not Values.DEFAULT:
-            if check_default == None:
-                self._status["disabled"] = True
+            if self._status_binding is not None:
+                self._current_status = self._status_binding.get() # Keep the status shown when the binding is removed
+                if self._status_binding is not self._text:
+                    self._status_binding._unbind(self)
+                self._status_binding = None
+            
+            if isinstance(check_default, Observable):
+                self._status_binding = check_default
+                check_default._bind(self)
+                self._status_disabled = False
+            elif check_default == None:
+                self._status_disabled = True
             else:
-                self._status["disabled"] = False
-                self._status["requested"] = check_default
+                self._status_disabled = False
+                self._requested_status = check_default
         
 
         if checked_callback is not Values.DEFAULT:
@@ -475,139 +2019,497 @@ class CheckBox(Item):
         if use_radio_look is not Values.DEFAULT:
             self._use_radio_look = use_radio_look
 
-        if default is not Values.DEFAULT:
-            self._default = default
+        if executor is not Values.DEFAULT:
+            self._executor = executor
 
+        self._bound_checked_callback = _bind_callback(self._checked_callback, self._checked_callback_args)
+        self._bound_unchecked_callback = _bind_callback(self._unchecked_callback, self._unchecked_callback_args)
         self.item = self.__create_item() # Create the new item
-        self._update() # Trigger a menu update
+        self._update(source="edit") # Trigger a menu update
         return
 
     def get_status(self) -> bool | None:
         """Return the current status of the checkbox (checked = True, unchecked = False, disabled = None)."""
-        return self._status["current"]
+        if self._group is not None:
+            return self._group._selected is self
+        
+        if self._status_binding is not None:
+            return self._status_binding.get()
+        return self._current_status
     
     def set_status(self, new_status: bool | None) -> None:
         """Set the status of the checkbox.\n
             Parameter
             ----------
             * new_status: bool | None\n
-                The new status of the checkbox (checked = True, unchecked = False, disabled = None)."""
+                The new status of the checkbox (checked = True, unchecked = False, disabled = None), if the status is bound to an Observable, its value is set. If the checkbox is an option of a RadioGroup, True selects it and False/None unselects it."""
+        
+        if self._group is not None:
+            if new_status:
+                self._group.select(self)
+            elif self._group._selected is self:
+                self._group.select(None)
+            return
+        
+        if self._status_binding is not None:
+            self._status_binding.set(new_status) # Update the menus of all the items bound to the value
+            return
         
         if new_status == None:
-            self._status["disabled"] = True # Disable the checkbox update (The checkmark of the checkbox update)
+            self._status_disabled = True # Disable the checkbox update (The checkmark of the checkbox update)
         
         else:
-            # Set the new value in the dict
-            self._status["disabled"] = False
-            self._status["requested"] = new_status
+            # Set the new status
+            self._status_disabled = False
+            self._requested_status = new_status
 
-        self._update() # Trigger a menu update
+        self._update(rebuild=False, source="set_status") # Trigger a menu update (The status is read when the menu is displayed so the pystray_MenuItem doesn't need to be rebuilt)
         return
 
     def enable(self) -> None:
         """Enable the CheckBox item"""
         self._item_state = True
-        self.item = self.__create_item()
-        self._update()
+        self._update(rebuild=False, source="enable")
         return
 
     def disable(self) -> None:
         """Disable the Checkbox item"""
         self._item_state = False
-        self.item = self.__create_item()
-        self._update()
+        self._update(rebuild=False, source="disable")
+        return
+    
+    def click(self) -> Future | None:
+        """Click on the checkbox (Switch its status), return the Future of the callback (None if the checkbox is disabled or doesn't have a callback for its new status). The click is published in the event streams of the TrayManager."""
+        if not self._item_state or self._status_disabled: # If the checkbox is disable don't do anything and return
+            return
+        
+        if self._group is not None: # Clicking on an option selects it, the group calls its on_change callback
+            _publish(self, True)
+            return self._group.select(self)
+        
+        if self._status_binding is not None:
+            status = not self._status_binding.get()
+            self._status_binding.set(status) # Update the menus of all the items bound to the value
+        else:
+            if self._requested_status != None: # Apply the status requested before the menu displayed the checkbox
+                self._current_status = self._requested_status
+                self._requested_status = None
+            status = self._current_status = not self._current_status # Change the status of the checkbox
+            self._update(rebuild=False, source="click") # Trigger a menu update
+        
+        _publish(self, status)
+        if status == True:
+            if self._bound_checked_callback is not None:
+                return _dispatch(self, "checked_callback", self._bound_checked_callback, self._executor)
+
+        elif status == False:
+            if self._bound_unchecked_callback is not None:
+                return _dispatch(self, "unchecked_callback", self._bound_unchecked_callback, self._executor)
         return
     
     def __callback(self, tray: pystray_Icon_Class, item: pystray_MenuItem) -> None:
         """Manage the callback and the new status of the checkbox when clicked on in the menu and call callback."""
+        self.click()
+        return
 
-        if self._status["disabled"]: # If the checkbox is disable don't do anything and return
-            return
+    def __update_status(self, item: pystray_MenuItem) -> bool:
+        """Update the status of the checkbox (Called by pystray when it reads the status of the item)."""
+        if self._group is not None:
+            return self._group._selected is self
+        
+        if self._status_binding is not None:
+            return self._status_binding.get()
+        
+        if self._requested_status != None: # Check if a change a status was requested
+            self._current_status = self._requested_status # Change the status
+            self._requested_status = None # Set the request to None
+        return self._current_status # Returns the current status
+    
+    def __create_item(self) -> pystray_MenuItem:
+        """Create the pystray_MenuItem CheckBox object."""
+        if self._use_radio_look:
+            if not OsSupport.SUPPORT_RADIO:
+                raise RadioNotSupported(self)
+            
+        if self._default:
+            if not OsSupport.SUPPORT_DEFAULT:
+                raise DefaultNotSupported(self)
+            
+        from pystray import MenuItem as pystray_MenuItem
+        return pystray_MenuItem(_text_binding(self._text), self.__callback, self.__update_status, radio=_flag(self._use_radio_look), default=_flag(self._default), visible=_true, enabled=self._is_enabled)
+
+
+
+class RadioGroup:
+    def __init__(self, options: Iterable[str | Callable[[], str] | Observable] = (), selected: int | None = None, on_change: Callable[[CheckBox | None, CheckBox | None], Any] | None = None, use_radio_look: bool = Values.DEFAULT, executor: Executors | Executor | None = None) -> None:
+        """Create a RadioGroup, a set of CheckBox options of which at most one is selected.\n
+        The options read the selection of the group when the menu is displayed, so changing the selection triggers a single menu update whatever the number of options. Add the options (See get_options()) to a menu or a submenu.\n
+        Parameters
+        ----------
+        * options: Iterable[str | Callable[[], str] | Observable] (Facultative)\n
+            The texts of the options to create.
+        * selected: int | None (Facultative)\n
+            The index of the option selected at start, if None, no option is selected.
+        * on_change: Callable[[CheckBox | None, CheckBox | None], Any] | None (Facultative)\n
+            The function (or any callable) to callback with the previously selected option and the newly selected option when the selection changes.
+        * use_radio_look: bool (Facultative)\n
+            Define if the options are displayed with a radio (A dot) instead of a checkmark, if not specified, use the radio look when the backend supports it.
+        * executor: Executors | concurrent.futures.Executor | None (Facultative)\n
+            The executor used to run on_change, if None, use the executor of the TrayManager."""
+        self._lock = Lock()
+        self._options: tuple[CheckBox, ...] = ()
+        self._selected: Optional[CheckBox] = None
+        self._on_change = on_change
+        self._use_radio_look = use_radio_look
+        self._executor = executor
+
+        for text in options:
+            self.add_option(text)
+
+        if selected is not None:
+            self._selected = self._options[selected]
+        return
+    
+    def add_option(self, text: str | Callable[[], str] | Observable, index: int = -1) -> CheckBox:
+        """Create an option of the group and return it (Add it to a menu or a submenu to display it).\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable\n
+            The text of the option.
+        * index: int (Facultative)\n
+            The index of the option in the group."""
+        use_radio_look = OsSupport.SUPPORT_RADIO if self._use_radio_look is Values.DEFAULT else self._use_radio_look
+        option = CheckBox(text, use_radio_look=use_radio_look, executor=self._executor)
+        option._group = self
+        with self._lock:
+            options = list(self._options)
+            if index == -1:
+                options.append(option)
+            else:
+                options.insert(index, option)
+            self._options = tuple(options)
+        return option
+    
+    def remove_option(self, option: CheckBox) -> CheckBox | None:
+        """Remove an option from the group (And from the menu or submenu containing it), if the option was selected, no option is selected anymore.\n
+        Parameter
+        ---------
+        * option: CheckBox\n
+            The option to remove."""
+        with self._lock:
+            if option not in self._options:
+                return
+            self._options = tuple(o for o in self._options if o is not option)
+            if self._selected is option:
+                self._selected = None
+
+        option._group = None
+        option._current_status = False # The option isn't selected anymore
+        if option._parent is not None:
+            option._parent.remove(option)
+        return option
+    
+    def get_options(self) -> list[CheckBox]:
+        """Return the options of the group."""
+        return list(self._options)
+    
+    def get_selected(self) -> CheckBox | None:
+        """Return the selected option (None if no option is selected)."""
+        return self._selected
+    
+    def select(self, option: CheckBox | int | None) -> Future | None:
+        """Select an option (The previously selected option is unselected) and update the menu once, return the Future of on_change (None if the selection didn't change or if there is no on_change callback).\n
+        Parameter
+        ---------
+        * option: CheckBox | int | None\n
+            The option to select or its index, if None, unselect the selected option."""
+        with self._lock:
+            if isinstance(option, int):
+                option = self._options[option]
+            elif option is not None and option._group is not self:
+                raise ValueError("The checkbox isn't an option of this RadioGroup.")
+
+            old = self._selected
+            if old is option:
+                return
+            self._selected = option # The options read the selection when the menu is displayed, so no pystray_MenuItem is recreated
+
+        trays = dict.fromkeys(o.tray for o in (old, option) if o is not None and o.tray is not None)
+        for tray in trays:
+            tray._request_update(self, "select") # One update whatever the number of options
+        
+        if self._on_change is not None:
+            return _dispatch(option if option is not None else old, "on_change", partial(self._on_change, old, option), self._executor)
+        return
+
+
+
+class Separator(Item):
+    __slots__ = ("item", "tray", "_parent", "_default")
+
+    def __init__(self) -> None:
+        """Create a Separator item."""
+
+        from pystray import Menu as pystray_Menu
+        self.item = pystray_Menu.SEPARATOR # Create the separator item
+        self.tray: Optional[TrayManager] = None
+        self._parent: Optional[Menu | Submenu] = None
+        self._default = False # A separator can't be the default item
+        return
+
+
+
+class _Container:
+    """Private class. The functions shared by the Menu and the Submenu to manage the items they contain (They define _changed(source), called once the items changed)."""
+    __slots__ = ()
+
+    def extend(self, items: list[Union[Label, Button, CheckBox, Separator, 'Submenu']], index: int = -1) -> None:
+        """Add several items with a single menu update. The items are all checked before any of them is added.\n
+        Parameters
+        ----------
+        * items: list[Label | Button | CheckBox | Separator | Submenu]\n
+            The items to add.
+        * index: int (Facultative)\n
+            The index at which the items are going to be inserted (Define the order of the items), if not specified, the items are appened at the end."""
+        
+        items = list(items)
+        with self._write_lock:
+            added: set[int] = set()
+            for item in items: # Check all the items before changing anything
+                self._check_item(item)
+                if not isinstance(item, Separator):
+                    if id(item) in added: # The same item is given twice
+                        raise ItemAlreadyAddedException(item, self)
+                    added.add(id(item))
+            self._check_default(items)
+
+            for item in items:
+                self._attach(item)
+            self._items = self._inserted(items, index)
+
+        self._changed("extend") # Trigger a single menu update
+        return
+    
+    def remove_many(self, items: list[Union[Label, Button, CheckBox, Separator, 'Submenu']]) -> list[Union[Label, Button, CheckBox, Separator, 'Submenu']]:
+        """Remove several items with a single menu update, return the items that were removed.\n
+        Parameters
+        ----------
+        * items: list[Label | Button | CheckBox | Separator | Submenu]\n
+            The items to remove, the items that are not contained are ignored."""
+        
+        to_remove = {id(item) for item in items}
+        kept: list[Label | Button | CheckBox | Separator | Submenu] = []
+        removed: list[Label | Button | CheckBox | Separator | Submenu] = []
+
+        with self._write_lock:
+            for item in self._items: # Split the items in a single pass
+                if id(item) in to_remove:
+                    removed.append(item)
+                else:
+                    kept.append(item)
+
+            if not removed:
+                return removed
+            
+            self._items = tuple(kept)
+            for item in removed:
+                self._detach(item)
+
+        self._changed("remove_many") # Trigger a single menu update
+        return removed # Return the removed items
+    
+    def replace(self, old_item: Union[Label, Button, CheckBox, Separator, 'Submenu'], new_item: Union[Label, Button, CheckBox, Separator, 'Submenu']) -> Union[Label, Button, CheckBox, Separator, 'Submenu'] | None:
+        """Replace an item by another one at the same position, return the replaced item.\n
+        Parameters
+        ----------
+        * old_item: Label | Button | CheckBox | Separator | Submenu\n
+            The item to replace.
+        * new_item: Label | Button | CheckBox | Separator | Submenu\n
+            The item to put in place of old_item."""
         
-        self._status["current"] = not self._status["current"] # Change the status of the checkbox
-        self._update() # Trigger a menu update
+        with self._write_lock:
+            try:
+                index = self._items.index(old_item) # Try to get the item index
+            except ValueError:
+                return
+            
+            if new_item is old_item:
+                return old_item
+            
+            self._check_item(new_item)
+            self._check_default([new_item], old_item)
+
+            self._items = self._items[:index] + (new_item,) + self._items[index + 1:]
+            self._detach(old_item)
+            self._attach(new_item)
+
+        self._changed("replace") # Trigger a single menu update
+        return old_item # Return the replaced item
+    
+    def move(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu'], new_index: int) -> None:
+        """Move an item to a new position.\n
+        Parameters
+        ----------
+        * item: Label | Button | CheckBox | Separator | Submenu\n
+            The item to move, if the item is not contained, don't do anything.
+        * new_index: int\n
+            The new index of the item, if -1, move it at the end."""
         
-        if self._status["current"] == True:
-            if isinstance(self._checked_callback, FunctionType | MethodType | LambdaType): # Check if the checked_callback is a function
-                if isinstance(self._checked_callback_args, tuple): # Check if the args is a tuple
-                    self._checked_callback(*self._checked_callback_args) # Call the callback with the given arguments
-                else:
-                    self._checked_callback() # Call the callback without arguments
+        with self._write_lock:
+            try:
+                index = self._items.index(item) # Try to get the item index
+            except ValueError:
+                return
+            
+            self._items = self._items[:index] + self._items[index + 1:]
+            self._items = self._inserted([item], new_index)
 
-        elif self._status["current"] == False:
-            if isinstance(self._unchecked_callback, FunctionType | MethodType | LambdaType): # Check if the unchecked_callback is a function
-                if isinstance(self._unchecked_callback_args, tuple): # Check if the args is a tuple
-                    self._unchecked_callback(*self._unchecked_callback_args) # Call the callback with the given arguments
-                else:
-                    self._unchecked_callback() # Call the callback without arguments
+        self._changed("move") # Trigger a menu update
         return
+    
+    def clear(self) -> list[Union[Label, Button, CheckBox, Separator, 'Submenu']]:
+        """Remove all the items with a single menu update, return the items that were removed."""
+        with self._write_lock:
+            removed = list(self._items)
+            if not removed:
+                return removed
+            
+            self._items = ()
+            for item in removed:
+                self._detach(item)
 
-    def __update_status(self) -> bool:
-        """Update the status of the checkbox."""
-        if self._status["requested"] != None: # Check if a change a status was requested
-            self._status["current"] = self._status["requested"] # Change the status
-            self._status["requested"] = None # Set the request to None
-        return self._status["current"] # Returns the current status
+        self._changed("clear") # Trigger a single menu update
+        return removed # Return the removed items
     
-    def __create_item(self) -> pystray_MenuItem:
-        """Create the pystray_MenuItem CheckBox object."""
-        if self._use_radio_look:
-            if not OsSupport.SUPPORT_RADIO:
-                raise RadioNotSupported(self)
+    def get_items(self) -> list[Union[Label, Button, CheckBox, Separator, 'Submenu']]:
+        """Return a copy of the items contained in the menu/submenu."""
+        return list(self._items)
+    
+    def _inserted(self, items: list[Union[Label, Button, CheckBox, Separator, 'Submenu']], index: int) -> tuple[Union[Label, Button, CheckBox, Separator, 'Submenu'], ...]:
+        """Private function. Return a new tuple of the items of the menu/submenu with the items inserted at the index (-1 to append them).\n
+        The items are never changed in place, a new tuple is published instead so that the menu can be built from a consistent snapshot while another thread changes it (The changes themselves are serialized by _write_lock)."""
+        if index == -1:
+            return self._items + tuple(items)
+        return self._items[:index] + tuple(items) + self._items[index:]
+
+    def _reconcile(self, items: list[Union[Label, Button, CheckBox, Separator, 'Submenu']]) -> None:
+        """Private function. Replace the items of the menu/submenu by the given items with a single menu update, only the items that weren't contained are attached and the items that aren't kept are detached (Nothing is done if the items didn't change)."""
+        for item in items:
+            if item._parent is not None and item._parent is not self and not isinstance(item, Separator): # The item is moved from another menu/submenu
+                item._parent.remove_many([item])
+
+        with self._write_lock:
+            if len(items) == len(self._items) and all(item is contained for item, contained in zip(items, self._items)):
+                return
             
-        if self._default:
-            if not OsSupport.SUPPORT_DEFAULT:
-                raise DefaultNotSupported(self)
+            kept = {id(item) for item in items}
+            contained = {id(item) for item in self._items}
+            added = [item for item in items if id(item) not in contained]
+            for item in added: # Check the new items before changing anything
+                self._check_item(item)
+
+            items_with_default_option = [item for item in items if item._default]
+            if len(items_with_default_option) > 1:
+                raise TooManyDefaultItems(self, items_with_default_option)
             
-        return pystray_MenuItem(self._text, self.__callback, lambda item: self.__update_status(), radio=self._use_radio_look, default=self._default, enabled=self._item_state)
-
+            for item in self._items:
+                if id(item) not in kept:
+                    self._detach(item)
+            for item in added:
+                self._attach(item)
+            self._items = tuple(items)
+
+        self._changed("apply_spec") # Trigger a single menu update (The items are reconciled by Menu.apply_spec)
+        return
 
+    def _check_item(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu']) -> None:
+        """Private function. Raise an exception if the item can't be added."""
+        if item._parent is not None and not isinstance(item, Separator): # Separators never trigger updates so they can be shared
+            raise ItemAlreadyAddedException(item, item._parent)
+        return
+    
+    def _check_default(self, items: list[Union[Label, Button, CheckBox, Separator, 'Submenu']], replaced: Union[Label, Button, CheckBox, Separator, 'Submenu', None] = None) -> None:
+        """Private function. Raise TooManyDefaultItems if adding the items would give more than one default item to the menu/submenu.\n
+        Parameters
+        ----------
+        * items: list[Label | Button | CheckBox | Separator | Submenu]\n
+            The items that are going to be added.
+        * replaced: Label | Button | CheckBox | Separator | Submenu (Facultative)\n
+            The item that is going to be removed at the same time."""
+        
+        items_with_default_option = [item for item in items if item._default]
+        if self._default_child is not None and self._default_child is not replaced:
+            items_with_default_option.insert(0, self._default_child)
 
-class Separator(Item):
-    def __init__(self) -> None:
-        """Create a Separator item."""
+        if len(items_with_default_option) > 1:
+            raise TooManyDefaultItems(self, items_with_default_option)
+        return
 
-        self.item = pystray_Menu.SEPARATOR # Create the separator item
-        self.tray: Optional[TrayManager] = None
+    def _attach(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu']) -> None:
+        """Private function. Link the item to the menu/submenu."""
+        item._parent = self
+        item._set_tray(self.tray)
+        if item._default:
+            self._default_child = item
         return
+    
+    def _detach(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu']) -> None:
+        """Private function. Unlink the item from the menu/submenu."""
+        if self._default_child is item:
+            self._default_child = None
+        item._parent = None
+        item._set_tray(None) # We remove the tray argument to prevent the item from triggering a menu update when the item is edited but is not in the menu
+        return
+    
 
 
+class Submenu(Item, _Container):
+    __slots__ = ("_items", "_write_lock", "_text", "_default", "tray", "_parent", "_item_state", "_default_child", "_dirty", "_built", "__weakref__")
 
-class Submenu(Item):
-    def __init__(self, text: str, default: bool = False) -> None:
+    def __init__(self, text: str | Callable[[], str] | Observable, default: bool = False) -> None:
         """Create a Submenu item.\n
         Parameter
         ---------
-        * text: str\n
-            The text of the submenu.
+        * text: str | Callable[[], str] | Observable\n
+            The text of the submenu, a callable or an Observable is read each time the menu is displayed.
         * default: bool (Facultative)\n
             Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator)."""
 
-        self._items: list[Label | Button | CheckBox | Separator | Submenu] = []
+        self._items: tuple[Label | Button | CheckBox | Separator | Submenu, ...] = () # Replaced by a new tuple on each change (Copy on write)
+        self._write_lock = Lock() # Serialize the changes of the items, the menu is built without it
         self._text = text
+        self._rebind(None, text)
         self._default = default
         self.tray: Optional[TrayManager] = None
+        self._parent: Optional[Menu | Submenu] = None
         self._item_state = True
 
-        self.__default_item = Label("") # Set the default label to be added when the submenu doesn't contain any displayable item (such as Separators)
+        self._default_child: Optional[Label | Button | CheckBox | Submenu] = None # The item of the submenu that has the default option
+        self._dirty = True # Define if the submenu must be rebuilt on the next menu update
+        self._built: Optional[pystray_MenuItem] = None # The pystray_MenuItem built on the last menu update
+
+        if self._default:
+            if not OsSupport.SUPPORT_DEFAULT:
+                raise DefaultNotSupported(self)
         return
 
-    def edit(self, text: str = Values.DEFAULT, default: bool = Values.DEFAULT) -> None:
+    def edit(self, text: str | Callable[[], str] | Observable = Values.DEFAULT, default: bool = Values.DEFAULT) -> None:
         """Edit the Submenu item.\n
         Parameter
         ---------
-        * text: str (Facultative)\n
-            The text of the submenu, if not specified, don't change.
+        * text: str | Callable[[], str] | Observable (Facultative)\n
+            The text of the submenu, a callable or an Observable is read each time the menu is displayed, if not specified, don't change.
         * default: bool (Facultative)\n
             Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator). If not specified, don't change."""
         
+        if default is not Values.DEFAULT: # Checked first so that nothing changes if default items aren't supported or if the menu already has a default item
+            self._set_default(default)
+
         if text is not Values.DEFAULT:
+            self._rebind(self._text, text)
             self._text = text
-        
-        if default is not Values.DEFAULT:
-            self._default = default
 
-        self._update() # Trigger a menu update
+        self._update(source="edit") # Trigger a menu update
         return
     
     def add(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu'], index: int = -1) -> None:
@@ -620,23 +2522,13 @@ class Submenu(Item):
         * index: int (Facultative)\n
             The index at which the item is going to be appened (Define the order of the items in the submenu)."""
         
-        if isinstance(item, Menu):
-            raise MenuAddException(self)
-        
-        if isinstance(item, Submenu):
-            if self.__check_recursion_loop(item): # Verify that their is no circular add
-                raise CircularAddException(self, item)
-
-        if self.tray:
-            item.tray = self.tray
-        
-        # Add the item to the submenu
-        if index == -1:
-            self._items.append(item)
-        else:
-            self._items.insert(index, item)
+        with self._write_lock:
+            self._check_item(item)
+            self._check_default([item])
+            self._attach(item)
+            self._items = self._inserted([item], index) # Add the item to the submenu
 
-        self._update() # Trigger a menu update
+        self._update(source="add") # Trigger a menu update
         return
 
     def remove(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu']) -> Union[Label, Button, CheckBox, Separator, 'Submenu'] | None:
@@ -646,188 +2538,1001 @@ class Submenu(Item):
         * item: Label | Button | CheckBox | Separator | Submenu\n
             The item to remove from the submenu."""
         
-        try: 
-            index = self._items.index(item) # Try to get the item index
-        except ValueError:
-            return
-    
-        removed = self._items.pop(index) # Remove the item
-        self._update() # Trigger a menu update
+        with self._write_lock:
+            try: 
+                index = self._items.index(item) # Try to get the item index
+            except ValueError:
+                return
+        
+            removed = self._items[index]
+            self._items = self._items[:index] + self._items[index + 1:] # Remove the item
+            self._detach(removed)
+        self._update(source="remove") # Trigger a menu update
         return removed # Return the removed item
     
-    def get_items(self) -> list[Union[Label, Button, CheckBox, Separator, 'Submenu']]:
-        """Return the items contained in the submenu."""
-        return self._items
-    
     def enable(self) -> None:
         """Enable the Submenu"""
         self._item_state = True
-        self._update()
+        self._update(rebuild=False, source="enable")
         return
 
     def disable(self) -> None:
         """Disable the Submenu"""
         self._item_state = False
-        self._update()
+        self._update(rebuild=False, source="disable")
         return
     
+    def _invalidate(self) -> None:
+        """Private function. Mark the submenu and the menus/submenus containing it as dirty so that only them are rebuilt on the next menu update."""
+        container = self
+        while container is not None and not container._dirty: # If a container is already dirty, all of its parents are already dirty too
+            container._dirty = True
+            container = container._parent
+        return
+    
+    def _set_tray(self, tray: Optional['TrayManager']) -> None:
+        """Private function. Set the TrayManager that the submenu and the items it contains update when they are edited."""
+        self.tray = tray
+        for item in self._items:
+            item._set_tray(tray)
+        return
+
+    def _check_item(self, item: Union[Label, Button, CheckBox, Separator, 'Submenu']) -> None:
+        """Private function. Raise an exception if the item can't be added to the submenu."""
+        if isinstance(item, Menu):
+            raise MenuAddException(self)
+        
+        if isinstance(item, Submenu):
+            if self.__check_recursion_loop(item): # Verify that their is no circular add
+                raise CircularAddException(self, item)
+        
+        super()._check_item(item)
+        return
+    
+    def _changed(self, source: str) -> None:
+        """Private function. Trigger a menu update after the items of the submenu changed."""
+        self._update(source=source)
+        return
+
     def __check_recursion_loop(self, submenu: 'Submenu') -> bool:
-        """Check if the submenu is not in the given submenu (Used to detect recursion loop)."""
-        for item in submenu.get_items():
-            if item == self: # Check if the item is the same self
+        """Check if the submenu is not in the given submenu (Used to detect recursion loop), only the parents of the current submenu are checked."""
+        container = self
+        while container is not None:
+            if container is submenu: # The given submenu is the current submenu or contains it
                 return True
-            
-            if isinstance(item, Submenu):
-                if self.__check_recursion_loop(item): # Check recursively if the submenu is in the added submenu
-                    return True
+            container = container._parent
         return False
     
     def _create_submenu(self) -> pystray_MenuItem:
-        """Create the pystray_MenuItem Submenu object."""
-        items: list[Label | Button | CheckBox | Separator | Submenu] = []
-
-        __items_with_default_option: list[Label | Button | CheckBox | Separator | Submenu] = []
-
+        """Create the pystray_MenuItem Submenu object, the pystray_MenuItem built on the last menu update is reused if the submenu hasn't changed."""
+        if not self._dirty and self._built is not None:
+            return self._built
         
-        for item in self._items:
-            if item._default:
-                __items_with_default_option.append(item)
+        self._dirty = False # Reset the flag before building so that a change made during the build triggers a new build
+        metrics = self.tray.metrics if self.tray is not None else None
+        profiler = self.tray.profiler if self.tray is not None else None
+        if metrics is not None or profiler is not None:
+            start = perf_counter()
+        
+        items: list[pystray_MenuItem] = [] # The items are checked when they are added, so no check is needed here
+        snapshot = self._items # The items can be replaced by another thread during the build, so the same snapshot is used for the whole build
 
+        for item in snapshot:
             if isinstance(item, Submenu): 
-                item.tray = self.tray
-                item = item._create_submenu() # Create the pystray_MenuItem of that submenu
+                items.append(item._create_submenu()) # Create the pystray_MenuItem of that submenu (Or reuse it if it hasn't changed)
+            else:
+                items.append(item.item) # Get the pystray_MenuItem of the item
+        
+        if len(items) == 0 or all(isinstance(i, Separator) for i in snapshot): # Check if the submenu is empty or if all the items in the submenu are not displayable without other items (Such as Separators)
+            items.append(_placeholder_item()) # Add the default item to allow the submenu to be displayed
+        
+        from pystray import Menu as pystray_Menu, MenuItem as pystray_MenuItem
+        self._built = pystray_MenuItem(_text_binding(self._text), pystray_Menu(*items), _unchecked, radio=_false, default=_flag(self._default), visible=_true, enabled=self._is_enabled)
 
-            elif isinstance(item, Label) or isinstance(item, Button) or isinstance(item, CheckBox) or isinstance(item, Separator):
-                item.tray = self.tray
-                item = item.item # Get the pystray_MenuItem of the item
+        if metrics is not None:
+            metrics._record("build", kind="Submenu", duration=perf_counter() - start, nodes=len(items))
+        if profiler is not None:
+            profiler._span("build Submenu", "build", start, perf_counter(), text=_snapshot_text(self._text), nodes=len(items))
+        return self._built
 
-            items.append(item)
+
+
+_page_menu: Optional[type] = None
+
+def _page_menu_class() -> type[pystray_Menu]:
+    """Private function. Return the pystray Menu class used for the pages of the VirtualSubmenus, it is always visible so that pystray doesn't read a page to know if the submenu containing it is visible."""
+    global _page_menu
+    if _page_menu is None:
+        from pystray import Menu as pystray_Menu
+        _page_menu = type("PageMenu", (pystray_Menu,), {"visible": property(_true)})
+    return _page_menu
+
+
+def _default_item_factory(entry: Any) -> Union[Label, Button, CheckBox, Separator, Submenu]:
+    """Private function. Return the entry if it is an item, else a Label displaying the entry."""
+    if isinstance(entry, Item):
+        return entry
+    return Label(str(entry))
+
+
+class VirtualSubmenu(Item):
+    __slots__ = ("tray", "_parent", "_text", "_default", "_item_state", "_provider", "_item_factory", "_page_size", "_ttl", "_more_text", "_previous_text",
+                 "_lock", "_source", "_entries", "_items", "_exhausted", "_loaded_at", "_pages", "_page_index", "_dirty", "_default_child", "item", "__weakref__")
+
+    def __init__(self, text: str | Callable[[], str] | Observable, provider: Callable[[], Iterable[Any]] | Iterable[Any], item_factory: Callable[[Any], Union[Label, Button, CheckBox, Separator, Submenu]] | None = None, page_size: int = 50, ttl: float | None = 30, more_text: str = "More…", default: bool = False, previous_text: str = "Previous…") -> None:
+        """Create a VirtualSubmenu item, a submenu whose items are created from the entries of a provider only when the submenu is displayed.\n
+        The entries are split in pages of page_size items and the submenu shows one page at a time : the page ends with a "More…" item showing the next page when clicked (and starts with a "Previous…" item), so only the entries of the pages shown are read and turned into items, even on the backends that build the whole native menu on every update.\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable\n
+            The text of the submenu, a callable or an Observable is read each time the menu is displayed.
+        * provider: Callable[[], Iterable[Any]] | Iterable[Any]\n
+            A callable returning the entries (e.g. a generator function reading the recent files), or an iterable of entries (An iterator is only read once, so it is never refreshed).
+        * item_factory: Callable[[Any], Label | Button | CheckBox | Separator | Submenu] | None (Facultative)\n
+            The function creating the item of an entry, if None, the entries that are items are used as is and the other entries are displayed as Labels.
+        * page_size: int (Facultative)\n
+            The number of entries displayed per page.
+        * ttl: float | None (Facultative)\n
+            The delay in seconds after which the entries are read again from the provider when the submenu is displayed, if None, they're only read again when refresh() is called.
+        * more_text: str (Facultative)\n
+            The text of the item showing the next page.
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu (It is drawn in a distinguished style and will be activated as the default item). There can only be one default item by menu. This is currently not supported on MacOs (darwin) and Linux (appindicator and ayatana-appindicator).
+        * previous_text: str (Facultative)\n
+            The text of the item showing the previous page."""
+
+        if page_size < 1:
+            raise ValueError("The page size must be at least 1.")
+        
+        self.tray: Optional[TrayManager] = None
+        self._parent: Optional[Menu | Submenu] = None
+        self._text = text
+        self._rebind(None, text)
+        self._default = default
+        self._item_state = True
+
+        self._provider = provider
+        self._item_factory = item_factory if item_factory is not None else _default_item_factory
+        self._page_size = page_size
+        self._ttl = ttl
+        self._more_text = more_text
+        self._previous_text = previous_text
+
+        self._lock = Lock()
+        self._dirty = False # Set when an item created from the entries is edited
+        self._default_child: Optional[Label | Button | CheckBox | Submenu] = None
+        self.__reset()
+        self.item = self.__create_item()
+        return
+    
+    def edit(self, text: str | Callable[[], str] | Observable = Values.DEFAULT, provider: Callable[[], Iterable[Any]] | Iterable[Any] = Values.DEFAULT, item_factory: Callable[[Any], Union[Label, Button, CheckBox, Separator, Submenu]] | None = Values.DEFAULT, page_size: int = Values.DEFAULT, ttl: float | None = Values.DEFAULT, more_text: str = Values.DEFAULT, default: bool = Values.DEFAULT, previous_text: str = Values.DEFAULT) -> None:
+        """Edit the VirtualSubmenu item, the entries are read again from the provider the next time the submenu is displayed (From the first page).\n
+        Parameters
+        ----------
+        * text: str | Callable[[], str] | Observable (Facultative)\n
+            The text of the submenu, a callable or an Observable is read each time the menu is displayed, if not specified, don't change.
+        * provider: Callable[[], Iterable[Any]] | Iterable[Any] (Facultative)\n
+            A callable returning the entries, or an iterable of entries, if not specified, don't change.
+        * item_factory: Callable[[Any], Label | Button | CheckBox | Separator | Submenu] | None (Facultative)\n
+            The function creating the item of an entry, if None, use the default factory, if not specified, don't change.
+        * page_size: int (Facultative)\n
+            The number of entries displayed per page, if not specified, don't change.
+        * ttl: float | None (Facultative)\n
+            The delay in seconds after which the entries are read again from the provider, if None, only when refresh() is called, if not specified, don't change.
+        * more_text: str (Facultative)\n
+            The text of the item showing the next page, if not specified, don't change.
+        * default: bool (Facultative)\n
+            Define if the item is the default item of that menu. If not specified, don't change.
+        * previous_text: str (Facultative)\n
+            The text of the item showing the previous page, if not specified, don't change."""
         
-        if len(__items_with_default_option) > 1:
-            raise TooManyDefaultItems(self, __items_with_default_option)
+        if page_size is not Values.DEFAULT and page_size < 1:
+            raise ValueError("The page size must be at least 1.")
         
+        if default is not Values.DEFAULT: # Checked first so that nothing changes if default items aren't supported or if the menu already has a default item
+            self._set_default(default)
+
+        if text is not Values.DEFAULT:
+            self._rebind(self._text, text)
+            self._text = text
+
+        if provider is not Values.DEFAULT:
+            self._provider = provider
+
+        if item_factory is not Values.DEFAULT:
+            self._item_factory = item_factory if item_factory is not None else _default_item_factory
+
+        if page_size is not Values.DEFAULT:
+            self._page_size = page_size
+
+        if ttl is not Values.DEFAULT:
+            self._ttl = ttl
+
+        if more_text is not Values.DEFAULT:
+            self._more_text = more_text
+
+        if previous_text is not Values.DEFAULT:
+            self._previous_text = previous_text
+
+        with self._lock:
+            self.__reset()
+        self.item = self.__create_item() # Create the new item
+        self._update(source="edit") # Trigger a menu update
+        return
+    
+    def refresh(self) -> None:
+        """Read the entries again from the provider the next time the submenu is displayed (From the first page), and update the menu."""
+        with self._lock:
+            self.__reset()
+        self._update(rebuild=False, source="refresh") # The pages are read when the menu is displayed so the pystray_MenuItem doesn't need to be rebuilt
+        return
+    
+    def enable(self) -> None:
+        """Enable the VirtualSubmenu"""
+        self._item_state = True
+        self._update(rebuild=False, source="enable")
+        return
+    
+    def disable(self) -> None:
+        """Disable the VirtualSubmenu"""
+        self._item_state = False
+        self._update(rebuild=False, source="disable")
+        return
+    
+    def get_loaded_items(self) -> list[Union[Label, Button, CheckBox, Separator, Submenu]]:
+        """Return the items created from the entries read so far."""
+        with self._lock:
+            return list(self._items)
+    
+    def _set_tray(self, tray: Optional['TrayManager']) -> None:
+        """Private function. Set the TrayManager that the submenu and the items created from its entries update when they are edited."""
+        self.tray = tray
+        with self._lock:
+            items = list(self._items)
+        for item in items:
+            item._set_tray(tray)
+        return
+    
+    def _page(self) -> tuple[pystray_MenuItem, ...]:
+        """Private function. Return the pystray_MenuItems of the page shown, the entries are read and their items are created the first time the page is displayed."""
+        with self._lock:
+            if self._ttl is not None and callable(self._provider) and self._loaded_at is not None and monotonic() - self._loaded_at > self._ttl:
+                self.__reset() # The entries are outdated
+
+            if self._dirty: # An item was edited, rebuild the pages from the same items
+                self._dirty = False
+                self._pages.clear()
+
+            index = self._page_index
+            page = self._pages.get(index)
+            if page is not None:
+                return page
+
+            start = index * self._page_size
+            end = start + self._page_size
+            self.__load(end + 1) # Read one more entry to know if there is a next page
+
+            while len(self._items) < min(end, len(self._entries)): # Create the items of the entries of the page
+                item = self._item_factory(self._entries[len(self._items)])
+                item._parent = self
+                item._set_tray(self.tray)
+                self._items.append(item)
+
+            from pystray import MenuItem as pystray_MenuItem
+            page = [item._create_submenu() if isinstance(item, Submenu) else item.item for item in self._items[start:end]]
+            if len(page) == 0 or all(isinstance(item, Separator) for item in self._items[start:end]):
+                page.append(_placeholder_item())
+            if index > 0:
+                page.insert(0, pystray_MenuItem(self._previous_text, self.__previous_page))
+            if len(self._entries) > end:
+                page.append(pystray_MenuItem(self._more_text, self.__next_page)) # An item rather than a submenu, as the backends build every submenu when the menu is updated
+
+            page = tuple(page)
+            self._pages[index] = page
+        return page
+    
+    def __next_page(self, icon: pystray_Icon_Class, item: pystray_MenuItem) -> None:
+        """Show the next page (Called by pystray when the "More…" item is clicked)."""
+        with self._lock:
+            self._page_index += 1
+        self._update(rebuild=False, source="next_page") # The page shown is read when the menu is displayed so the pystray_MenuItem doesn't need to be rebuilt
+        return
+    
+    def __previous_page(self, icon: pystray_Icon_Class, item: pystray_MenuItem) -> None:
+        """Show the previous page (Called by pystray when the "Previous…" item is clicked)."""
+        with self._lock:
+            self._page_index = max(0, self._page_index - 1)
+        self._update(rebuild=False, source="previous_page")
+        return
+    
+    def __reset(self) -> None:
+        """Forget the entries read from the provider and show the first page."""
+        for item in getattr(self, "_items", ()):
+            item._parent = None
+            item._set_tray(None)
+
+        self._source: Optional[Iterator[Any]] = None
+        self._entries: list[Any] = []
+        self._items: list[Union[Label, Button, CheckBox, Separator, Submenu]] = []
+        self._exhausted = False
+        self._loaded_at: Optional[float] = None
+        self._pages: dict[int, tuple[pystray_MenuItem, ...]] = {}
+        self._page_index = 0 # The page shown
+        self._dirty = False
+        self._default_child = None
+        return
+    
+    def __load(self, count: int) -> None:
+        """Read the entries from the provider until count entries are read or there are no more entries."""
+        if self._source is None:
+            self._source = iter(self._provider() if callable(self._provider) else self._provider)
+            self._loaded_at = monotonic()
+
+        if not self._exhausted and len(self._entries) < count:
+            self._entries.extend(islice(self._source, count - len(self._entries)))
+            self._exhausted = len(self._entries) < count
+        return
+    
+    def __create_item(self) -> pystray_MenuItem:
+        """Create the pystray_MenuItem of the submenu, its items are read from the page shown when it is displayed."""
         if self._default:
             if not OsSupport.SUPPORT_DEFAULT:
                 raise DefaultNotSupported(self)
+            
+        from pystray import MenuItem as pystray_MenuItem
+        return pystray_MenuItem(_text_binding(self._text), _page_menu_class()(self._page), _unchecked, radio=_false, default=_flag(self._default), visible=_true, enabled=self._is_enabled)
+
+
+
+_SPEC_TYPES = {"label": Label, "button": Button, "checkbox": CheckBox, "separator": Separator, "submenu": Submenu}
+
+def _spec_callback(value: Callable | str | None, callbacks: dict[str, Callable] | None) -> Callable | None:
+    """Private function. Return the callback of a spec, a string is the name of a callback of the callbacks mapping."""
+    if isinstance(value, str):
+        if callbacks is None or value not in callbacks:
+            raise ValueError(f"Unknown callback in the menu spec: {value!r}")
+        return callbacks[value]
+    return value
+
+def _spec_args(value: list | tuple | None) -> tuple | None:
+    """Private function. Return the arguments of a callback of a spec as a tuple (JSON only has lists)."""
+    return tuple(value) if value is not None else None
+
+def _spec_check_fields(fields: dict[str, Any]) -> None:
+    """Private function. Raise a ValueError if a spec entry has an unknown type or a field that its type doesn't support."""
+    kind = fields.get("type")
+    if kind not in _SPEC_TYPES:
+        raise ValueError(f"Unknown item type in the menu spec: {kind!r}")
+    
+    if kind == "separator":
+        unsupported = [name for name in ("enabled", "default") if name in fields] # A separator can't be disabled or be the default item
+        if unsupported:
+            raise ValueError(f"Unsupported field for a separator in the menu spec: {', '.join(map(repr, unsupported))}")
+    return
+
+def _spec_create_item(fields: dict[str, Any], callbacks: dict[str, Callable] | None) -> Union[Label, Button, CheckBox, Separator, Submenu]:
+    """Private function. Create the item described by a spec entry (Checked by _spec_check_fields)."""
+    kind = fields["type"]
+    text = fields.get("text", "")
+    default = fields.get("default", False)
+    if kind == "label":
+        item = Label(text, default)
+    elif kind == "button":
+        item = Button(text, _spec_callback(fields.get("callback"), callbacks), _spec_args(fields.get("args")), default)
+    elif kind == "checkbox":
+        item = CheckBox(text, fields.get("checked", False), _spec_callback(fields.get("checked_callback"), callbacks), _spec_args(fields.get("checked_callback_args")),
+                        _spec_callback(fields.get("unchecked_callback"), callbacks), _spec_args(fields.get("unchecked_callback_args")), fields.get("radio", False), default)
+    elif kind == "separator":
+        item = Separator()
+    else:
+        item = Submenu(text, default)
+
+    if not fields.get("enabled", True):
+        item.disable()
+    return item
+
+def _spec_edit_item(item: Union[Label, Button, CheckBox, Separator, Submenu], old: dict[str, Any], new: dict[str, Any], callbacks: dict[str, Callable] | None) -> None:
+    """Private function. Apply the fields that changed between two spec entries of the same item (Except default, which is applied by Menu.apply_spec once the items are in place)."""
+    changed = {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+    changed.discard("default")
+    if not changed:
+        return
+    
+    if "enabled" in changed:
+        item.enable() if new.get("enabled", True) else item.disable()
+
+    kind = new["type"]
+    kwargs: dict[str, Any] = {}
+    if "text" in changed:
+        kwargs["text"] = new.get("text", "")
+    if kind == "button":
+        if "callback" in changed:
+            kwargs["callback"] = _spec_callback(new.get("callback"), callbacks)
+        if "args" in changed:
+            kwargs["args"] = _spec_args(new.get("args"))
+    elif kind == "checkbox":
+        if "checked" in changed: # The status is only changed when the spec changes it, so the status set by the user is kept
+            kwargs["check_default"] = new.get("checked", False)
+        for key in ("checked_callback", "unchecked_callback"):
+            if key in changed:
+                kwargs[key] = _spec_callback(new.get(key), callbacks)
+            if f"{key}_args" in changed:
+                kwargs[f"{key}_args"] = _spec_args(new.get(f"{key}_args"))
+        if "radio" in changed:
+            kwargs["use_radio_look"] = new.get("radio", False)
+    
+    if kwargs and kind != "separator":
+        item.edit(**kwargs)
+    return
+
+
+
+def _snapshot_callback(callback: Callable | None, names: dict[int, str], spec_name: Any) -> str | None:
+    """Private function. Return the name under which a callback is saved in a snapshot (Its name in the callbacks mapping or in the spec it was created from), raise a ValueError if the callback has no name as restore() couldn't load it."""
+    if callback is None:
+        return None
+    if id(callback) in names:
+        return names[id(callback)]
+    if isinstance(spec_name, str):
+        return spec_name
+    raise ValueError(f"The callback {getattr(callback, '__qualname__', callback)!r} has no name, give it a name in the callbacks argument of snapshot() (and of restore())")
+
+def _snapshot_text(text: str | Callable[[], str] | Observable) -> str:
+    """Private function. Return the text currently displayed by an item."""
+    if isinstance(text, Observable):
+        return str(text.get())
+    if callable(text):
+        return str(text())
+    return text
+
+
+
+class Menu(_Container):
+    def __init__(self, tray: 'TrayManager') -> None:
+        """Create the menu in the notification.\n
+        Parameter
+        ---------
+        * tray: TrayManager\n
+            A TrayManager instance (A menu object is automatically created when you create a TrayManager object)."""
+
+        self.tray = tray
+        self._items: tuple[Label | Button | CheckBox | Separator | Submenu, ...] = () # Replaced by a new tuple on each change (Copy on write)
+        self._write_lock = Lock() # Serialize the changes of the items, the menu is built without it
+        self._menu_state: bool = True
+        self._parent = None # The menu is the root of the items tree
+        self._default_child: Optional[Label | Button | CheckBox | Submenu] = None # The item of the menu that has the default option
+
+        self._dirty = True # Define if the menu must be rebuilt on the next menu update
+        self._built_items: Optional[list[pystray_MenuItem]] = None # The items built on the last menu update
+
+        self._spec_lock = Lock() # Serialize the specs applied to the menu
+        self._spec_items: dict[str, tuple[Label | Button | CheckBox | Separator | Submenu, dict[str, Any]]] = {} # The item and the spec entry of each id of the last spec applied
+        return
+
+    def add(self, item: Label | Button | CheckBox | Separator | Submenu, index: int = -1) -> None:
+        """Add an item to the menu. Raise MenuNotSupported if the OS doesn't support menu.\n
+        Parameters
+        ----------
+        * item: Label | Button | CheckBox | Separator | Submenu\n
+            The item to add to the menu.
+        * index: int (Facultative)\n
+            The index at which the item is going to be appened (Define the order of the items in the menu)."""
+        
+        with self._write_lock:
+            self._check_item(item)
+            self._check_default([item])
+            self._attach(item)
+            self._items = self._inserted([item], index) # Add the item to the menu
+
+        self._changed("add") # Trigger a menu update
+        return
+    
+    def remove(self, item: Label | Button | CheckBox | Separator | Submenu) -> Label | Button | CheckBox | Separator | Submenu | None:
+        """Remove an item from the menu.\n
+        Parameters
+        ----------
+        * item: Label | Button | CheckBox | Separator | Submenu\n
+            The item to remove from the menu."""
+        
+        with self._write_lock:
+            try:
+                index = self._items.index(item) # Try to get the item index
+            except ValueError:
+                return
+
+            removed = self._items[index]
+            self._items = self._items[:index] + self._items[index + 1:] # Remove the item
+            self._detach(removed)
+        self._changed("remove") # Trigger a menu update
+        return removed # Return the removed item
+
+    def from_spec(self, spec: dict[str, Any], callbacks: dict[str, Callable] | None = None) -> None:
+        """Replace the items of the menu by the items described by the spec, with a single menu update (See apply_spec() for the format of the spec).\n
+        Parameters
+        ----------
+        * spec: dict[str, Any]\n
+            The description of the menu.
+        * callbacks: dict[str, Callable] | None (Facultative)\n
+            The callbacks that the spec refers to by name."""
+        with self.tray.batch():
+            with self._spec_lock:
+                self._spec_items = {}
+            self.clear()
+            self.apply_spec(spec, callbacks)
+        return
+    
+    def apply_spec(self, spec: dict[str, Any], callbacks: dict[str, Callable] | None = None) -> None:
+        """Change the menu to match the spec with a single menu update. The spec is compared to the last spec applied : the items are matched by their id, only the items that changed are edited, added, removed or moved, and the others (including the status of the checkboxes) are kept as is.\n
+        The spec is a dict with an "items" list, each item is a dict with :
+        * "type": "label", "button", "checkbox", "separator" or "submenu".
+        * "id": str, the id of the item (Facultative, an item without id is identified by its position, so it is recreated when the items before it change).
+        * "text": str, "default": bool, "enabled": bool (The separators only have a "type" and an "id").
+        * Buttons : "callback" and "args".
+        * CheckBoxes : "checked", "checked_callback", "checked_callback_args", "unchecked_callback", "unchecked_callback_args" and "radio" (The radio look).
+        * Submenus : "items", the items of the submenu.\n
+        The callbacks are callables or names of the callbacks mapping (So that the spec can be loaded from JSON).\n
+        Parameters
+        ----------
+        * spec: dict[str, Any]\n
+            The description of the menu.
+        * callbacks: dict[str, Callable] | None (Facultative)\n
+            The callbacks that the spec refers to by name."""
+        with self.tray.batch(), self._spec_lock:
+            applied: dict[str, tuple[Label | Button | CheckBox | Separator | Submenu, dict[str, Any]]] = {}
+            defaults: list[Label | Button | CheckBox | Submenu] = []
+            self.__apply_items(self, spec.get("items", []), "", applied, defaults, callbacks)
+
+            for item in defaults: # The default option is given once the items that lost it are in place
+                item.edit(default=True)
+            self._spec_items = applied
+        return
+    
+    def snapshot(self, callbacks: dict[str, Callable] | None = None) -> str:
+        """Return the state of the menu as compact JSON : its items tree, the text, enabled and default flags of the items and the status of the checkboxes, in the spec format of apply_spec() (The ids of the items come from the last spec applied).\n
+        The callbacks are saved by name, VirtualSubmenus are not saved.\n
+        Parameter
+        ---------
+        * callbacks: dict[str, Callable] | None (Facultative)\n
+            The names under which the callbacks are saved, the callbacks that aren't in it are saved under the name they were given in the spec. A ValueError is raised if a callback has no name."""
+        from json import dumps
+        names = {id(callback): name for name, callback in callbacks.items()} if callbacks else {}
+        with self._spec_lock:
+            specs = {id(item): (key, fields) for key, (item, fields) in self._spec_items.items()}
+
+        snapshot = {"version": 1, "enabled": self._menu_state, "items": self.__snapshot_items(self._items, specs, names)}
+        return dumps(snapshot, separators=(",", ":"), ensure_ascii=False)
+    
+    def restore(self, snapshot: str | bytes | dict[str, Any], callbacks: dict[str, Callable] | None = None) -> None:
+        """Replace the items of the menu by the items saved in a snapshot, in one pass with a single menu update.\n
+        Parameters
+        ----------
+        * snapshot: str | bytes | dict[str, Any]\n
+            The snapshot returned by snapshot() (Or its JSON loaded as a dict).
+        * callbacks: dict[str, Callable] | None (Facultative)\n
+            The callbacks that the snapshot refers to by name."""
+        if not isinstance(snapshot, dict):
+            from json import loads
+            snapshot = loads(snapshot)
+
+        with self.tray.batch():
+            self.from_spec(snapshot, callbacks)
+            if snapshot.get("enabled", True) != self._menu_state:
+                self.enable() if snapshot.get("enabled", True) else self.disable()
+        return
+    
+    def update(self) -> None:
+        """Update the menu (The update is deferred if a batch is opened or if an update interval is set on the TrayManager)."""
+        self.tray._request_update(self, "update")
+        return
+    
+    def enable(self) -> None:
+        """Enable the menu"""
+        self._menu_state = True
+        self.update()
+        return
+    
+    def disable(self) -> None:
+        """Disable the menu"""
+        self._menu_state = False
+        self.update()
+        return
+    
+    def __snapshot_items(self, items: tuple[Label | Button | CheckBox | Separator | Submenu, ...], specs: dict[int, tuple[str, dict[str, Any]]], names: dict[int, str]) -> list[dict[str, Any]]:
+        """Return the spec entries describing the items."""
+        entries: list[dict[str, Any]] = []
+        for item in items:
+            kind = next((name for name, item_type in _SPEC_TYPES.items() if isinstance(item, item_type)), None)
+            if kind is None: # VirtualSubmenus are filled from their provider
+                continue
+
+            entry: dict[str, Any] = {"type": kind}
+            key, fields = specs.get(id(item), (None, {}))
+            if key is not None and "id" in fields:
+                entry["id"] = key
+
+            if kind != "separator":
+                entry["text"] = _snapshot_text(item._text)
+                if item._default:
+                    entry["default"] = True
+                if not item._item_state:
+                    entry["enabled"] = False
+
+            if kind == "button":
+                entry["callback"] = _snapshot_callback(item._callback, names, fields.get("callback"))
+                entry["args"] = list(item._callback_args) if item._callback_args is not None else None
+            elif kind == "checkbox":
+                if item._status_disabled:
+                    entry["checked"] = None
+                elif item._group is not None or item._status_binding is not None or item._requested_status is None:
+                    entry["checked"] = item.get_status()
+                else:
+                    entry["checked"] = item._requested_status # Not displayed yet
+                entry["checked_callback"] = _snapshot_callback(item._checked_callback, names, fields.get("checked_callback"))
+                entry["checked_callback_args"] = list(item._checked_callback_args) if item._checked_callback_args is not None else None
+                entry["unchecked_callback"] = _snapshot_callback(item._unchecked_callback, names, fields.get("unchecked_callback"))
+                entry["unchecked_callback_args"] = list(item._unchecked_callback_args) if item._unchecked_callback_args is not None else None
+                if item._use_radio_look:
+                    entry["radio"] = True
+            elif kind == "submenu":
+                entry["items"] = self.__snapshot_items(item._items, specs, names)
+            
+            entries.append({name: value for name, value in entry.items() if value is not None or name == "checked"}) # Keep the snapshot compact
+        return entries
+
+    def __apply_items(self, container: Menu | Submenu, entries: list[dict[str, Any]], path: str, applied: dict[str, tuple[Label | Button | CheckBox | Separator | Submenu, dict[str, Any]]], defaults: list[Label | Button | CheckBox | Submenu], callbacks: dict[str, Callable] | None) -> None:
+        """Match the spec entries of a menu/submenu with the items of the last spec applied, edit or create them and set them as the items of the menu/submenu."""
+        items: list[Label | Button | CheckBox | Separator | Submenu] = []
+        for index, entry in enumerate(entries):
+            key = str(entry["id"]) if "id" in entry else f"{path}{index}:{entry.get('type')}"
+            if key in applied:
+                raise ValueError(f"Duplicate id in the menu spec: {key!r}")
+            
+            fields = {name: value for name, value in entry.items() if name != "items"}
+            _spec_check_fields(fields)
+            previous = self._spec_items.get(key)
+            if previous is not None and previous[1].get("type") == fields.get("type"):
+                item, old = previous
+                _spec_edit_item(item, old, fields, callbacks)
+                if old.get("default", False) != fields.get("default", False):
+                    if fields.get("default", False):
+                        defaults.append(item)
+                    else:
+                        item.edit(default=False)
+            else:
+                item = _spec_create_item(fields, callbacks)
+
+            applied[key] = (item, fields)
+            if isinstance(item, Submenu):
+                self.__apply_items(item, entry.get("items", []), f"{key}/", applied, defaults, callbacks)
+            items.append(item)
+
+        container._reconcile(items)
+        return
+
+    def _check_item(self, item: Label | Button | CheckBox | Separator | Submenu) -> None:
+        """Private function. Raise an exception if the item can't be added to the menu."""
+        if not OsSupport.SUPPORT_MENU:
+            raise MenuNotSupported
+        
+        super()._check_item(item)
+        return
+    
+    def _changed(self, source: str) -> None:
+        """Private function. Trigger a menu update after the items of the menu changed."""
+        self._dirty = True
+        self.tray._request_update(self, source)
+        return
+
+    def _create_menu(self) -> list[pystray_MenuItem]:
+        """Create the list of items composing the menu, only the submenus that changed since the last menu update are rebuilt."""
+        if not self._menu_state: # Don't build anything if the menu is disabled
+            return []
         
-        if len(items) == 0 or all(isinstance(i, Separator) for i in self._items): # Check if the submenu is empty or if all the items in the submenu are not displayable without other items (Such as Separators)
-            items.append(self.__default_item.item) # Add the default item to allow the submenu to be displayed
+        if not self._dirty and self._built_items is not None:
+            return self._built_items
         
-        return pystray_MenuItem(self._text, pystray_Menu(*items), default=self._default, enabled=self._item_state)
+        self._dirty = False # Reset the flag before building so that a change made during the build triggers a new build
+        metrics = self.tray.metrics
+        profiler = self.tray.profiler
+        if metrics is not None or profiler is not None:
+            start = perf_counter()
 
+        items: list[pystray_MenuItem] = [] # The items are checked when they are added, so no check is needed here
+        snapshot = self._items # The items can be replaced by another thread during the build, so the same snapshot is used for the whole build
 
+        for item in snapshot:
+            if isinstance(item, Submenu):
+                items.append(item._create_submenu()) # Create the pystray_MenuItem of that submenu (Or reuse it if it hasn't changed)
+            else:
+                items.append(item.item) # Get the pystray_MenuItem of the item
+        
+        if (len(items) == 0 or all(isinstance(i, Separator) for i in snapshot)): # Check if the menu is empty or if all the items in the menu are not displayable without other items (Such as Separators)
+            items.append(_placeholder_item()) # Add the default item to allow the menu to be displayed
+
+        self._built_items = items
+        if metrics is not None:
+            metrics._record("build", kind="Menu", duration=perf_counter() - start, nodes=len(items))
+        if profiler is not None:
+            profiler._span("build Menu", "build", start, perf_counter(), nodes=len(items))
+        return items
 
-class Menu:
-    def __init__(self, tray: 'TrayManager') -> None:
-        """Create the menu in the notification.\n
-        Parameter
-        ---------
-        * tray: TrayManager\n
-            A TrayManager instance (A menu object is automatically created when you create a TrayManager object)."""
 
-        self.tray = tray
-        self._items: list[Label | Button | CheckBox | Separator | Submenu] = []
-        self._default_item = Label("") # Set the default label to be added when the menu doesn't contain any displayable item (such as Separators)
-        self._menu_state: bool = True
-        return
 
-    def add(self, item: Label | Button | CheckBox | Separator | Submenu, index: int = -1) -> None:
-        """Add an item to the menu. Raise MenuNotSupported if the OS doesn't support menu.\n
+# The largest size (in pixels) at which each pystray backend displays the icon at common DPI scales, the icons are pre-scaled to that size when they are loaded
+_TRAY_ICON_SIZES = {"win32": (32, 32),
+                    "darwin": (44, 44),
+                    "gtk": (48, 48),
+                    "appindicator": (48, 48),
+                    "xorg": (48, 48)}
+_DEFAULT_TRAY_ICON_SIZE = (64, 64)
+
+
+class IconStore:
+    def __init__(self, max_bytes: int = 8 * 1024 * 1024, icon_size: tuple[int, int] | None = _DEFAULT_TRAY_ICON_SIZE) -> None:
+        """A class used to store the icons loaded in a TrayManager (An icon store is automatically created when you create a TrayManager object).\n
+        The icons are only decoded the first time they're used, scaled down to icon_size, and the icons with the same content are only stored once. When the decoded icons take more than max_bytes, the least recently used ones are evicted (They're decoded again the next time they're used).\n
         Parameters
         ----------
-        * item: Label | Button | CheckBox | Separator | Submenu\n
-            The item to add to the menu.
-        * index: int (Facultative)\n
-            The index at which the item is going to be appened (Define the order of the items in the menu)."""
-        
-        if not OsSupport.SUPPORT_MENU:
-            raise MenuNotSupported
+        * max_bytes: int (Facultative)\n
+            The maximum memory in bytes used by the decoded icons, if 0, there is no limit.
+        * icon_size: tuple[int, int] | None (Facultative)\n
+            The maximum size (width, height) of the icons, the bigger icons are scaled down (keeping their ratio) when they're decoded, if None, the icons aren't scaled."""
         
-        item.tray = self.tray
-
-        # Add the item to the menu
-        if index == -1:
-            self._items.append(item)
-        else:
-            self._items.insert(index, item)
-
-        self.update() # Trigger a menu update
+        self._max_bytes = max_bytes
+        self._icon_size = icon_size
+
+        self._lock = Lock()
+        self._sources: dict[str, bytes | str] = {} # The encoded image or the path of each icon
+        self._hashes: dict[str, str] = {} # The content hash of each icon that was already decoded
+        self._references: dict[str, int] = {} # The number of icons having each content hash
+        self._decoded: OrderedDict[str, Image.Image] = OrderedDict() # The decoded icons by content hash, from the least to the most recently used
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
         return
     
-    def remove(self, item: Label | Button | CheckBox | Separator | Submenu) -> Label | Button | CheckBox | Separator | Submenu | None:
-        """Remove an item from the menu.\n
+    def load(self, name: str, icon: Image.Image | bytes | str | BinaryIO) -> None:
+        """Load an icon, the icon is only decoded the first time it's used. Loading an icon with a name that is already used replaces the previous icon.\n
+        Only the header of the image is read when it's loaded : an OSError is raised here if the path can't be read (FileNotFoundError, PermissionError, ...) or if the image format isn't recognized (PIL.UnidentifiedImageError), but the errors found when decoding the image (A truncated or corrupted image, or a file changed or removed after being loaded) are only raised the first time the icon is used.\n
         Parameters
         ----------
-        * item: Label | Button | CheckBox | Separator | Submenu\n
-            The item to remove from the menu."""
+        * name: str\n
+            The name (key) of the icon.
+        * icon: Image.Image | bytes | str | BinaryIO\n
+            The image, the encoded image, the path of the image or a file containing the image."""
         
-        item.tray = None # We remove the tray argument to prevent the item from triggering a menu update when the item is edited but is not in the menu
+        from PIL import Image
+        if isinstance(icon, Image.Image):
+            image = self.__scale(icon)
+            source = BytesIO()
+            image.save(source, "PNG") # Keep the image encoded so that it can be evicted
+            source = source.getvalue()
+        else:
+            source = icon if isinstance(icon, (bytes, str)) else icon.read()
+            with Image.open(BytesIO(source) if isinstance(source, bytes) else source): # Only read the header, to raise the errors here rather than when the icon is used
+                pass
 
-        try:
-            index = self._items.index(item) # Try to get the item index
-        except ValueError:
-            return
+        with self._lock:
+            self.__forget(name)
+            self._sources[name] = source
+        return
+    
+    def get(self, name: str) -> Image.Image | None:
+        """Return the decoded icon, None if there is no icon with that name.\n
+        Parameter
+        ---------
+        * name: str\n
+            The name (key) of the icon."""
+        
+        with self._lock:
+            source = self._sources.get(name)
+            if source is None:
+                return
+            
+            content_hash = self._hashes.get(name)
+            if content_hash is not None and content_hash in self._decoded:
+                self._hits += 1
+                self._decoded.move_to_end(content_hash) # Mark the icon as the most recently used
+                return self._decoded[content_hash]
+            
+            self._misses += 1
 
-        removed = self._items.pop(index) # Remove the item
-        self.update() # Trigger a menu update
-        return removed # Return the removed item
+        image = self.__decode(source) # Decode outside of the lock as it can be slow
+        content_hash = sha1(f"{image.mode}{image.size}".encode() + image.tobytes()).hexdigest()
 
-    def get_items(self) -> list[Label | Button | CheckBox | Separator | Submenu]:
-        """Return the items contained in the menu."""
-        return self._items
+        with self._lock:
+            if self._sources.get(name) is not source: # The icon was replaced while it was decoded
+                return image
+            
+            if self._hashes.get(name) != content_hash:
+                self.__release(name)
+                self._hashes[name] = content_hash
+                self._references[content_hash] = self._references.get(content_hash, 0) + 1
+
+            if content_hash in self._decoded: # Another icon has the same content
+                self._decoded.move_to_end(content_hash)
+                return self._decoded[content_hash]
+
+            self._decoded[content_hash] = image
+            self._bytes += self.__size(image)
+            self.__evict()
+        return image
     
-    def update(self) -> None:
-        """Update the menu."""
-        self.tray.tray.update_menu()
+    def remove(self, name: str) -> None:
+        """Remove an icon.\n
+        Parameter
+        ---------
+        * name: str\n
+            The name (key) of the icon."""
+        with self._lock:
+            self.__forget(name)
         return
     
-    def enable(self) -> None:
-        """Enable the menu"""
-        self._menu_state = True
-        self.update()
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of icons loaded and decoded, the memory used by the decoded icons (in bytes), and the number of hits, misses and evictions."""
+        with self._lock:
+            return {"icons": len(self._sources),
+                    "decoded": len(self._decoded),
+                    "bytes": self._bytes,
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "evictions": self._evictions}
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+    
+    def __decode(self, source: bytes | str) -> Image.Image:
+        """Decode and scale the icon."""
+        from PIL import Image
+        with Image.open(BytesIO(source) if isinstance(source, bytes) else source) as image:
+            image.load()
+            return self.__scale(image)
+        
+    def __scale(self, image: Image.Image) -> Image.Image:
+        """Return a copy of the image scaled down to the icon size (keeping its ratio)."""
+        image = image.copy()
+        if self._icon_size is not None:
+            image.thumbnail(self._icon_size) # Only scale down
+        return image
+    
+    def __size(self, image: Image.Image) -> int:
+        """Return the memory used by a decoded image."""
+        return image.width * image.height * len(image.getbands())
+    
+    def __evict(self) -> None:
+        """Evict the least recently used icons until the decoded icons fit in max_bytes (The most recently used icon is never evicted)."""
+        while self._max_bytes > 0 and self._bytes > self._max_bytes and len(self._decoded) > 1:
+            _, image = self._decoded.popitem(last=False)
+            self._bytes -= self.__size(image)
+            self._evictions += 1
         return
     
-    def disable(self) -> None:
-        """Disable the menu"""
-        self._menu_state = False
-        self.update()
+    def __release(self, name: str) -> None:
+        """Release the content hash of the icon, the decoded image is dropped if no other icon has the same content."""
+        content_hash = self._hashes.pop(name, None)
+        if content_hash is None:
+            return
+        
+        self._references[content_hash] -= 1
+        if self._references[content_hash] == 0:
+            del self._references[content_hash]
+            image = self._decoded.pop(content_hash, None)
+            if image is not None:
+                self._bytes -= self.__size(image)
         return
     
-    def _create_menu(self) -> list[pystray_MenuItem]:
-        """Create the list of items composing the menu."""
-        items: list[Label | Button | CheckBox | Separator | Submenu] = []
-
-        __items_with_default_option: list[Label | Button | CheckBox | Separator | Submenu] = []
+    def __forget(self, name: str) -> None:
+        """Remove the icon and release its decoded image."""
+        self.__release(name)
+        self._sources.pop(name, None)
+        return
 
-        for item in self._items:
-            if item._default:
-                __items_with_default_option.append(item)
 
-            if isinstance(item, Submenu):
-                item.tray = self.tray
-                item = item._create_submenu() # Create the pystray_MenuItem of that submenu
-    
-            elif isinstance(item, Label) or isinstance(item, Button) or isinstance(item, CheckBox) or isinstance(item, Separator):
-                item.tray = self.tray
-                item = item.item # Get the pystray_MenuItem of the item
 
-            items.append(item)
-        
-        if len(__items_with_default_option) > 1:
-            raise TooManyDefaultItems(self, __items_with_default_option)
-        
-        if (len(items) == 0 or all(isinstance(i, Separator) for i in self._items)): # Check if the menu is empty or if all the items in the menu are not displayable without other items (Such as Separators)
-            items.append(self._default_item.item) # Add the default item to allow the menu to be displayed
+class _BadgeRenderer:
+    def __init__(self, max_entries: int = 64) -> None:
+        """Private class. Draw the badges over the icons, the glyphs, the badges and the composited icons are cached in LRU caches of max_entries entries each, so an icon with a badge that was already drawn is reused instead of drawn again."""
+        self._max_entries = max_entries
+        self._lock = Lock()
+        self._glyphs: OrderedDict[tuple, Image.Image] = OrderedDict() # The rendered texts by (text, size, color)
+        self._badges: OrderedDict[tuple, Image.Image] = OrderedDict() # The badges (circle and text) by (text, diameter, color, text color)
+        self._composites: OrderedDict[tuple, tuple[Image.Image, Image.Image]] = OrderedDict() # The base and composited icons by (base id, badge, corner)
+        self._fonts: dict[int, Any] = {}
 
-        if not self._menu_state:
-            return []
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        return
+    
+    def render(self, base: Image.Image, value: int | str | None, color: tuple[int, int, int, int], corner: Corners, text_color: tuple[int, int, int, int]) -> Image.Image:
+        """Return the base icon with the badge drawn in its corner."""
+        text = "" if value is None else (f"{value}" if not isinstance(value, int) or value <= 99 else "99+")
+        key = (id(base), text, color, text_color, corner)
+
+        with self._lock:
+            entry = self._composites.get(key)
+            if entry is not None and entry[0] is base: # The base icon wasn't reloaded
+                self._hits += 1
+                self._composites.move_to_end(key)
+                return entry[1]
+            
+            self._misses += 1
+            diameter = max(6, round(min(base.size) * (0.6 if len(text) > 1 else 0.5)))
+            badge = self.__cached(self._badges, (text, diameter, color, text_color), lambda: self.__draw_badge(text, diameter, color, text_color))
+
+            composite = base.convert("RGBA")
+            x = 0 if corner in (Corners.TOP_LEFT, Corners.BOTTOM_LEFT) else composite.width - badge.width
+            y = 0 if corner in (Corners.TOP_LEFT, Corners.TOP_RIGHT) else composite.height - badge.height
+            composite.alpha_composite(badge, (max(0, x), max(0, y)))
+
+            self._composites[key] = (base, composite)
+            self.__evict(self._composites)
+        return composite
+    
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of cached glyphs, badges and icons, and the number of hits, misses and evictions of the cached icons."""
+        with self._lock:
+            return {"glyphs": len(self._glyphs),
+                    "badges": len(self._badges),
+                    "icons": len(self._composites),
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "evictions": self._evictions}
+    
+    def __cached(self, cache: OrderedDict, key: tuple, draw: Callable[[], Image.Image]) -> Image.Image:
+        """Return the cached layer, draw and cache it if it isn't cached."""
+        layer = cache.get(key)
+        if layer is None:
+            layer = draw()
+            cache[key] = layer
+            self.__evict(cache)
+        else:
+            cache.move_to_end(key)
+        return layer
+    
+    def __evict(self, cache: OrderedDict) -> None:
+        """Evict the least recently used entries of the cache."""
+        while len(cache) > self._max_entries:
+            cache.popitem(last=False)
+            self._evictions += 1
+        return
+    
+    def __draw_badge(self, text: str, diameter: int, color: tuple[int, int, int, int], text_color: tuple[int, int, int, int]) -> Image.Image:
+        """Draw a badge, a disc with the text in its center."""
+        from PIL import Image, ImageDraw
+        width = diameter if len(text) <= 1 else max(diameter, round(diameter * 0.45 * len(text)))
+        badge = Image.new("RGBA", (width, diameter), (0, 0, 0, 0))
+        ImageDraw.Draw(badge).rounded_rectangle((0, 0, width - 1, diameter - 1), diameter // 2, fill=color)
+
+        if text:
+            glyph = self.__cached(self._glyphs, (text, diameter, text_color), lambda: self.__draw_glyph(text, diameter, text_color))
+            glyph_width = min(glyph.width, width)
+            badge.alpha_composite(glyph.crop((0, 0, glyph_width, glyph.height)), ((width - glyph_width) // 2, max(0, (diameter - glyph.height) // 2)))
+        return badge
+    
+    def __draw_glyph(self, text: str, diameter: int, text_color: tuple[int, int, int, int]) -> Image.Image:
+        """Draw the text of a badge on a transparent layer."""
+        from PIL import Image, ImageDraw, ImageFont
+        size = max(6, round(diameter * 0.75))
+        font = self._fonts.get(size)
+        if font is None:
+            try:
+                font = ImageFont.load_default(size)
+            except TypeError: # Pillow < 10.1 only has a fixed size font
+                font = ImageFont.load_default()
+            self._fonts[size] = font
 
-        return items
+        left, top, right, bottom = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox((0, 0), text, font=font)
+        glyph = Image.new("RGBA", (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        ImageDraw.Draw(glyph).text((-left, -top), text, fill=text_color, font=font)
+        return glyph
 
 
 
 class TrayManager:
-    def __init__(self, app_name: str, default_show: bool = True, run_in_separate_thread: bool = False, setup: FunctionType | MethodType | LambdaType | None = None, setup_args: tuple | None = None, backend: Backends = None) -> None:
+    def __init__(self, app_name: str, default_show: bool = True, run_in_separate_thread: bool = False, setup: FunctionType | MethodType | LambdaType | None = None, setup_args: tuple | None = None, backend: Backends = None, update_interval: float = 0, callback_executor: Executors | Executor = Executors.INLINE, callback_workers: int | None = None, max_pending_callbacks: int = 0, queue_policy: QueuePolicies = QueuePolicies.DROP, ready_timeout: float | None = 10, icon_cache_size: int = 8 * 1024 * 1024, icon_size: tuple[int, int] | None = Values.DEFAULT, badge_cache_size: int = 64, metrics: bool = False, profile: bool | str | None = None) -> None:
         """Create a pystray.Icon object linked to a Menu() object.\n
             Parameters
             ----------
@@ -842,12 +3547,67 @@ class TrayManager:
             * setup_args: tuple (Facultative)\n
                 The arguments to pass to the setup function when the pystray_Icon run, MUST be a tuple.
             * backend: str (Facultative)\n
-                Set this to one of the following backends to use it, if None, automatically select one. Possible backends : for Windows : win32 (Default), for MacOs : darwin (Default) for Linux : gtk, xorg, appindicator (Default), ayatana-appindicator (Default's Fallback)."""
-
-        self.menu = Menu(self) # Create the menu item
-        self.notification = Notification(self)
-        self._default_icon = Image.new("L", (32, 32), 255) # Create the default icon
-        self._icons: dict[str: Image.Image] = {}
+                Set this to one of the following backends to use it, if None, automatically select one. Possible backends : for Windows : win32 (Default), for MacOs : darwin (Default) for Linux : gtk, xorg, appindicator (Default), ayatana-appindicator (Default's Fallback).
+            * update_interval: float (Facultative)\n
+                The minimum delay in seconds between two menu updates, if greater than 0, the updates requested during that delay are coalesced into a single update (e.g. 0.016 to update the menu at most every 16 ms). By default, the menu is updated as soon as an item changes.
+            * callback_executor: Executors | concurrent.futures.Executor (Facultative)\n
+                The executor used to run the callbacks of the items, one of the Executors values or any concurrent.futures.Executor. By default, the callbacks are run in pystray's loop thread, which freezes the menu until they return.
+            * callback_workers: int | None (Facultative)\n
+                The number of workers of the pool used for Executors.THREAD_POOL and Executors.PROCESS_POOL, if None, use the default of concurrent.futures.
+            * max_pending_callbacks: int (Facultative)\n
+                The maximum number of callbacks that can wait or run at the same time, if 0, there is no limit.
+            * queue_policy: QueuePolicies (Facultative)\n
+                The policy applied to the new callbacks when max_pending_callbacks is reached.
+            * ready_timeout: float | None (Facultative)\n
+                The maximum delay in seconds to wait for the icon to be displayed when default_show is True, if None, wait until it is displayed. Use wait_ready() to know if the icon is ready.
+            * icon_cache_size: int (Facultative)\n
+                The maximum memory in bytes used by the decoded icons (8 MiB by default), the least recently used icons are evicted and decoded again when they're used, if 0, there is no limit.
+            * icon_size: tuple[int, int] | None (Facultative)\n
+                The maximum size (width, height) of the loaded icons, the bigger icons are scaled down when they're decoded. By default, use the largest size displayed by the backend, if None, the icons aren't scaled.
+            * badge_cache_size: int (Facultative)\n
+                The maximum number of icons with a badge (and of badges and glyphs) kept in memory, the least recently used ones are drawn again when they're used.
+            * metrics: bool (Facultative)\n
+                Define if the metrics (menu updates, builds, callbacks and icons) are recorded from the creation of the TrayManager, see enable_metrics().
+            * profile: bool | str | None (Facultative)\n
+                Define if the TrayManager records a Chrome trace of what it does (See tray_manager.Profiler and the profiler attribute), if a path, the trace is written to it when the TrayManager is killed. If None, use the TRAY_MANAGER_PROFILE environment variable : 1/true/yes/on writes the trace to tray_manager_trace.json in the current directory, 0/false/no/off disables the profiling and any other value is the path of the trace."""
+
+        self._created_at = perf_counter()
+        self._startup_latency: Optional[dict[str, float]] = None
+        self._ready_event = Event() # Set once pystray's loop is started and the icon is displayed (or hidden)
+        self._killed = False # Set by kill(), pystray's stop() does nothing if the loop isn't started yet
+        self.ready: Future = Future() # Set with the startup latency once the TrayManager is ready (See get_startup_latency()), right before the setup function is called
+        self.metrics: Optional[Metrics] = Metrics() if metrics else None # None when the metrics are disabled, so that nothing is recorded
+
+        if profile is None:
+            profile = _profile_from_environ()
+        self.profiler: Optional[Profiler] = Profiler() if profile else None # None when the profiling is disabled, so that nothing is recorded
+        self._profile_path: Optional[str] = profile if isinstance(profile, str) else None # The file the trace is written to when the TrayManager is killed
+
+        # The values used to coalesce the menu updates
+        self._update_lock = Lock()
+        self._update_interval = update_interval
+        self._update_timer: Optional[Timer] = None
+        self._update_pending = False
+        self._last_update = 0.0
+        self._batch_depth = 0
+        self._requested_updates = 0
+        self._performed_updates = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None # The event loop attached to the TrayManager
+        self._streams: tuple[EventStream, ...] = () # The event streams receiving the activations of the items (Copy on write, read on every click)
+        self._streams_lock = Lock()
+        self._tick_batch: Optional[asyncio.Future] = None # The future of the batch opened for the current iteration of the event loop
+
+        # The values used to play the animations
+        self._animations: dict[str, list[str]] = {} # The names of the frames of each animation
+        self._animation_condition = Condition()
+        self._icon_lock = Lock() # Serialize the icons given to the backend by set_icon() and by the animations (The animation condition isn't held during the backend calls)
+        self._animation: Optional[tuple[list[str], float, bool]] = None # The frames, fps and loop of the animation playing
+        self._animation_start = 0.0
+        self._animation_generation = 0 # Incremented each time an animation is played, stopped or its rate changes
+        self._animation_thread: Optional[Thread] = None
+        self._shown_frames = 0
+        self._dropped_frames = 0
+        self._failed_frames = 0
 
         if backend:
             if isinstance(backend, Backends):
@@ -869,16 +3629,33 @@ class TrayManager:
                 else:
                     raise UncompatibleBackend("Unrecognised OS", backend, None)
                 
-                os_environ["PYSTRAY_BACKEND"] = backend.value
+                os_environ["PYSTRAY_BACKEND"] = _PYSTRAY_BACKENDS[backend] # Set before anything imports pystray
 
             else:
                 raise UnknownBackend(backend)
+            
+        from pystray import Menu as pystray_Menu
+        from PIL import Image
+        pystray_Icon = _pystray_icon_class()
+
+        self.dispatcher = CallbackDispatcher(callback_executor, callback_workers, max_pending_callbacks, queue_policy) # Create the dispatcher running the callbacks
+        self.dispatcher.metrics = self.metrics
+        self.dispatcher.profiler = self.profiler
+        self.menu = Menu(self) # Create the menu item
+        self.notification = Notification(self)
+        self.scheduler = Scheduler(self) # Run the periodic tasks of the app on a single thread
+        self._default_icon = Image.new("L", (32, 32), 255) # Create the default icon
+
+        if icon_size is Values.DEFAULT:
+            icon_size = _TRAY_ICON_SIZES.get(pystray_Icon.__module__.rsplit("._", 1)[-1], _DEFAULT_TRAY_ICON_SIZE) # The size used by the backend
+        self._icons = IconStore(icon_cache_size, icon_size)
+        self._badges = _BadgeRenderer(badge_cache_size)
 
         if OsSupport.SUPPORT_MENU:
             # Create the pystray_Icon object
-            self.tray = pystray_Icon(app_name, self._default_icon, app_name, pystray_Menu(lambda: self.menu._create_menu())) # Here we use lamda to allow the menu to dynamically update
+            self.tray = _cached_icon_class(pystray_Icon)(app_name, self._default_icon, app_name, pystray_Menu(lambda: self.menu._create_menu())) # Here we use lamda to allow the menu to dynamically update
         else:
-            self.tray = pystray_Icon(app_name, self._default_icon, app_name, None)
+            self.tray = _cached_icon_class(pystray_Icon)(app_name, self._default_icon, app_name, None)
             self.menu = None
             
         if run_in_separate_thread:
@@ -888,8 +3665,204 @@ class TrayManager:
         else:
             self.__run(default_show, setup, setup_args) # Run the pystray loop in the main thread
 
-        while default_show and not self.tray.visible:
-            sleep(0.1)
+        if default_show:
+            self._ready_event.wait(ready_timeout) # Wait for the icon to be displayed
+        return
+    
+    def enable_metrics(self) -> Metrics:
+        """Start recording the metrics of the TrayManager and return them (See tray_manager.Metrics), the metrics already recorded are kept if they were already enabled."""
+        if self.metrics is None:
+            self.metrics = Metrics()
+            self.dispatcher.metrics = self.metrics
+        return self.metrics
+    
+    def disable_metrics(self) -> None:
+        """Stop recording the metrics of the TrayManager."""
+        self.metrics = None
+        self.dispatcher.metrics = None
+        return
+    
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the metrics recorded (See tray_manager.Metrics.stats()), an empty dict if the metrics are disabled."""
+        metrics = self.metrics
+        return metrics.stats() if metrics is not None else {}
+
+    def open_event_stream(self, max_size: int = 256, policy: StreamPolicies = StreamPolicies.DROP_OLDEST, debounce: float = 0) -> EventStream:
+        """Open a stream receiving the activations (clicks) of the items of the menu as TrayEvents, read it with a for loop, an async for loop or its get() function and close it when it isn't needed anymore.\n
+        Parameters
+        ----------
+        * max_size: int (Facultative)\n
+            The maximum number of events waiting in the queue of the stream.
+        * policy: StreamPolicies (Facultative)\n
+            The policy applied to the new events when the queue is full.
+        * debounce: float (Facultative)\n
+            The window in seconds in which the activations of an item are coalesced into one event, if 0, every activation is delivered as an event (See EventStream.set_debounce() to set it per item)."""
+        stream = EventStream(max_size, policy, debounce)
+        stream._set_tray(self)
+        with self._streams_lock:
+            self._streams = self._streams + (stream,)
+        return stream
+    
+    def _remove_stream(self, stream: EventStream) -> None:
+        """Private function. Stop publishing the events in a closed stream."""
+        with self._streams_lock:
+            self._streams = tuple(s for s in self._streams if s is not stream)
+        return
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait until pystray's loop is started and the icon is displayed (or hidden if default_show is False), return True if the TrayManager is ready, False if the timeout expired.\n
+        Parameter
+        ---------
+        * timeout: float | None (Facultative)\n
+            The maximum delay in seconds to wait, if None, wait until the TrayManager is ready."""
+        return self._ready_event.wait(timeout)
+    
+    def get_startup_latency(self) -> dict[str, float] | None:
+        """Return the delays in seconds since the creation of the TrayManager, None if the TrayManager isn't ready yet (The same dict is the result of the ready future) :
+        * "visible": when the backend reported the icon as visible, once pystray's loop was started. Missing if the icon wasn't displayed (default_show is False or the backend couldn't show it).
+        * "setup": when the setup function was about to be called (Also when the TrayManager became ready, even without setup function)."""
+        return self._startup_latency
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Context manager used to group several changes of the menu into a single menu update.\n
+        Every update requested while the batch is opened (add, remove, edit, enable, disable, set_status, ...) is coalesced and the menu is updated once when the outermost batch is closed. Batches can be nested.\n
+        Example
+        -------
+        with my_tray.batch():
+            for i in range(500):
+                my_tray.menu.add(Label(f"Item {i}"))"""
+        self._open_batch()
+        try:
+            yield
+        finally:
+            self._close_batch()
+        return
+    
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Attach an asyncio event loop to the TrayManager.\n
+        Once attached, the coroutine functions (async def) used as callbacks are run on the loop, and the menu updates requested by the code running on the loop are coalesced into a single update per iteration of the loop.\n
+        Parameter
+        ---------
+        * loop: asyncio.AbstractEventLoop\n
+            The event loop to attach."""
+        self._loop = loop
+        self.dispatcher.attach_loop(loop)
+        return
+    
+    def _open_batch(self) -> None:
+        """Private function. Open a batch, the menu updates are deferred until every opened batch is closed."""
+        with self._update_lock:
+            self._batch_depth += 1
+        return
+    
+    def _close_batch(self) -> None:
+        """Private function. Close a batch and perform the pending menu update if it was the outermost batch."""
+        with self._update_lock:
+            self._batch_depth -= 1
+            flush = self._batch_depth == 0 and self._update_pending and self._update_timer is None # Only flush when the outermost batch is closed and no delayed update is already scheduled
+        if flush:
+            self._flush_update()
+        return
+    
+    def _open_tick_batch(self) -> Optional[asyncio.Future]:
+        """Private function. If called from the attached event loop, open a batch that is closed on the next iteration of the loop and return a future set once it is closed, else return None."""
+        if self._loop is None:
+            return
+        
+        from asyncio import get_running_loop
+        try:
+            if get_running_loop() is not self._loop:
+                return
+        except RuntimeError: # Not called from a coroutine
+            return
+        
+        if self._tick_batch is None:
+            self._tick_batch = self._loop.create_future()
+            self._open_batch()
+            self._loop.call_soon(self.__close_tick_batch)
+        return self._tick_batch
+    
+    def __close_tick_batch(self) -> None:
+        """Close the batch opened for the current iteration of the event loop."""
+        tick_batch, self._tick_batch = self._tick_batch, None
+        try:
+            self._close_batch()
+        finally:
+            if not tick_batch.done():
+                tick_batch.set_result(None)
+        return
+
+    def set_update_interval(self, update_interval: float) -> None:
+        """Set the minimum delay in seconds between two menu updates, if set to 0, the menu is updated as soon as an item changes.\n
+        Parameter
+        ---------
+        * update_interval: float\n
+            The minimum delay in seconds between two menu updates, the updates requested during that delay are coalesced into a single update."""
+        self._update_interval = update_interval
+        return
+
+    def get_update_stats(self) -> dict[str, int]:
+        """Return the number of menu updates requested by the items, the number of updates that were actually performed and the number of updates that were coalesced."""
+        with self._update_lock:
+            return {"requested": self._requested_updates,
+                    "performed": self._performed_updates,
+                    "coalesced": self._requested_updates - self._performed_updates}
+
+    def _request_update(self, requester: Any = None, source: str = "") -> None:
+        """Private function. Request a menu update, the update is performed right away unless a batch is opened or an update interval is set.\n
+        Parameters
+        ----------
+        * requester: Any (Facultative)\n
+            The item or menu that requested the update (Recorded by the metrics and the profiler).
+        * source: str (Facultative)\n
+            The name of the method of the requester that requested the update (Recorded by the metrics and the profiler)."""
+        if self.metrics is not None:
+            self.metrics._record("update", source=_update_source(requester, source))
+        if self.profiler is not None:
+            self.profiler._instant(_update_source(requester, source), "mutation") # The mutation that requested the update
+
+        if self._loop is not None:
+            self._open_tick_batch() # Coalesce the updates requested from the event loop during the same iteration
+
+        with self._update_lock:
+            self._requested_updates += 1
+
+            if self._batch_depth > 0 or self._update_timer is not None: # The update will be performed when the batch is closed or when the timer expires
+                self._update_pending = True
+                return
+            
+            if self._update_interval > 0:
+                self._update_pending = True
+                delay = max(0.0, self._last_update + self._update_interval - monotonic()) # Wait until the interval since the last update is elapsed
+                self._update_timer = Timer(delay, self._flush_update)
+                self._update_timer.daemon = True
+                self._update_timer.start()
+                return
+            
+        self._flush_update()
+        return
+
+    def _flush_update(self) -> None:
+        """Private function. Perform the pending menu update."""
+        with self._update_lock:
+            self._update_pending = False
+            self._update_timer = None
+            self._last_update = monotonic()
+            self._performed_updates += 1
+        
+        metrics = self.metrics
+        profiler = self.profiler
+        if metrics is None and profiler is None:
+            self.tray.update_menu()
+        else:
+            start = perf_counter()
+            self.tray.update_menu()
+            end = perf_counter()
+            if metrics is not None:
+                metrics._record("menu_update", duration=end - start)
+            if profiler is not None:
+                profiler._span("update_menu", "backend", start, end)
         return
 
     def set_app_name(self, name: str) -> None:
@@ -897,21 +3870,21 @@ class TrayManager:
         self.tray.title = name
         return
 
-    def load_icon(self, icon: Image.Image | bytes | str, name: str) -> None:
-        """Load an icon from PIL Image object, bytes or path and add it to the icons dict with key 'name'\n
+    def load_icon(self, icon: Image.Image | bytes | str | BinaryIO, name: str) -> None:
+        """Load an icon from PIL Image object, bytes, path or file and add it to the icons dict with key 'name', the icon is only decoded the first time it is used. Raise an OSError if the path can't be read or if the image format isn't recognized (See IconStore.load for the errors raised when the icon is used).\n
         Parameters
         ----------
-        * icon: Image.Image | bytes | str\n
+        * icon: Image.Image | bytes | str | BinaryIO\n
             The image to load in the icons dict
         * name: str\n
             The name (key) of the icon in the icons dict"""
         
-        if isinstance(icon, Image.Image):
-            self._icons[name] = icon
-        else:
-            i = Image.open(icon)
-            self._icons[name] = i
+        self._icons.load(name, icon)
         return
+    
+    def get_icon_stats(self) -> dict[str, int]:
+        """Return the number of icons loaded and decoded, the memory used by the decoded icons (in bytes), and the number of hits, misses and evictions of the icons cache."""
+        return self._icons.get_stats()
 
     def set_icon(self, name: Union[str, Values.DEFAULT], show: bool = True) -> None:
         """Set the icon of the app in the system tray from an icon loaded in the icons dict.\n
@@ -923,14 +3896,217 @@ class TrayManager:
                 Define if the icon should be displayed in the system tray if it was previously hidden."""
 
         # Set the icon of the app in the system tray
-        if name is Values.DEFAULT:
-            self.tray.icon = self._default_icon
-        else:
-            self.tray.icon = self._icons.get(name, self._default_icon)
+        self.__set_image(self.__get_image(name), show)
+        return
+    
+    def render_badge(self, name: Union[str, Values.DEFAULT], value: int | str | None = None, color: tuple[int, int, int, int] = (231, 76, 60, 255), corner: Corners = Corners.TOP_RIGHT, text_color: tuple[int, int, int, int] = (255, 255, 255, 255)) -> Image.Image:
+        """Return a loaded icon with a badge drawn in one of its corners. The icons with a badge are cached, so rendering the same badge again returns the same image.\n
+        Parameters
+        ----------
+        * name: str | tray_manager.Values.DEFAULT\n
+            The name (key) of the icon in the icons dict, if the name is tray_manager.Values.DEFAULT, use the default icon.
+        * value: int | str | None (Facultative)\n
+            The number or the text displayed in the badge (The numbers greater than 99 are displayed as 99+), if None, the badge is a colored dot (e.g. to show a health status).
+        * color: tuple[int, int, int, int] (Facultative)\n
+            The RGBA color of the badge.
+        * corner: tray_manager.Corners (Facultative)\n
+            The corner of the icon where the badge is drawn.
+        * text_color: tuple[int, int, int, int] (Facultative)\n
+            The RGBA color of the text of the badge."""
+        
+        return self._badges.render(self.__get_image(name), value, color, corner, text_color)
+    
+    def set_badge(self, name: Union[str, Values.DEFAULT], value: int | str | None = None, color: tuple[int, int, int, int] = (231, 76, 60, 255), corner: Corners = Corners.TOP_RIGHT, text_color: tuple[int, int, int, int] = (255, 255, 255, 255), show: bool = True) -> None:
+        """Set the icon of the app to a loaded icon with a badge drawn in one of its corners (See render_badge()).\n
+        Parameters
+        ----------
+        * name: str | tray_manager.Values.DEFAULT\n
+            The name (key) of the icon in the icons dict, if the name is tray_manager.Values.DEFAULT, use the default icon.
+        * value: int | str | None (Facultative)\n
+            The number or the text displayed in the badge, if None, the badge is a colored dot.
+        * color: tuple[int, int, int, int] (Facultative)\n
+            The RGBA color of the badge.
+        * corner: tray_manager.Corners (Facultative)\n
+            The corner of the icon where the badge is drawn.
+        * text_color: tuple[int, int, int, int] (Facultative)\n
+            The RGBA color of the text of the badge.
+        * show: bool (Facultative)\n
+            Define if the icon should be displayed in the system tray if it was previously hidden."""
+        
+        self.__set_image(self.render_badge(name, value, color, corner, text_color), show)
+        return
+    
+    def get_badge_stats(self) -> dict[str, int]:
+        """Return the number of cached glyphs, badges and icons with a badge, and the number of hits, misses and evictions of the icons with a badge."""
+        return self._badges.get_stats()
+    
+    def __get_image(self, name: Union[str, Values.DEFAULT]) -> Image.Image:
+        """Return the loaded icon, the default icon if the name is tray_manager.Values.DEFAULT or if there is no icon with that name."""
+        icon = self._icons.get(name) if name is not Values.DEFAULT else None
+        return icon if icon is not None else self._default_icon
+    
+    def __set_image(self, icon: Image.Image, show: bool) -> None:
+        """Stop the animation playing and set the icon of the app in the system tray."""
+        metrics = self.metrics
+        profiler = self.profiler
+        if metrics is not None or profiler is not None:
+            start = perf_counter()
+
+        with self._icon_lock: # Wait for the frame being shown so that it doesn't replace the icon
+            self.stop_animation()
+            if icon is not self.tray.icon: # Setting the same icon again would make the backend redraw it
+                self.tray.icon = icon
+
+        if metrics is not None:
+            metrics._record("icon", duration=perf_counter() - start)
+        if profiler is not None:
+            profiler._span("set_icon", "icon", start, perf_counter())
 
         if show: # Show the icon in the system tray
             self.show()
         return
+    
+    def load_animation(self, frames: list[Image.Image | bytes | str | BinaryIO], name: str) -> None:
+        """Load the frames of an animation, the frames are loaded in the icons dict and are only decoded the first time they're shown.\n
+        Parameters
+        ----------
+        * frames: list[Image.Image | bytes | str | BinaryIO]\n
+            The images, encoded images, paths or files of the frames.
+        * name: str\n
+            The name (key) of the animation."""
+        
+        if len(frames) == 0:
+            raise ValueError("An animation needs at least one frame.")
+        
+        names = [f"{name}:{i}" for i in range(len(frames))]
+        for frame, frame_name in zip(frames, names):
+            self._icons.load(frame_name, frame)
+        self._animations[name] = names
+
+        payloads = getattr(self.tray, "_icon_payloads", None)
+        if payloads is not None: # Keep the backend representation of every frame (and of the icon shown before), so looping never encodes the frames again
+            payloads.set_max_entries(max(_MIN_ICON_PAYLOADS, max(len(frames) for frames in self._animations.values()) + 1))
+        return
+    
+    def load_progress_icon(self, name: str, steps: int = 21, color: tuple[int, int, int, int] = (52, 152, 219, 255), background: tuple[int, int, int, int] = (127, 127, 127, 96)) -> None:
+        """Render and load the frames of a progress ring going from 0 % to 100 %, use set_progress() to show the progress or play_animation() to play it.\n
+        Parameters
+        ----------
+        * name: str\n
+            The name (key) of the progress icon.
+        * steps: int (Facultative)\n
+            The number of frames rendered (21 frames show the progress every 5 %).
+        * color: tuple[int, int, int, int] (Facultative)\n
+            The RGBA color of the progress.
+        * background: tuple[int, int, int, int] (Facultative)\n
+            The RGBA color of the remaining part of the ring."""
+        
+        from PIL import Image, ImageDraw
+        if steps < 2:
+            raise ValueError("A progress icon needs at least two steps.")
+        
+        size = self._icons._icon_size or _DEFAULT_TRAY_ICON_SIZE
+        width = max(1, min(size) // 6)
+        box = (width // 2, width // 2, size[0] - 1 - width // 2, size[1] - 1 - width // 2)
+
+        frames = []
+        for step in range(steps):
+            frame = Image.new("RGBA", size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(frame)
+            draw.ellipse(box, outline=background, width=width)
+            if step > 0:
+                draw.arc(box, -90, -90 + 360 * step / (steps - 1), fill=color, width=width)
+            frames.append(frame)
+
+        self.load_animation(frames, name)
+        return
+    
+    def set_progress(self, name: str, percent: float, show: bool = True) -> None:
+        """Set the icon to the frame of a progress icon (or an animation) matching the progress, stop the animation playing.\n
+        Parameters
+        ----------
+        * name: str\n
+            The name of the progress icon loaded with load_progress_icon() or load_animation().
+        * percent: float\n
+            The progress, between 0 and 100.
+        * show: bool (Facultative)\n
+            Define if the icon should be displayed in the system tray if it was previously hidden."""
+        
+        self.__set_image(self.__get_image(self._progress_frame(name, percent)), show) # Not through set_icon(), which is a coroutine function on AsyncTrayManager
+        return
+    
+    def _progress_frame(self, name: str, percent: float) -> str:
+        """Private function. Return the name of the frame of a progress icon (or an animation) matching the progress."""
+        frames = self._animations[name]
+        percent = min(100, max(0, percent))
+        return frames[round(percent / 100 * (len(frames) - 1))]
+    
+    def play_animation(self, name: str, fps: float = 10, loop: bool = True) -> None:
+        """Play an animation, the frames are shown by a single scheduler thread. If the backend is too slow to show every frame, the frames that are late are skipped.\n
+        Use stop_animation() or set_icon() to stop the animation.\n
+        Parameters
+        ----------
+        * name: str\n
+            The name of the animation loaded with load_animation() or load_progress_icon().
+        * fps: float (Facultative)\n
+            The number of frames shown per second.
+        * loop: bool (Facultative)\n
+            Define if the animation restarts once its last frame is shown, if False, the icon stays on the last frame."""
+        
+        if fps <= 0:
+            raise ValueError("The fps must be greater than 0.")
+        
+        frames = self._animations[name]
+        with self._animation_condition:
+            self._animation = (frames, fps, loop)
+            self._animation_start = monotonic()
+            self._animation_generation += 1
+
+            if self._animation_thread is None: # Start the scheduler thread the first time an animation is played
+                self._animation_thread = Thread(target=self.__animate, daemon=True)
+                self._animation_thread.start()
+            self._animation_condition.notify()
+        return
+    
+    def set_animation_fps(self, fps: float) -> None:
+        """Change the rate of the animation playing, the animation continues from the frame currently shown.\n
+        Parameter
+        ---------
+        * fps: float\n
+            The number of frames shown per second."""
+        
+        if fps <= 0:
+            raise ValueError("The fps must be greater than 0.")
+        
+        with self._animation_condition:
+            if self._animation is None:
+                return
+            
+            frames, old_fps, loop = self._animation
+            now = monotonic()
+            position = (now - self._animation_start) * old_fps
+            self._animation = (frames, fps, loop)
+            self._animation_start = now - position / fps
+            self._animation_generation += 1
+            self._animation_condition.notify()
+        return
+    
+    def stop_animation(self) -> None:
+        """Stop the animation playing, the icon stays on the frame currently shown."""
+        with self._animation_condition:
+            if self._animation is not None:
+                self._animation = None
+                self._animation_generation += 1
+                self._animation_condition.notify()
+        return
+    
+    def get_animation_stats(self) -> dict[str, int | bool]:
+        """Return if an animation is playing, the number of frames shown, the number of frames skipped because the backend was too slow and the number of frames that couldn't be decoded or shown (Their exception is printed once per animation played)."""
+        with self._animation_condition:
+            return {"playing": self._animation is not None,
+                    "shown": self._shown_frames,
+                    "dropped": self._dropped_frames,
+                    "failed": self._failed_frames}
 
     def show(self) -> None:
         """Show the icon in the system tray."""
@@ -947,10 +4123,99 @@ class TrayManager:
     def kill(self) -> list[Label | Button | CheckBox | Separator | Submenu]:
         """Kill the pystray_Icon, return the items of the menu as list."""
         
+        with self._update_lock:
+            if self._update_timer is not None: # Cancel the pending delayed update
+                self._update_timer.cancel()
+                self._update_timer = None
+                self._update_pending = False
+
+        with self._animation_condition:
+            self._animation = None
+            self._animation_thread = None # Stop the scheduler thread
+            self._animation_condition.notify()
+
+        for stream in self._streams: # Stop the iterations of the event streams
+            stream.close()
+        self.notification.close() # Stop the notifications thread
+        self.scheduler.shutdown() # Stop the scheduler thread
+
         items = self.menu.get_items() # Get the items of the menu
+        self._killed = True # Set before stopping so that a loop starting meanwhile stops itself
         self.tray.stop() # Stop the pystray_Icon loop
+        self.dispatcher.shutdown() # Stop the pools running the callbacks
+        if isinstance(self.tray, _CachedIcon):
+            self.tray._icon_payloads.clear() # Release the cached icon files and handles
+
+        if self.profiler is not None and self._profile_path is not None:
+            self.profiler.write(self._profile_path) # Write the trace recorded
         return items # Return the items
 
+    def __animate(self) -> None:
+        """Show the frames of the animations, run in the scheduler thread."""
+        thread = self._animation_thread
+        shown = (-1, -1) # The generation and the position of the last frame shown
+        failed: set[str] = set() # The frames of the animation playing whose exception was already printed
+
+        with self._animation_condition:
+            try:
+                while self._animation_thread is thread:
+                    if self._animation is None:
+                        self._animation_condition.wait()
+                        continue
+
+                    frames, fps, loop = self._animation
+                    generation = self._animation_generation
+                    position = int((monotonic() - self._animation_start) * fps)
+                    if not loop and position >= len(frames) - 1: # Stay on the last frame
+                        position = len(frames) - 1
+                        self._animation = None
+
+                    if generation != shown[0]:
+                        failed.clear()
+
+                    if position != shown[1] or generation != shown[0]:
+                        if generation == shown[0] and position > shown[1] + 1: # The backend was too slow, skip the late frames
+                            self._dropped_frames += position - shown[1] - 1
+
+                        frame = frames[position % len(frames)]
+                        error = None
+                        self._animation_condition.release() # Decoding the frame and the backend call don't block the other functions
+                        try:
+                            frame_shown = self.__show_frame(frame, generation)
+                        except Exception as e: # A frame that can't be decoded (e.g. its file was removed) or shown is skipped, the animation goes on
+                            frame_shown = False
+                            error = e
+                        finally:
+                            self._animation_condition.acquire()
+                        
+                        if frame_shown:
+                            self._shown_frames += 1
+                        elif error is not None:
+                            self._failed_frames += 1
+                            if frame not in failed:
+                                failed.add(frame)
+                                print_exception(error)
+                        shown = (generation, position)
+
+                    if self._animation is not None and self._animation_generation == generation:
+                        self._animation_condition.wait(max(0, self._animation_start + (position + 1) / fps - monotonic())) # Wait for the next frame
+            finally:
+                if self._animation_thread is thread: # The thread stopped unexpectedly, the next play_animation() starts a new one
+                    self._animation_thread = None
+        return
+
+    def __show_frame(self, name: str, generation: int) -> bool:
+        """Decode a frame of an animation and give it to the backend, return False if the animation was stopped or changed meanwhile (Called without holding the animation condition)."""
+        icon = self._icons.get(name)
+        with self._icon_lock:
+            with self._animation_condition:
+                if self._animation_generation != generation: # set_icon(), stop_animation() or play_animation() was called while the frame was decoded
+                    return False
+            
+            if icon is not None and icon is not self.tray.icon:
+                self.tray.icon = icon
+        return True
+
     def __run(self, default_show: bool, setup: FunctionType | MethodType | LambdaType | None, setup_args: tuple | None) -> None:
         """Run the pystray_Icon object."""
 
@@ -959,11 +4224,26 @@ class TrayManager:
         return
 
     def __run_callback(self, default_show: bool, setup: FunctionType | MethodType | LambdaType | None, setup_args: tuple | None):
-        """Manage the callback of the __run function."""
+        """Manage the callback of the __run function (Called by pystray in its setup thread once the loop of the backend is ready)."""
+        if self._killed: # Killed before the loop was started (e.g. an AsyncTrayManager doesn't wait for it), stop it now
+            self.tray.stop()
+            return
+        
         if default_show:
             self.show()
         else:
             self.hide()
+
+        latency: dict[str, float] = {}
+        if self.tray.visible: # pystray only reports the icon as visible once the backend has shown it
+            latency["visible"] = perf_counter() - self._created_at
+
+        latency["setup"] = perf_counter() - self._created_at # Taken last, right before the setup function is called
+        self._startup_latency = latency
+        self._ready_event.set()
+        if not self.ready.done():
+            self.ready.set_result(latency)
+
         if isinstance(setup, FunctionType | MethodType | LambdaType):
             if isinstance(setup_args, tuple):
                 setup(*setup_args)
@@ -973,5 +4253,131 @@ class TrayManager:
 
 
 
+class AsyncTrayManager(TrayManager):
+    def __init__(self, app_name: str, loop: asyncio.AbstractEventLoop | None = None, **kwargs) -> None:
+        """Create a TrayManager whose pystray loop runs in its own thread and that is attached to an asyncio event loop.\n
+        The coroutine functions (async def) used as callbacks are run on the event loop, and the changes made from the event loop during the same iteration are coalesced into a single menu update.\n
+        Parameters
+        ----------
+        * app_name: str\n
+            The name of the app in the system tray.
+        * loop: asyncio.AbstractEventLoop | None (Facultative)\n
+            The event loop to attach, if None, use the running event loop.
+        * kwargs\n
+            The other arguments of the TrayManager (run_in_separate_thread is always True and ready_timeout is always 0, so that creating it doesn't block the event loop, use create() to wait until it is ready)."""
+        
+        if loop is None:
+            from asyncio import get_running_loop
+            loop = get_running_loop()
+
+        self._pending_icon: Optional[tuple[Union[str, Values], bool]] = None # The icon to set on the next iteration of the event loop
+        self._icon_future: Optional[asyncio.Future] = None
+
+        kwargs["run_in_separate_thread"] = True # pystray's loop mustn't block the event loop
+        kwargs["ready_timeout"] = 0 # Waiting for the icon would block the event loop, create() waits for it on the loop
+        super().__init__(app_name, **kwargs)
+        self.attach_loop(loop)
+        return
+    
+    @classmethod
+    async def create(cls, app_name: str, loop: asyncio.AbstractEventLoop | None = None, ready_timeout: float | None = 10, **kwargs) -> 'AsyncTrayManager':
+        """Create an AsyncTrayManager and wait until it is ready without blocking the event loop (Like TrayManager does when default_show is True).\n
+        Parameters
+        ----------
+        * app_name: str\n
+            The name of the app in the system tray.
+        * loop: asyncio.AbstractEventLoop | None (Facultative)\n
+            The event loop to attach, if None, use the running event loop.
+        * ready_timeout: float | None (Facultative)\n
+            The maximum delay in seconds to wait for the icon to be displayed when default_show is True, if None, wait until it is displayed. Use wait_ready() or the ready future to know if the icon is ready.
+        * kwargs\n
+            The other arguments of the TrayManager."""
+        
+        from asyncio import wrap_future, wait_for, shield, TimeoutError as AsyncTimeoutError
+        tray = cls(app_name, loop, **kwargs)
+        if kwargs.get("default_show", True):
+            try:
+                await wait_for(shield(wrap_future(tray.ready)), ready_timeout) # The ready future is kept if the timeout expires
+            except AsyncTimeoutError:
+                pass
+        return tray
+    
+    async def add(self, item: Label | Button | CheckBox | Separator | Submenu, index: int = -1, container: Menu | Submenu | None = None) -> None:
+        """Add an item to the menu (or to a submenu), the menu is updated once for all the changes made during the same iteration of the event loop.\n
+        Parameters
+        ----------
+        * item: Label | Button | CheckBox | Separator | Submenu\n
+            The item to add.
+        * index: int (Facultative)\n
+            The index at which the item is going to be appened.
+        * container: Menu | Submenu | None (Facultative)\n
+            The menu/submenu to add the item to, if None, add it to the menu."""
+        
+        if container is None:
+            container = self.menu
+        container.add(item, index)
+        await self.__wait_update()
+        return
+    
+    async def edit(self, item: Label | Button | CheckBox | Submenu, **kwargs) -> None:
+        """Edit an item (The arguments are the ones of the edit function of the item), the menu is updated once for all the changes made during the same iteration of the event loop."""
+        item.edit(**kwargs)
+        await self.__wait_update()
+        return
+    
+    async def set_icon(self, name: Union[str, Values.DEFAULT], show: bool = True) -> None:
+        """Set the icon of the app in the system tray from an icon loaded in the icons dict, only the last icon set during the same iteration of the event loop is applied.\n
+            Parameters
+            ----------
+            * name: str | tray_manager.Values.DEFAULT\n
+                The name of the icon to use (key) of the icon in the icons dict, if the name is tray_manager.Values.DEFAULT, set it to the default icon.
+            * show: bool (Facultative)\n
+                Define if the icon should be displayed in the system tray if it was previously hidden."""
+        
+        self._pending_icon = (name, show)
+        if self._icon_future is None:
+            self._icon_future = self._loop.create_future()
+            self._loop.call_soon(self.__apply_icon)
+        await self._icon_future
+        return
+
+    async def set_progress(self, name: str, percent: float, show: bool = True) -> None:
+        """Set the icon to the frame of a progress icon (or an animation) matching the progress, stop the animation playing. Only the last icon set during the same iteration of the event loop is applied.\n
+        Parameters
+        ----------
+        * name: str\n
+            The name of the progress icon loaded with load_progress_icon() or load_animation().
+        * percent: float\n
+            The progress, between 0 and 100.
+        * show: bool (Facultative)\n
+            Define if the icon should be displayed in the system tray if it was previously hidden."""
+        
+        await self.set_icon(self._progress_frame(name, percent), show)
+        return
+
+    async def __wait_update(self) -> None:
+        """Wait until the menu update of the current iteration of the event loop is performed."""
+        tick_batch = self._open_tick_batch()
+        if tick_batch is None:
+            from asyncio import sleep as async_sleep
+            await async_sleep(0)
+        else:
+            await tick_batch
+        return
+    
+    def __apply_icon(self) -> None:
+        """Set the last icon requested during the iteration of the event loop."""
+        (name, show), self._pending_icon = self._pending_icon, None
+        icon_future, self._icon_future = self._icon_future, None
+        try:
+            TrayManager.set_icon(self, name, show)
+        except Exception as e:
+            icon_future.set_exception(e)
+        else:
+            icon_future.set_result(None)
+        return
+
+
+
 # OS support interface
-OsSupport = __OsSupport()
+OsSupport = _OsSupport()